@@ -0,0 +1,220 @@
+"""
+Per-Server Circuit Breaker
+
+This module stops the agent from queueing calls behind a server that is
+failing or timing out. Once the rolling error or timeout rate crosses its
+threshold the circuit opens and calls fail immediately; after a cool-down a
+few probe calls are let through, and the circuit closes again only if they
+succeed.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, Optional, Any, Tuple
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds for opening and closing a circuit"""
+    window: float = 30.0
+    min_calls: int = 10
+    failure_rate: float = 0.5
+    timeout_rate: float = 0.3
+    open_duration: float = 15.0
+    half_open_probes: int = 3
+
+
+# Call outcomes kept in the rolling window
+_SUCCESS, _FAILURE, _TIMEOUT = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class CircuitTicket:
+    """Permission for one call, tied to the circuit state that granted it"""
+    epoch: int
+    probe: bool
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker for one server
+
+    Outcomes from the last ``window`` seconds are kept. With at least
+    ``min_calls`` of them, the circuit opens when failures (timeouts
+    included) reach ``failure_rate`` or timeouts alone reach
+    ``timeout_rate``. After ``open_duration`` seconds it turns half-open
+    and admits up to ``half_open_probes`` calls at a time: that many
+    successes close it, any failure opens it again. Only the calls admitted
+    as probes decide: an outcome reported with a ticket from before the
+    last state change is ignored.
+    """
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, int]] = deque()
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._epoch = 0
+        self._stats = {'rejected': 0, 'times_opened': 0}
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its cool-down ends"""
+        if (self._state is CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.config.open_duration):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def is_available(self) -> bool:
+        """Whether a call made now could be admitted"""
+        state = self.state
+        return state is CircuitState.CLOSED or (
+            state is CircuitState.HALF_OPEN and self._probes_in_flight < self.config.half_open_probes
+        )
+
+    def allow(self) -> Optional[CircuitTicket]:
+        """
+        Ask to make one call
+
+        Every allowed call must be followed by record_success,
+        record_failure or release, passing the ticket returned here.
+
+        Returns:
+            A ticket if the call may proceed, None if it must fail fast
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return CircuitTicket(self._epoch, False)
+        if state is CircuitState.HALF_OPEN and self._probes_in_flight < self.config.half_open_probes:
+            self._probes_in_flight += 1
+            return CircuitTicket(self._epoch, True)
+        self._stats['rejected'] += 1
+        return None
+
+    def _is_stale(self, ticket: Optional[CircuitTicket]) -> bool:
+        """Whether a ticket was granted before the last state change"""
+        return ticket is not None and ticket.epoch != self._epoch
+
+    def record_success(self, ticket: Optional[CircuitTicket] = None):
+        """
+        Record a call that completed normally
+
+        Args:
+            ticket: Ticket returned by allow for the call
+        """
+        if self._is_stale(ticket):
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.half_open_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+        self._record(_SUCCESS)
+
+    def release(self, ticket: Optional[CircuitTicket] = None):
+        """Give back an allowed call that ended without an outcome (cancelled, not admitted)"""
+        if self._is_stale(ticket):
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record_failure(self, timeout: bool = False, ticket: Optional[CircuitTicket] = None):
+        """
+        Record a failed call
+
+        Args:
+            timeout: The call failed by timing out
+            ticket: Ticket returned by allow for the call
+        """
+        if self._is_stale(ticket):
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._transition(CircuitState.OPEN)
+            return
+        self._record(_TIMEOUT if timeout else _FAILURE)
+
+        if self._state is CircuitState.CLOSED:
+            calls, failures, timeouts = self._counts()
+            if calls >= self.config.min_calls and (
+                    failures / calls >= self.config.failure_rate
+                    or timeouts / calls >= self.config.timeout_rate):
+                self._transition(CircuitState.OPEN)
+
+    def _record(self, outcome: int):
+        now = time.monotonic()
+        self._outcomes.append((now, outcome))
+        self._prune(now)
+
+    def _prune(self, now: float):
+        horizon = now - self.config.window
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            self._outcomes.popleft()
+
+    def _counts(self) -> Tuple[int, int, int]:
+        """Calls, failures (including timeouts) and timeouts in the window"""
+        self._prune(time.monotonic())
+        timeouts = sum(1 for _, outcome in self._outcomes if outcome == _TIMEOUT)
+        failures = timeouts + sum(1 for _, outcome in self._outcomes if outcome == _FAILURE)
+        return len(self._outcomes), failures, timeouts
+
+    def _transition(self, state: CircuitState):
+        previous, self._state = self._state, state
+        self._epoch += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self._stats['times_opened'] += 1
+            self.logger.warning(f"⚡ Circuit for {self.name} opened (was {previous.value})")
+        elif state is CircuitState.CLOSED:
+            self._outcomes.clear()
+            self._opened_at = None
+            self.logger.info(f"✅ Circuit for {self.name} closed")
+        else:
+            self.logger.info(f"Circuit for {self.name} half-open, probing")
+
+    def reset(self):
+        """Force the circuit closed and forget recorded outcomes"""
+        self._transition(CircuitState.CLOSED)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get the circuit state for routing decisions and monitoring
+
+        Returns:
+            Dictionary with state, rolling rates and time until the next probe
+        """
+        state = self.state
+        calls, failures, timeouts = self._counts()
+        retry_in = None
+        if state is CircuitState.OPEN:
+            retry_in = max(0.0, self.config.open_duration - (time.monotonic() - self._opened_at))
+        return {
+            'server': self.name,
+            'state': state.value,
+            'available': self.is_available,
+            'calls_in_window': calls,
+            'failure_rate': failures / calls if calls else 0.0,
+            'timeout_rate': timeouts / calls if calls else 0.0,
+            'retry_in': retry_in,
+            **self._stats
+        }
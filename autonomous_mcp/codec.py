@@ -0,0 +1,127 @@
+"""
+JSON Codecs for MCP Messages
+
+This module provides the JSON encoders/decoders used on the MCP wire. All
+codecs work directly on bytes, so newline-framed messages go from the pipe
+to Python objects without an intermediate str. orjson or msgspec are used
+when installed; the standard library json module is always available.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONCodec:
+    """Base class for byte-oriented JSON codecs"""
+
+    name = "base"
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialise an object to UTF-8 JSON bytes"""
+        raise NotImplementedError
+
+    def encode_line(self, obj: Any) -> bytes:
+        """Serialise an object as one newline-terminated frame"""
+        return self.encode(obj) + b"\n"
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Parse UTF-8 JSON bytes
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec built on the standard library json module"""
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec built on orjson"""
+
+    name = "orjson"
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def encode_line(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec built on msgspec.json"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+def available_codecs() -> Dict[str, JSONCodec]:
+    """
+    Get every codec usable in this environment
+
+    Returns:
+        Mapping of codec name to codec instance, fastest first
+    """
+    codecs: Dict[str, JSONCodec] = {}
+    if orjson is not None:
+        codecs[OrjsonCodec.name] = OrjsonCodec()
+    if msgspec is not None:
+        codecs[MsgspecCodec.name] = MsgspecCodec()
+    codecs[StdlibJSONCodec.name] = StdlibJSONCodec()
+    return codecs
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Get a codec by name, or the fastest installed one
+
+    Args:
+        name: 'orjson', 'msgspec' or 'json' (None or 'auto' picks the fastest)
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the named codec is unknown or not installed
+    """
+    codecs = available_codecs()
+    if name is None or name == "auto":
+        return next(iter(codecs.values()))
+    if name not in codecs:
+        raise ValueError(f"JSON codec not available: {name}")
+    return codecs[name]
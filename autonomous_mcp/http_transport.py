@@ -0,0 +1,203 @@
+"""
+Streamable HTTP Transport for MCP
+
+This module carries JSON-RPC messages to HTTP-hosted MCP servers using the
+Streamable HTTP transport: every message is POSTed to one endpoint and the
+server answers with a JSON body or an SSE stream of messages, and the
+session established by initialize is carried in the ``Mcp-Session-Id``
+header. Requests share one pooled httpx.AsyncClient, so keep-alive (or
+HTTP/2 multiplexing) keeps each call to a single round trip once the
+connection is up.
+"""
+
+import logging
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+from httpx_sse import EventSource
+
+
+# Connection pool defaults for the shared AsyncClient
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+# Connect timeout; reads are bounded by the client's per-request timeout
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+SESSION_HEADER = "Mcp-Session-Id"
+PROTOCOL_VERSION_HEADER = "MCP-Protocol-Version"
+
+
+class MCPSessionExpired(ConnectionError):
+    """The server no longer knows the session; the client must initialize again"""
+
+
+class HTTPRequestFailed(Exception):
+    """The server answered a POST with an HTTP error status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+def make_http_client(http2: bool = False,
+                     max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                     max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+                     keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY) -> httpx.AsyncClient:
+    """
+    Create a pooled AsyncClient suitable for sharing between MCP clients
+
+    Args:
+        http2: Negotiate HTTP/2 (needs the h2 package)
+        max_connections: Most open connections across all hosts
+        max_keepalive: Most idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept
+
+    Returns:
+        AsyncClient without a read timeout
+    """
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(max_connections=max_connections,
+                            max_keepalive_connections=max_keepalive,
+                            keepalive_expiry=keepalive_expiry),
+        timeout=httpx.Timeout(None, connect=DEFAULT_CONNECT_TIMEOUT)
+    )
+
+
+class HTTPTransport:
+    """
+    One MCP session over Streamable HTTP
+
+    post() sends one message (or batch) and yields the frames the server
+    answers with: each SSE event's data, or the JSON body. listen() opens
+    the optional GET stream on which the server sends notifications.
+    Frames are newline-terminated bytes, like stdio frames.
+
+    Pass ``http_client`` to share one connection pool between several
+    transports; otherwise the transport owns a pool of its own.
+    """
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 http_client: Optional[httpx.AsyncClient] = None,
+                 http2: bool = False,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the transport
+
+        Args:
+            url: MCP endpoint URL
+            headers: Extra headers for every request (e.g. Authorization)
+            http_client: Shared AsyncClient (owned and closed by the caller)
+            http2: Negotiate HTTP/2 when creating an own client
+            logger: Logger to use
+        """
+        self.url = url
+        self.headers = dict(headers or {})
+        self.logger = logger or logging.getLogger(__name__)
+        self._owns_client = http_client is None
+        self.client = http_client or make_http_client(http2=http2)
+        self.session_id: Optional[str] = None
+        self.protocol_version: Optional[str] = None
+
+    def _request_headers(self, accept: str) -> Dict[str, str]:
+        headers = {**self.headers, "Accept": accept}
+        if self.session_id:
+            headers[SESSION_HEADER] = self.session_id
+        if self.protocol_version:
+            headers[PROTOCOL_VERSION_HEADER] = self.protocol_version
+        return headers
+
+    async def post(self, data: bytes, incremental: bool = False) -> AsyncIterator[bytes]:
+        """
+        Send one encoded message and yield the server's answer
+
+        Args:
+            data: Encoded JSON-RPC message or batch
+            incremental: Yield a JSON body in chunks as it arrives (for the
+                streaming parser) instead of as one frame
+
+        Yields:
+            Newline-terminated frames, or chunks of them when incremental
+
+        Raises:
+            MCPSessionExpired: If the server dropped the session
+            HTTPRequestFailed: If the server answered with an error status
+            ConnectionError: If the server could not be reached
+        """
+        headers = self._request_headers("application/json, text/event-stream")
+        headers["Content-Type"] = "application/json"
+        try:
+            async with self.client.stream("POST", self.url, content=data, headers=headers) as response:
+                session_id = response.headers.get(SESSION_HEADER)
+                if session_id:
+                    self.session_id = session_id
+
+                if response.status_code == 404 and self.session_id:
+                    raise MCPSessionExpired(f"Session {self.session_id} expired")
+                if response.status_code >= 400:
+                    body = await response.aread()
+                    raise HTTPRequestFailed(response.status_code, body.decode("utf-8", "replace")[:200])
+                if response.status_code == 202:
+                    return
+
+                content_type = response.headers.get("content-type", "")
+                if content_type.startswith("text/event-stream"):
+                    async for frame in self._events(response):
+                        yield frame
+                elif incremental:
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+                    yield b"\n"
+                else:
+                    yield await response.aread() + b"\n"
+        except httpx.TransportError as e:
+            raise ConnectionError(f"{type(e).__name__}: {e}") from e
+
+    async def listen(self) -> AsyncIterator[bytes]:
+        """
+        Yield messages the server sends outside any request
+
+        Returns without yielding if the server does not offer the stream.
+
+        Raises:
+            MCPSessionExpired: If the server dropped the session
+            ConnectionError: If the server could not be reached
+        """
+        headers = self._request_headers("text/event-stream")
+        try:
+            async with self.client.stream("GET", self.url, headers=headers) as response:
+                if response.status_code == 404 and self.session_id:
+                    raise MCPSessionExpired(f"Session {self.session_id} expired")
+                if response.status_code != 200:
+                    self.logger.debug(f"No server message stream at {self.url} (HTTP {response.status_code})")
+                    return
+                async for frame in self._events(response):
+                    yield frame
+        except httpx.TransportError as e:
+            raise ConnectionError(f"{type(e).__name__}: {e}") from e
+
+    @staticmethod
+    async def _events(response: httpx.Response) -> AsyncIterator[bytes]:
+        """JSON-RPC messages from an SSE response, one frame per event"""
+        async for event in EventSource(response).aiter_sse():
+            if event.event == "message" and event.data:
+                yield event.data.encode("utf-8") + b"\n"
+
+    async def terminate(self):
+        """End the session on the server (best effort)"""
+        if not self.session_id:
+            return
+        try:
+            await self.client.delete(self.url, headers=self._request_headers("application/json"),
+                                     timeout=DEFAULT_CONNECT_TIMEOUT)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Failed to end HTTP session: {e}")
+        self.session_id = None
+
+    async def aclose(self):
+        """End the session and close the connection pool if the transport owns it"""
+        await self.terminate()
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,137 @@
+"""
+Latency Tracking and Adaptive Timeouts
+
+This module keeps rolling latency samples per (server, method, tool) and
+derives request timeouts from them, so fast tools fail fast while known
+slow tools get the time they actually need.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Any, Tuple
+
+
+@dataclass
+class TimeoutPolicy:
+    """How observed latencies are turned into a timeout"""
+    percentile: float = 0.99
+    factor: float = 3.0
+    floor: float = 1.0
+    ceiling: float = 120.0
+    min_samples: int = 20
+    window: int = 256
+
+
+LatencyKey = Tuple[str, str, Optional[str]]
+
+
+class _LatencySeries:
+    """Bounded sample window for one key with a cached sorted view"""
+
+    __slots__ = ("samples", "count", "timeouts", "_sorted")
+
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.timeouts = 0
+        self._sorted: Optional[List[float]] = None
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+        self._sorted = None
+
+    def quantile(self, q: float) -> float:
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        index = min(len(self._sorted) - 1, max(0, math.ceil(q * len(self._sorted)) - 1))
+        return self._sorted[index]
+
+
+class LatencyTracker:
+    """
+    Rolling latency distributions per (server, method, tool name)
+
+    A tracker can be shared by many clients; keys include the server name.
+    Until a key has ``min_samples`` observations it gives no timeout, and
+    each client falls back to its own default. A timed-out request is
+    recorded at its timeout so the estimate grows for tools that have
+    become slower.
+    """
+
+    def __init__(self, policy: Optional[TimeoutPolicy] = None):
+        self.policy = policy or TimeoutPolicy()
+        self._series: Dict[LatencyKey, _LatencySeries] = {}
+
+    def _get_series(self, key: LatencyKey) -> _LatencySeries:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _LatencySeries(self.policy.window)
+        return series
+
+    def record(self, server: str, method: str, tool: Optional[str], seconds: float):
+        """
+        Record one completed request
+
+        Args:
+            server: Server name
+            method: JSON-RPC method
+            tool: Tool name for tools/call, otherwise None
+            seconds: Observed end-to-end latency
+        """
+        self._get_series((server, method, tool)).add(seconds)
+
+    def record_timeout(self, server: str, method: str, tool: Optional[str], seconds: float):
+        """
+        Record a request that timed out after ``seconds``
+
+        Args:
+            server: Server name
+            method: JSON-RPC method
+            tool: Tool name for tools/call, otherwise None
+            seconds: Timeout that expired
+        """
+        series = self._get_series((server, method, tool))
+        series.timeouts += 1
+        series.add(seconds)
+
+    def timeout_for(self, server: str, method: str, tool: Optional[str] = None) -> Optional[float]:
+        """
+        Get the timeout to use for the next request
+
+        Args:
+            server: Server name
+            method: JSON-RPC method
+            tool: Tool name for tools/call, otherwise None
+
+        Returns:
+            Percentile latency times factor, clamped to [floor, ceiling],
+            or None while the key has fewer than min_samples observations
+        """
+        policy = self.policy
+        series = self._series.get((server, method, tool))
+        if series is None or len(series.samples) < policy.min_samples:
+            return None
+        estimate = series.quantile(policy.percentile) * policy.factor
+        return min(policy.ceiling, max(policy.floor, estimate))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get latency percentiles and current timeouts for every key
+
+        Returns:
+            Mapping of 'server/method[/tool]' to its statistics
+        """
+        stats = {}
+        for (server, method, tool), series in self._series.items():
+            label = f"{server}/{method}" + (f"/{tool}" if tool else "")
+            stats[label] = {
+                'samples': len(series.samples),
+                'total_requests': series.count,
+                'timeouts': series.timeouts,
+                'p50': series.quantile(0.5) if series.samples else None,
+                'percentile_latency': series.quantile(self.policy.percentile) if series.samples else None,
+                'timeout': self.timeout_for(server, method, tool)
+            }
+        return stats
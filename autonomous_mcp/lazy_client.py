@@ -0,0 +1,317 @@
+"""
+Lazy MCP Client Proxy
+
+This module defers starting an MCP server until one of its tools is
+actually called. The proxy answers list_tools from the persisted tool
+catalogue, spawns and initializes the real process on the first call_tool,
+and stops it again once it has been idle for a configurable time, so
+resident memory follows the servers a session really uses rather than the
+size of the configuration.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Any
+
+from .real_mcp_client import (
+    DEFAULT_HEALTH_INTERVAL, DEFAULT_HEALTH_JITTER, DEFAULT_HEALTH_TIMEOUT, DEFAULT_SHUTDOWN_TIMEOUT,
+    HealthStatus, RealMCPClient
+)
+from .tool_catalog_cache import ToolCatalogCache
+
+
+# Seconds a server may sit unused before its process is stopped
+DEFAULT_IDLE_TTL = 300.0
+
+# Wait after a failed start before the next attempt, doubling up to the cap
+DEFAULT_START_BACKOFF = 1.0
+MAX_START_BACKOFF = 60.0
+
+
+class LazyMCPClient:
+    """
+    Stand-in for a RealMCPClient whose server starts on demand
+
+    list_tools serves the catalogue cached for the command (any server
+    version) without starting anything; only with no cached catalogue is
+    the server started to fetch it. call_tool starts the server if it is
+    not running, and a background reaper stops it after ``idle_ttl``
+    seconds without calls. A later call starts it again. Options such as
+    the circuit breaker are shared by every process the proxy starts.
+
+    After a failed start the proxy reports itself disconnected and refuses
+    calls for ``start_backoff`` seconds, doubling with each further
+    failure, so routing skips a server that cannot come up instead of
+    respawning it on every call.
+    """
+
+    def __init__(self, server_name: str, command: List[str],
+                 env: Optional[Dict[str, str]] = None,
+                 idle_ttl: float = DEFAULT_IDLE_TTL,
+                 start_backoff: float = DEFAULT_START_BACKOFF,
+                 catalog_cache: Optional[ToolCatalogCache] = None,
+                 logger: Optional[logging.Logger] = None,
+                 **client_options: Any):
+        """
+        Initialize the proxy
+
+        Args:
+            server_name: Name of the server
+            command: Command and arguments to start the server
+            env: Environment variables for the server process
+            idle_ttl: Seconds without calls before the process is stopped
+            start_backoff: Seconds to wait after a failed start before trying again
+            catalog_cache: Persistent tool catalogue cache (a default one if omitted)
+            logger: Logger to use
+            **client_options: Extra keyword arguments for the RealMCPClient
+        """
+        self.server_name = server_name
+        self.command = list(command)
+        self.env = env
+        self.idle_ttl = idle_ttl
+        self.start_backoff = start_backoff
+        self.logger = logger or logging.getLogger(__name__)
+        self.catalog_cache = catalog_cache or ToolCatalogCache(logger=self.logger)
+        self.client_options = client_options
+        self.circuit_breaker = client_options.get("circuit_breaker")
+
+        self.client: Optional[RealMCPClient] = None
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._start_lock = asyncio.Lock()
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._health_options: Optional[tuple] = None
+        self._in_flight = 0
+        self._last_used = time.monotonic()
+        self._is_closed = False
+        self._failed_starts = 0
+        self._retry_at: Optional[float] = None
+        self._stats = {'starts': 0, 'start_failures': 0, 'reaped': 0, 'catalog_hits': 0}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the server process is up and initialized (or being restarted by its client)"""
+        return self.client is not None and (self.client.is_initialized or self.client._reconnect_pending())
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the proxy accepts calls; the server itself starts on demand"""
+        return not self._is_closed and not self._backing_off()
+
+    def _backing_off(self) -> bool:
+        """Whether a failed start is too recent to try again"""
+        return self._retry_at is not None and time.monotonic() < self._retry_at
+
+    @property
+    def health(self) -> HealthStatus:
+        """Last probe of the running server (an unchecked status while stopped)"""
+        return self.client.health if self.client is not None else HealthStatus()
+
+    async def start(self) -> bool:
+        """
+        Start and initialize the server unless it is already running
+
+        Returns:
+            True if the server is running, False otherwise
+        """
+        if self.is_running:
+            return True
+        if self._is_closed:
+            self.logger.error(f"Cannot start {self.server_name}: proxy is closed")
+            return False
+
+        async with self._start_lock:
+            if self.is_running:
+                return True
+            if self._backing_off():
+                self.logger.debug(f"Not starting {self.server_name}: retry in "
+                                  f"{self._retry_at - time.monotonic():.1f}s")
+                return False
+            if self.client is not None:
+                # The previous process died and is not being restarted
+                stale, self.client = self.client, None
+                await stale.close()
+
+            started = time.monotonic()
+            client = RealMCPClient(self.server_name, logger=self.logger,
+                                   catalog_cache=self.catalog_cache, **self.client_options)
+            if not await client.connect_stdio(self.command, self.env) or not await client.send_initialize():
+                self._stats['start_failures'] += 1
+                delay = min(MAX_START_BACKOFF, self.start_backoff * 2 ** self._failed_starts)
+                self._failed_starts += 1
+                self._retry_at = time.monotonic() + delay
+                tail = client.get_stderr_tail(5)
+                self.logger.error(f"Failed to start {self.server_name} on demand"
+                                  + (f"; stderr:\n{tail}" if tail else ""))
+                await client.close()
+                return False
+
+            self._failed_starts = 0
+            self._retry_at = None
+            client._tools_cache = self._tools_cache
+            if self._health_options is not None:
+                client.start_health_checks(*self._health_options)
+            self.client = client
+            self._stats['starts'] += 1
+            self._last_used = time.monotonic()
+            if self._reaper_task is None or self._reaper_task.done():
+                self._reaper_task = asyncio.create_task(self._reap_when_idle())
+
+            self.logger.info(f"✅ Started {self.server_name} on demand in {time.monotonic() - started:.2f}s")
+            return True
+
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the tool catalogue, starting the server only if none is cached
+
+        Args:
+            refresh: Fetch tools/list from the server, starting it if needed
+
+        Returns:
+            List of tool definitions
+        """
+        if self.is_running:
+            self._tools_cache = await self.client.list_tools(refresh)
+            return self._tools_cache
+
+        if not refresh:
+            if self._tools_cache is not None:
+                return self._tools_cache
+            entry = self.catalog_cache.get(self.command)
+            if entry is not None:
+                self._stats['catalog_hits'] += 1
+                self._tools_cache = entry["tools"]
+                return self._tools_cache
+
+        if not await self.start():
+            return []
+        self._tools_cache = await self.client.list_tools(refresh)
+        return self._tools_cache
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Execute a tool, starting the server first if it is not running
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            **kwargs: Extra keyword arguments for RealMCPClient.call_tool
+
+        Returns:
+            Tool execution result or None if failed
+        """
+        return await self._call_started("call_tool", name, arguments, **kwargs)
+
+    async def read_resource(self, uri: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """Read a resource, starting the server first if needed (see RealMCPClient.read_resource)"""
+        return await self._call_started("read_resource", uri, **kwargs)
+
+    async def list_resources(self) -> List[Dict[str, Any]]:
+        """List resources, starting the server first if needed"""
+        return await self._call_started("list_resources") or []
+
+    async def list_prompts(self) -> List[Dict[str, Any]]:
+        """List prompts, starting the server first if needed"""
+        return await self._call_started("list_prompts") or []
+
+    async def get_prompt(self, name: str, arguments: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Render a prompt, starting the server first if needed"""
+        return await self._call_started("get_prompt", name, arguments)
+
+    async def _call_started(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a RealMCPClient method once the server is running"""
+        # Counted before starting so the reaper never stops a server a call is about to use
+        self._in_flight += 1
+        try:
+            if not await self.start():
+                self.logger.error(f"Cannot {method}: {self.server_name} failed to start")
+                return None
+            return await getattr(self.client, method)(*args, **kwargs)
+        finally:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    async def _reap_when_idle(self):
+        """Background task stopping the server once it has been idle for idle_ttl"""
+        interval = max(0.1, min(self.idle_ttl / 2, 30.0))
+        try:
+            while self.client is not None:
+                await asyncio.sleep(interval)
+                if self._in_flight or time.monotonic() - self._last_used < self.idle_ttl:
+                    continue
+
+                client, self.client = self.client, None
+                self._stats['reaped'] += 1
+                self.logger.info(f"Stopping {self.server_name} after {self.idle_ttl:.0f}s idle")
+                await client.close()
+        except asyncio.CancelledError:
+            pass
+
+    async def health_check(self, timeout: float = DEFAULT_HEALTH_TIMEOUT) -> bool:
+        """
+        Probe the running server; a stopped server is not started for a probe
+
+        Args:
+            timeout: Seconds to wait for the probe response
+
+        Returns:
+            True if the server is healthy or not running, False otherwise
+        """
+        if self.client is None:
+            return True
+        return await self.client.health_check(timeout)
+
+    def start_health_checks(self, interval: float = DEFAULT_HEALTH_INTERVAL,
+                            jitter: float = DEFAULT_HEALTH_JITTER,
+                            timeout: float = DEFAULT_HEALTH_TIMEOUT):
+        """Probe the server periodically while it runs (see RealMCPClient.start_health_checks)"""
+        self._health_options = (interval, jitter, timeout)
+        if self.client is not None:
+            self.client.start_health_checks(interval, jitter, timeout)
+
+    def stop_health_checks(self):
+        """Stop the background health probes"""
+        self._health_options = None
+        if self.client is not None:
+            self.client.stop_health_checks()
+
+    def get_stderr_tail(self, lines: int = 20) -> str:
+        """Last stderr lines of the running (or most recently started) server"""
+        return self.client.get_stderr_tail(lines) if self.client is not None else ""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get start and reap counters
+
+        Returns:
+            Dictionary with the running state, idle time and counters
+        """
+        return {
+            **self._stats,
+            'server_name': self.server_name,
+            'running': self.is_running,
+            'retry_in': max(0.0, self._retry_at - time.monotonic()) if self._backing_off() else 0.0,
+            'in_flight': self._in_flight,
+            'idle_for': time.monotonic() - self._last_used,
+            'idle_ttl': self.idle_ttl
+        }
+
+    async def close(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT, deadline: Optional[float] = None):
+        """
+        Stop the reaper and the server, if running
+
+        Args:
+            timeout: Seconds the server is given to exit
+            deadline: Shared time.monotonic() deadline (see close_clients)
+        """
+        self._is_closed = True
+        if self._reaper_task and not self._reaper_task.done():
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+
+        client, self.client = self.client, None
+        if client is not None:
+            await client.close(timeout, deadline)
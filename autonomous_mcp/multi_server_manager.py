@@ -0,0 +1,539 @@
+"""
+Multi-Server MCP Client Manager
+
+This module starts and tracks one RealMCPClient per configured MCP server.
+Servers are read from a Claude-Desktop-style configuration file and brought
+up concurrently, so total startup time is bounded by the slowest server
+rather than the sum of all of them.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .lazy_client import DEFAULT_IDLE_TTL, LazyMCPClient
+from .real_mcp_client import (
+    DEFAULT_HEALTH_INTERVAL, DEFAULT_HEALTH_JITTER, DEFAULT_HEALTH_TIMEOUT, DEFAULT_SHUTDOWN_TIMEOUT,
+    RealMCPClient, close_clients
+)
+from .tool_catalog_cache import ToolCatalogCache
+from .warm_pool import WarmProcessPool
+
+
+# Separator between server name and tool name in the merged tool index
+NAMESPACE_SEPARATOR = "."
+
+# Global deadline for bringing up every configured server
+DEFAULT_STARTUP_TIMEOUT = 30.0
+
+
+def default_config_path() -> Path:
+    """
+    Locate the Claude Desktop configuration file for this platform
+
+    Returns:
+        Path to claude_desktop_config.json (which may not exist)
+    """
+    override = os.environ.get("MCP_SERVERS_CONFIG")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
+
+    return base / "Claude" / "claude_desktop_config.json"
+
+
+def load_server_configs(path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the ``mcpServers`` section of a Claude-Desktop-style config file
+
+    Args:
+        path: Config file path (defaults to default_config_path())
+
+    Returns:
+        Mapping of server name to its command/args/env entry
+    """
+    path = Path(path) if path else default_config_path()
+    if not path.exists():
+        return {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    return dict(config.get("mcpServers", {}))
+
+
+class MultiServerClientManager:
+    """
+    Manages connections to several MCP servers
+
+    Keeps one RealMCPClient per server and a merged tool index whose keys
+    are namespaced as ``<server>.<tool>`` so identically named tools from
+    different servers never collide.
+
+    Besides ``command`` entries, a server entry may name a shared server
+    to connect to instead of spawning one: ``"unix": "/run/mcp/docs.sock"``
+    or ``"tcp": "host:port"`` (see socket_bridge), or a Streamable HTTP
+    endpoint as ``"url"`` with optional ``"headers"``. All HTTP servers
+    share one pooled connection client.
+
+    With ``lazy=True`` command servers get a LazyMCPClient: their tools are
+    indexed from the cached catalogue without starting them, each process
+    starts on its first tool call and is stopped after ``idle_ttl`` idle
+    seconds. Servers with no cached catalogue are started once to fetch it.
+    """
+
+    def __init__(self, server_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+                 config_path: Optional[Path] = None,
+                 startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+                 exclude: Optional[Iterable[str]] = None,
+                 warm_pool: Optional[WarmProcessPool] = None,
+                 circuit_breaker: Optional[CircuitBreakerConfig] = None,
+                 lazy: bool = False,
+                 idle_ttl: float = DEFAULT_IDLE_TTL,
+                 logger: Optional[logging.Logger] = None,
+                 **client_options: Any):
+        """
+        Initialize the manager
+
+        Args:
+            server_configs: Server entries keyed by name (read from config_path if omitted)
+            config_path: Claude-Desktop-style config file to read servers from
+            startup_timeout: Global deadline in seconds for start_all()
+            exclude: Server names never to start (e.g. this agent's own entry)
+            warm_pool: Pool of pre-initialized spares used by acquire_isolated()
+                (owned and closed by the caller)
+            circuit_breaker: Give every server its own circuit breaker with these thresholds
+            lazy: Start command servers on their first tool call only
+            idle_ttl: Seconds a lazily started server may idle before it is stopped
+            logger: Logger to use
+            **client_options: Extra keyword arguments for each RealMCPClient
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.server_configs = (server_configs if server_configs is not None
+                               else load_server_configs(config_path))
+        self.startup_timeout = startup_timeout
+        self.exclude = set(exclude or [])
+        self.client_options = client_options
+        self.warm_pool = warm_pool
+        self.circuit_breaker_config = circuit_breaker
+        self.lazy = lazy
+        self.idle_ttl = idle_ttl
+        if lazy and self.client_options.get('catalog_cache') is None:
+            self.client_options['catalog_cache'] = ToolCatalogCache(logger=self.logger)
+
+        self._http_client = None
+
+        self.connected_servers: Dict[str, Union[RealMCPClient, LazyMCPClient]] = {}
+        self.failed_servers: Dict[str, str] = {}
+        self.tool_index: Dict[str, Dict[str, Any]] = {}
+        self.startup_time: Optional[float] = None
+        # Set once start_all has run, so callers do not retry a fleet that failed
+        self.startup_attempted = False
+
+    async def start_all(self, server_filter: Optional[Iterable[str]] = None,
+                        startup_timeout: Optional[float] = None) -> Dict[str, bool]:
+        """
+        Start, initialize and list tools on every configured server concurrently
+
+        Servers that have not finished by the global deadline are cancelled
+        and recorded in ``failed_servers``.
+
+        Args:
+            server_filter: Only start these servers (all configured if omitted)
+            startup_timeout: Override for the global startup deadline
+
+        Returns:
+            Mapping of server name to whether it is now connected
+        """
+        wanted = set(server_filter) if server_filter else None
+        started = time.monotonic()
+        self.startup_attempted = True
+
+        tasks: Dict[asyncio.Task, str] = {}
+        for name, config in self.server_configs.items():
+            if name in self.exclude or (wanted is not None and name not in wanted):
+                continue
+            if name in self.connected_servers:
+                continue
+            if config.get("disabled"):
+                continue
+            if not any(key in config for key in ("command", "unix", "tcp", "url")):
+                self.failed_servers[name] = "Server entry needs a command, unix socket path, tcp address or url"
+                continue
+            tasks[asyncio.create_task(self._start_server(name, config))] = name
+
+        if tasks:
+            self.logger.info(f"Starting {len(tasks)} MCP servers concurrently...")
+            done, pending = await asyncio.wait(
+                tasks.keys(),
+                timeout=self.startup_timeout if startup_timeout is None else startup_timeout
+            )
+
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            for task, name in tasks.items():
+                if task in pending:
+                    self.failed_servers[name] = "Startup deadline exceeded"
+                    continue
+                error = task.exception()
+                if error is not None:
+                    self.failed_servers[name] = str(error)
+                    continue
+                client, tools = task.result()
+                self.connected_servers[name] = client
+                self.failed_servers.pop(name, None)
+                self._index_tools(name, tools)
+
+        self.startup_time = time.monotonic() - started
+        self.logger.info(f"✅ Connected to {len(self.connected_servers)} MCP servers "
+                         f"({len(self.tool_index)} tools) in {self.startup_time:.2f}s")
+
+        return {name: name in self.connected_servers for name in tasks.values()}
+
+    async def _start_server(self, name: str, config: Dict[str, Any]) -> Tuple[RealMCPClient, List[Dict[str, Any]]]:
+        """Connect, initialize and list tools for one server"""
+        options = dict(self.client_options)
+        if self.circuit_breaker_config is not None:
+            options['circuit_breaker'] = CircuitBreaker(name, self.circuit_breaker_config, self.logger)
+
+        if self.lazy and "command" in config:
+            proxy = LazyMCPClient(name, self._server_command(config), config.get("env"),
+                                  idle_ttl=self.idle_ttl, logger=self.logger, **options)
+            tools = await proxy.list_tools()
+            if not tools and proxy.get_stats()['start_failures']:
+                await proxy.close()
+                raise RuntimeError("Server failed to start on demand")
+            return proxy, tools
+
+        client = RealMCPClient(name, logger=self.logger, **options)
+
+        try:
+            if "unix" in config:
+                if not await client.connect_unix(config["unix"]):
+                    raise RuntimeError(f"Could not connect to unix:{config['unix']}")
+            elif "tcp" in config:
+                host, _, port = config["tcp"].rpartition(":")
+                if not await client.connect_tcp(host or "127.0.0.1", int(port)):
+                    raise RuntimeError(f"Could not connect to tcp:{config['tcp']}")
+            elif "url" in config:
+                if not await client.connect_http(config["url"], config.get("headers"), self._shared_http_client()):
+                    raise RuntimeError(f"Could not use {config['url']}")
+            elif not await client.connect_stdio(self._server_command(config), config.get("env")):
+                raise RuntimeError("Server process failed to start")
+            if not await client.send_initialize():
+                tail = client.get_stderr_tail(5)
+                raise RuntimeError("Initialize handshake failed" + (f"; stderr:\n{tail}" if tail else ""))
+            return client, await client.list_tools()
+        except BaseException:
+            await client.close()
+            raise
+
+    def _shared_http_client(self):
+        """Connection pool shared by every HTTP server, created on first use"""
+        if self._http_client is None:
+            from .http_transport import make_http_client
+            self._http_client = make_http_client()
+        return self._http_client
+
+    @staticmethod
+    def _server_command(config: Dict[str, Any]) -> List[str]:
+        """Resolve a config entry to the full command line"""
+        return [shutil.which(config["command"]) or config["command"]] + list(config.get("args", []))
+
+    async def prewarm(self, server_filter: Optional[Iterable[str]] = None):
+        """
+        Fill the warm pool with spares for configured servers
+
+        Args:
+            server_filter: Only prewarm these servers (all configured if omitted)
+        """
+        if self.warm_pool is None:
+            return
+        wanted = set(server_filter) if server_filter else None
+        await asyncio.gather(*[
+            self.warm_pool.prewarm(self._server_command(config), config.get("env"))
+            for name, config in self.server_configs.items()
+            if "command" in config and not config.get("disabled")
+            and name not in self.exclude and (wanted is None or name in wanted)
+        ])
+
+    async def acquire_isolated(self, name: str) -> Optional[RealMCPClient]:
+        """
+        Get a dedicated client for one server, e.g. one per tenant
+
+        The client comes from the warm pool when one is configured, so no
+        process start or handshake is paid. It is not tracked by the
+        manager; the caller must close it.
+
+        Args:
+            name: Configured server name
+
+        Returns:
+            Initialized client or None if the server could not be started
+        """
+        config = self.server_configs.get(name)
+        if config is None or "command" not in config:
+            self.logger.error(f"Unknown or non-stdio server: {name}")
+            return None
+
+        command = self._server_command(config)
+        if self.warm_pool is not None:
+            return await self.warm_pool.acquire(name, command, config.get("env"))
+
+        try:
+            client, _ = await self._start_server(name, config)
+            return client
+        except Exception as e:
+            self.logger.error(f"Failed to start isolated {name}: {e}")
+            return None
+
+    def _index_tools(self, server_name: str, tools: List[Dict[str, Any]]):
+        """Add one server's tools to the merged, namespaced index"""
+        for tool in tools:
+            self.tool_index[f"{server_name}{NAMESPACE_SEPARATOR}{tool['name']}"] = {
+                'server': server_name,
+                'name': tool['name'],
+                'tool': tool
+            }
+
+    def get_all_tools(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the merged tool index
+
+        Returns:
+            Mapping of ``<server>.<tool>`` to server name, tool name and definition
+        """
+        return dict(self.tool_index)
+
+    def get_available_tools(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the merged tool index without tools of unavailable servers
+
+        Returns:
+            Mapping of ``<server>.<tool>`` for servers whose circuit admits calls
+        """
+        return {key: entry for key, entry in self.tool_index.items()
+                if self.is_available(entry['server'])}
+
+    def is_available(self, server_name: str) -> bool:
+        """
+        Check whether a server is connected and its circuit admits calls
+
+        Args:
+            server_name: Server name
+
+        Returns:
+            True if a call to the server would be attempted now
+        """
+        client = self.connected_servers.get(server_name)
+        if client is None or not client.is_connected:
+            return False
+        return client.circuit_breaker is None or client.circuit_breaker.is_available
+
+    def get_circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit breaker state of every connected server
+
+        Returns:
+            Mapping of server name to its circuit state
+        """
+        return {name: client.circuit_breaker.get_state()
+                for name, client in self.connected_servers.items()
+                if client.circuit_breaker is not None}
+
+    def resolve_tool(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a namespaced or unambiguous bare tool name
+
+        A bare name offered by several servers resolves to the only one of
+        them that is available, so calls route around an open circuit.
+
+        Args:
+            name: ``<server>.<tool>`` or a tool name offered by exactly one server
+
+        Returns:
+            (server name, tool name) or None if unknown or ambiguous
+        """
+        entry = self.tool_index.get(name)
+        if entry:
+            return entry['server'], entry['name']
+
+        matches = [entry for entry in self.tool_index.values() if entry['name'] == name]
+        if len(matches) > 1:
+            matches = [entry for entry in matches if self.is_available(entry['server'])]
+        if len(matches) == 1:
+            return matches[0]['server'], matches[0]['name']
+        return None
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Execute a tool on whichever server provides it
+
+        Args:
+            name: Namespaced or unambiguous bare tool name
+            arguments: Tool arguments
+            **kwargs: Extra keyword arguments for RealMCPClient.call_tool
+
+        Returns:
+            Tool execution result or None if failed
+        """
+        resolved = self.resolve_tool(name)
+        if resolved is None:
+            self.logger.error(f"Unknown or ambiguous tool: {name}")
+            return None
+
+        server_name, tool_name = resolved
+        client = self.connected_servers.get(server_name)
+        if client is None:
+            self.logger.error(f"Server not connected: {server_name}")
+            return None
+
+        return await client.call_tool(tool_name, arguments, **kwargs)
+
+    async def read_resource(self, server_name: str, uri: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Read a resource from one server
+
+        Args:
+            server_name: Server name
+            uri: Resource URI
+            **kwargs: Extra keyword arguments for RealMCPClient.read_resource
+
+        Returns:
+            Result with the resource contents or None if failed
+        """
+        client = self.connected_servers.get(server_name)
+        if client is None:
+            self.logger.error(f"Server not connected: {server_name}")
+            return None
+        return await client.read_resource(uri, **kwargs)
+
+    async def get_prompt(self, server_name: str, name: str,
+                         arguments: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Render a prompt offered by one server
+
+        Args:
+            server_name: Server name
+            name: Prompt name
+            arguments: Prompt arguments
+
+        Returns:
+            Result with the prompt messages or None if failed
+        """
+        client = self.connected_servers.get(server_name)
+        if client is None:
+            self.logger.error(f"Server not connected: {server_name}")
+            return None
+        return await client.get_prompt(name, arguments)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get connection status for all configured servers
+
+        Returns:
+            Dictionary with connected/failed servers and tool counts
+        """
+        return {
+            'configured_servers': len(self.server_configs),
+            'connected_servers': list(self.connected_servers.keys()),
+            'failed_servers': dict(self.failed_servers),
+            'total_tools': len(self.tool_index),
+            'startup_time': self.startup_time,
+            'health': self.get_health(),
+            'circuits': self.get_circuit_states(),
+            'running_servers': [name for name, client in self.connected_servers.items()
+                                if not isinstance(client, LazyMCPClient) or client.is_running]
+        }
+
+    def start_health_checks(self, interval: float = DEFAULT_HEALTH_INTERVAL,
+                            jitter: float = DEFAULT_HEALTH_JITTER,
+                            timeout: float = DEFAULT_HEALTH_TIMEOUT):
+        """
+        Start jittered background ping probes on every connected server
+
+        Args:
+            interval: Mean seconds between probes of one server
+            jitter: Fraction of the interval to randomise each wait by
+            timeout: Seconds to wait for each probe
+        """
+        for client in self.connected_servers.values():
+            client.start_health_checks(interval, jitter, timeout)
+
+    async def check_health(self, timeout: float = DEFAULT_HEALTH_TIMEOUT) -> Dict[str, bool]:
+        """
+        Probe every connected server now, concurrently
+
+        Args:
+            timeout: Seconds to wait for each probe
+
+        Returns:
+            Mapping of server name to health
+        """
+        names = list(self.connected_servers)
+        results = await asyncio.gather(
+            *[self.connected_servers[name].health_check(timeout) for name in names]
+        )
+        return dict(zip(names, results))
+
+    def get_health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the cached health of every connected server without probing
+
+        Returns:
+            Mapping of server name to its last HealthStatus as a dictionary
+        """
+        return {name: asdict(client.health) for name, client in self.connected_servers.items()}
+
+    async def close_all(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT):
+        """
+        Close every connected client and clear the tool index
+
+        All servers are terminated at once and given one shared deadline.
+
+        Args:
+            timeout: Seconds the servers are given to exit before being killed
+        """
+        clients, self.connected_servers = self.connected_servers, {}
+        self.tool_index.clear()
+        self.startup_attempted = False
+        await close_clients(clients.values(), timeout)
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+_manager: Optional[MultiServerClientManager] = None
+
+
+def get_client_manager(**kwargs: Any) -> MultiServerClientManager:
+    """
+    Get the process-wide client manager, creating it on first use
+
+    Args:
+        **kwargs: Constructor arguments, used only when the manager is created
+
+    Returns:
+        The shared MultiServerClientManager
+    """
+    global _manager
+    if _manager is None:
+        _manager = MultiServerClientManager(**kwargs)
+    return _manager
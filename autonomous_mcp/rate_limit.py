@@ -0,0 +1,253 @@
+"""
+Client-Side Rate Limiting and Concurrency Caps
+
+This module keeps the agent within upstream quotas (search APIs, GitHub)
+by admitting requests through token buckets and concurrency semaphores
+per server and per tool. Requests over the limit wait their turn instead
+of failing, unless the wait would outlast their deadline.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Any
+
+
+# Protocol housekeeping that is never rate limited
+UNLIMITED_METHODS = frozenset({"initialize", "ping"})
+
+
+class RateLimitExceeded(asyncio.TimeoutError):
+    """A request could not be admitted before its deadline"""
+
+
+@dataclass
+class RateLimit:
+    """Limits for one server or tool; None disables that limit"""
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    max_concurrency: Optional[int] = None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second up to ``burst``
+
+    Tokens are reserved in arrival order, so the balance can go negative:
+    each waiter sleeps until its own reservation is covered. A waiter whose
+    reservation would not be covered before its deadline takes nothing.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst if burst is not None else int(rate) or 1)
+        self.tokens = float(self.burst)
+        self._updated: Optional[float] = None
+
+    def _refill(self, now: float):
+        if self._updated is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Current balance; negative while reservations are outstanding"""
+        self._refill(time.monotonic())
+        return self.tokens
+
+    async def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        Take one token, waiting for it if necessary
+
+        Args:
+            deadline: time.monotonic() value by which the token must be available
+
+        Returns:
+            True once the token is taken, False if it would arrive too late
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        wait = max(0.0, (1 - self.tokens) / self.rate)
+        if deadline is not None and now + wait > deadline:
+            return False
+
+        self.tokens -= 1
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.tokens += 1
+                raise
+        return True
+
+    def refund(self):
+        """Give back a token that was taken but not used"""
+        self._refill(time.monotonic())
+        self.tokens = min(self.burst, self.tokens + 1)
+
+
+class _Limiter:
+    """Token bucket and semaphore enforcing one RateLimit"""
+
+    def __init__(self, name: str, limit: RateLimit):
+        self.name = name
+        self.limit = limit
+        self.bucket = TokenBucket(limit.rate, limit.burst) if limit.rate else None
+        self.semaphore = asyncio.Semaphore(limit.max_concurrency) if limit.max_concurrency else None
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+
+
+class AdmissionController:
+    """
+    Token buckets and concurrency caps per server and per tool
+
+    ``server_limits`` is keyed by server name and ``tool_limits`` by bare
+    (``web_search``) or namespaced (``brave.web_search``) tool name; a bare
+    name applies to that tool on every server, with its own bucket per
+    server. ``default_server_limit`` applies to servers without an entry.
+    A request must pass every limit that applies to it. initialize and
+    ping are never limited.
+    """
+
+    def __init__(self, server_limits: Optional[Dict[str, RateLimit]] = None,
+                 tool_limits: Optional[Dict[str, RateLimit]] = None,
+                 default_server_limit: Optional[RateLimit] = None):
+        """
+        Initialize the controller
+
+        Args:
+            server_limits: Limits per server name
+            tool_limits: Limits per bare or namespaced tool name
+            default_server_limit: Limit for servers not in ``server_limits``
+        """
+        self.server_limits = dict(server_limits or {})
+        self.tool_limits = dict(tool_limits or {})
+        self.default_server_limit = default_server_limit
+        self._limiters: Dict[str, _Limiter] = {}
+
+    def _limiter(self, key: str, limit: RateLimit) -> _Limiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = _Limiter(key, limit)
+        return limiter
+
+    def _limiters_for(self, server: str, method: str, tool: Optional[str]) -> List[_Limiter]:
+        """Limiters a request must pass, server first"""
+        if method in UNLIMITED_METHODS:
+            return []
+
+        limiters = []
+        server_limit = self.server_limits.get(server, self.default_server_limit)
+        if server_limit is not None:
+            limiters.append(self._limiter(server, server_limit))
+
+        if tool is not None:
+            namespaced = f"{server}.{tool}"
+            tool_limit = self.tool_limits.get(namespaced, self.tool_limits.get(tool))
+            if tool_limit is not None:
+                limiters.append(self._limiter(namespaced, tool_limit))
+        return limiters
+
+    @asynccontextmanager
+    async def admit(self, server: str, method: str, tool: Optional[str] = None,
+                    deadline: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold admission for one request for the duration of the block
+
+        Concurrency slots are taken first, then rate tokens, so a request
+        is sent as soon as its token is granted. A request refused by one
+        limiter gives back the tokens earlier limiters granted it.
+
+        Args:
+            server: Server name
+            method: JSON-RPC method
+            tool: Tool name for tools/call
+            deadline: time.monotonic() value after which waiting is pointless
+
+        Raises:
+            RateLimitExceeded: If admission cannot be granted before the deadline
+        """
+        limiters = self._limiters_for(server, method, tool)
+        if not limiters:
+            yield
+            return
+
+        started = time.monotonic()
+        held: List[_Limiter] = []
+        charged: List[_Limiter] = []
+        admitted = False
+        try:
+            for limiter in limiters:
+                if limiter.semaphore is not None:
+                    limiter.waiting += 1
+                    try:
+                        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                        await asyncio.wait_for(limiter.semaphore.acquire(), timeout)
+                    except asyncio.TimeoutError:
+                        limiter.rejected += 1
+                        raise RateLimitExceeded(f"Concurrency limit for {limiter.name} not available in time")
+                    finally:
+                        limiter.waiting -= 1
+                    held.append(limiter)
+
+            for limiter in limiters:
+                if limiter.bucket is not None:
+                    limiter.waiting += 1
+                    try:
+                        granted = await limiter.bucket.acquire(deadline)
+                    finally:
+                        limiter.waiting -= 1
+                    if not granted:
+                        limiter.rejected += 1
+                        raise RateLimitExceeded(f"Rate limit for {limiter.name} would exceed the deadline")
+                    charged.append(limiter)
+
+            admitted = True
+            waited = time.monotonic() - started
+            for limiter in limiters:
+                limiter.admitted += 1
+                limiter.in_flight += 1
+                if waited > 0.001:
+                    limiter.delayed += 1
+                    limiter.total_wait += waited
+            try:
+                yield
+            finally:
+                for limiter in limiters:
+                    limiter.in_flight -= 1
+        finally:
+            if not admitted:
+                for limiter in charged:
+                    limiter.bucket.refund()
+            for limiter in held:
+                limiter.semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get admission counters for every server and tool seen so far
+
+        Returns:
+            Mapping of server or ``server.tool`` to its counters
+        """
+        return {
+            key: {
+                'rate': limiter.limit.rate,
+                'max_concurrency': limiter.limit.max_concurrency,
+                'available_tokens': limiter.bucket.available() if limiter.bucket else None,
+                'in_flight': limiter.in_flight,
+                'waiting': limiter.waiting,
+                'admitted': limiter.admitted,
+                'delayed': limiter.delayed,
+                'rejected': limiter.rejected,
+                'average_wait': limiter.total_wait / limiter.delayed if limiter.delayed else 0.0
+            }
+            for key, limiter in self._limiters.items()
+        }
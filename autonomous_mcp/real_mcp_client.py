@@ -7,16 +7,110 @@ with MCP servers.
 """
 
 import asyncio
-import json
+import contextvars
 import logging
+import random
+import re
+import socket
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Any, Tuple, Union
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
-import subprocess
+from collections import deque
 import sys
 import os
 from datetime import datetime
 
+from .circuit_breaker import CircuitBreaker
+from .codec import JSONCodec, get_codec
+from .latency import LatencyTracker
+from .rate_limit import AdmissionController, RateLimitExceeded
+from .replay import SessionRecorder
+from .resource_cache import ResourceCache
+from .result_cache import ToolResultCache
+from .single_flight import SingleFlight
+from .streaming import (
+    StreamingResponseParser, EVENT_ID, EVENT_ITEM, EVENT_MESSAGE, EVENT_INVALID
+)
+from .tool_catalog_cache import ToolCatalogCache, server_version
+
+
+# Line limit for the stdio StreamReader. asyncio defaults to 64 KiB, which is
+# far below the size of a large tools/call result (scraped pages, repo dumps).
+DEFAULT_READ_LIMIT = 16 * 1024 * 1024
+
+# Default time to wait for a response, including any time spent queued
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+# How long to wait for a server to answer the one-element batch probe
+DEFAULT_BATCH_PROBE_TIMEOUT = 2.0
+
+# Read size for the incremental (streaming) response reader
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes of recent server stderr kept per client for diagnostics
+DEFAULT_STDERR_CAPTURE = 64 * 1024
+
+# Health probes: per-probe timeout, default background interval and jitter
+DEFAULT_HEALTH_TIMEOUT = 5.0
+DEFAULT_HEALTH_INTERVAL = 15.0
+DEFAULT_HEALTH_JITTER = 0.2
+
+# JSON-RPC error codes: invalid request, unknown method, internal error, the range
+# reserved for implementation-defined server errors and a request cancelled by the client
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_ERROR_RANGE = range(-32099, -31999)
+REQUEST_CANCELLED = -32800
+
+# Reconnect after a crash: attempts, first backoff delay and its cap
+DEFAULT_RECONNECT_ATTEMPTS = 5
+DEFAULT_RECONNECT_BACKOFF = 0.5
+MAX_RECONNECT_BACKOFF = 30.0
+
+# Protocol housekeeping that never counts towards the circuit breaker
+UNBROKEN_METHODS = frozenset({"initialize", "ping"})
+
+# Methods that are safe to send again to a respawned server
+IDEMPOTENT_METHODS = frozenset({
+    "ping", "tools/list", "resources/list", "resources/templates/list",
+    "resources/read", "prompts/list", "prompts/get"
+})
+
+# Most pages followed when listing tools, resources or prompts
+MAX_LIST_PAGES = 100
+
+# Result field holding the items of each paginated list method
+LIST_RESULT_KEYS = {
+    "tools/list": "tools",
+    "resources/list": "resources",
+    "resources/templates/list": "resourceTemplates",
+    "prompts/list": "prompts"
+}
+
+# Pause before reopening the server message stream of an HTTP session
+HTTP_LISTEN_RETRY = 1.0
+
+# Seconds a server is given to exit after SIGTERM before it is killed
+DEFAULT_SHUTDOWN_TIMEOUT = 5.0
+
+# How many cancelled request IDs are remembered for dropping late responses
+CANCELLED_HISTORY = 1024
+
+# Top-level "id" at the start of a frame, used to drop late responses without
+# decoding them (only matches when no nested value precedes the id)
+_LEADING_ID = re.compile(rb'\s*\{(?:\s*"jsonrpc"\s*:\s*"2\.0"\s*,)?\s*"id"\s*:\s*(-?\d+|"[^"\\]*")')
+
+
+class MCPConnectionLost(ConnectionError):
+    """The server process exited or closed its output while a request was in flight"""
+
+
+# Client whose reconnect handshake is running in the current context; its
+# requests must not wait for the reconnect they are part of
+_reconnecting_client: contextvars.ContextVar = contextvars.ContextVar("_reconnecting_client", default=None)
+
 
 @dataclass
 class MCPMessage:
@@ -29,14 +123,51 @@ class MCPMessage:
     error: Optional[Dict[str, Any]] = None
 
 
+def make_request(message_id: Union[str, int], method: str,
+                 params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a JSON-RPC request dict directly, skipping the dataclass round-trip"""
+    message = {"jsonrpc": "2.0", "id": message_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def make_notification(method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a JSON-RPC notification dict (no ID, no response expected)"""
+    message = {"jsonrpc": "2.0", "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
 @dataclass
 class MCPServerCapabilities:
     """Represents MCP server capabilities"""
     tools: Dict[str, Any] = field(default_factory=dict)
     resources: Dict[str, Any] = field(default_factory=dict)
     prompts: Dict[str, Any] = field(default_factory=dict)
+    logging: Optional[Dict[str, Any]] = None
+    experimental: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_dict(cls, capabilities: Dict[str, Any]) -> "MCPServerCapabilities":
+        """Build capabilities from a server response, ignoring unknown keys"""
+        known = {name: value for name, value in capabilities.items()
+                 if name in cls.__dataclass_fields__ and value is not None}
+        return cls(**known)
     
+
+@dataclass
+class HealthStatus:
+    """Result of the most recent health probe"""
+    healthy: bool = False
+    checked_at: Optional[float] = None
+    latency: Optional[float] = None
+    method: Optional[str] = None
+    consecutive_failures: int = 0
+    error: Optional[str] = None
     
+
 @dataclass
 class MCPInitializeParams:
     """Parameters for MCP initialize request"""
@@ -48,26 +179,326 @@ class MCPInitializeParams:
     })
 
 
+class RequestWindow:
+    """
+    FIFO admission window bounding the requests in flight on one connection
+    
+    Requests beyond ``max_in_flight`` wait in arrival order until a slot is
+    released. ``max_in_flight=None`` admits everything immediately while
+    still keeping the counters.
+    """
+    
+    def __init__(self, max_in_flight: Optional[int] = None):
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peak_queue_depth = 0
+        self.total_admitted = 0
+        self.total_queued = 0
+        self.total_queue_wait = 0.0
+        self._waiters: Deque[Tuple[int, asyncio.Future]] = deque()
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of request slots waiting for admission"""
+        return sum(count for count, _ in self._waiters)
+    
+    @property
+    def utilization(self) -> Optional[float]:
+        """Fraction of the window in use, or None for an unbounded window"""
+        if self.max_in_flight is None:
+            return None
+        return self.in_flight / self.max_in_flight
+    
+    def _can_admit(self, count: int) -> bool:
+        # An oversized request is admitted alone rather than never
+        return (self.max_in_flight is None
+                or self.in_flight + count <= self.max_in_flight
+                or self.in_flight == 0)
+    
+    def _admit(self, count: int):
+        self.in_flight += count
+        self.total_admitted += count
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    
+    def _wake_waiters(self):
+        while self._waiters and self._can_admit(self._waiters[0][0]):
+            count, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._admit(count)
+            waiter.set_result(None)
+    
+    async def acquire(self, count: int = 1):
+        """
+        Wait until ``count`` request slots are available
+        
+        Args:
+            count: Number of slots to take (one per request)
+        """
+        if not self._waiters and self._can_admit(count):
+            self._admit(count)
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (count, waiter)
+        self._waiters.append(entry)
+        self.total_queued += count
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        started = time.monotonic()
+        
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just before the cancellation landed
+                self.release(count)
+            else:
+                try:
+                    self._waiters.remove(entry)
+                except ValueError:
+                    pass
+                self._wake_waiters()
+            raise
+        finally:
+            self.total_queue_wait += time.monotonic() - started
+    
+    def release(self, count: int = 1):
+        """Return ``count`` slots to the window and admit queued requests"""
+        self.in_flight = max(0, self.in_flight - count)
+        self._wake_waiters()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get window counters for sizing max_in_flight per server"""
+        return {
+            'max_in_flight': self.max_in_flight,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'window_utilization': self.utilization,
+            'peak_in_flight': self.peak_in_flight,
+            'peak_queue_depth': self.peak_queue_depth,
+            'total_admitted': self.total_admitted,
+            'total_queued': self.total_queued,
+            'average_queue_wait': (self.total_queue_wait / self.total_queued
+                                   if self.total_queued else 0.0)
+        }
+
+
+class OutputRingBuffer:
+    """
+    The most recent output of a child process, bounded by size
+    
+    Whole lines are kept; the oldest are dropped once ``max_bytes`` is
+    exceeded, and a single line longer than the limit keeps only its tail.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_STDERR_CAPTURE):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.dropped_bytes = 0
+        self._lines: Deque[bytes] = deque()
+        self._size = 0
+    
+    def append(self, line: bytes):
+        """Add one line (or partial line) of output"""
+        self.total_bytes += len(line)
+        if len(line) > self.max_bytes:
+            self.dropped_bytes += len(line) - self.max_bytes
+            line = line[-self.max_bytes:]
+        self._lines.append(line)
+        self._size += len(line)
+        while self._size > self.max_bytes:
+            dropped = self._lines.popleft()
+            self._size -= len(dropped)
+            self.dropped_bytes += len(dropped)
+    
+    def get_lines(self, count: Optional[int] = None) -> List[str]:
+        """
+        Get buffered lines, oldest first
+        
+        Args:
+            count: Only the last ``count`` lines (all if omitted)
+            
+        Returns:
+            Decoded lines without trailing newlines
+        """
+        lines = list(self._lines)[-count:] if count else list(self._lines)
+        return [line.decode("utf-8", "replace").rstrip("\r\n") for line in lines]
+    
+    def get_text(self) -> str:
+        """Get the whole buffer as text"""
+        return b"".join(self._lines).decode("utf-8", "replace")
+    
+    def clear(self):
+        """Drop all buffered output"""
+        self._lines.clear()
+        self._size = 0
+
+
 class RealMCPClient:
     """
     Real MCP protocol client implementation
     
     Provides actual JSON-RPC 2.0 communication with MCP servers over stdio,
     implementing the complete MCP protocol handshake and tool interaction.
+    
+    All I/O goes through asyncio subprocess streams, so waiting on a slow
+    server never blocks the event loop shared with other clients. Requests
+    are pipelined down the pipe; ``max_in_flight`` caps how many may await
+    a response at once, with the rest queued in FIFO order.
+    
+    connect_unix and connect_tcp speak the same newline-delimited protocol
+    to a long-lived server on a socket instead of a child process, so many
+    agent workers can share one server instance (see socket_bridge for
+    putting a stdio server behind a socket). connect_http reaches servers
+    behind a Streamable HTTP endpoint, with each request POSTed over a
+    pooled keep-alive connection (see http_transport). Everything else,
+    including reconnecting, works the same on every transport.
+    
+    ``batch_requests`` controls JSON-RPC batching in send_batch: True or
+    False skip detection, None probes the server on first use.
+    
+    Messages are framed and parsed as bytes with ``codec`` (orjson or
+    msgspec when installed, stdlib json otherwise). With ``streaming=True``
+    responses are scanned incrementally so call_tool_stream can yield
+    result content items while the rest of a large response is in flight.
+    
+    With a ``latency_tracker``, requests without an explicit timeout get one
+    derived from the observed latency of the same method and tool, or
+    ``request_timeout`` until enough latencies have been observed.
+    
+    With a ``catalog_cache``, list_tools answers from the persisted
+    catalogue of the same server command and version and refreshes it in
+    the background; ``notifications/tools/list_changed`` invalidates it.
+    
+    A server that exits or closes stdout fails its in-flight requests at
+    once instead of leaving them to time out. With ``auto_reconnect`` the
+    process is respawned with exponential backoff, keeping the cached tool
+    list, and in-flight requests for idempotent methods (plus tools named
+    in ``idempotent_tools``) are sent again to the new process.
+    
+    Server stderr is drained continuously, so a chatty server never blocks
+    on a full pipe. The last ``stderr_capture`` bytes are kept in
+    ``stderr_buffer``; with ``stderr_log_level`` each line is also passed
+    to the logger at that level.
+    
+    With an ``admission`` controller every request first passes its rate
+    and concurrency limits, queuing until admitted or until its timeout
+    would be exceeded.
+    
+    With a ``circuit_breaker`` every request except initialize, ping and
+    health probes, streamed tool calls included, is counted towards the
+    server's rolling error and timeout rates, and requests are refused at
+    once while the circuit is open. Requests the client cancels count as
+    neither success nor failure.
+    
+    With a ``result_cache``, call_tool answers repeated calls to cacheable
+    tools from the cache until their TTL expires.
+    
+    With ``single_flight``, concurrent call_tool calls with identical
+    arguments to a tool it enables share one request and its result.
+    
+    A ``recorder`` receives every request and its response, for offline
+    replay.
+    
+    Resources and prompts are listed across every page of results. With a
+    ``resource_cache``, read_resource answers repeated reads from memory:
+    on servers that support subscriptions each cached URI is subscribed to
+    and dropped from the cache on ``notifications/resources/updated`` (all
+    of them on ``notifications/resources/list_changed``); on others
+    contents are only cached if the cache has a TTL. A read that an update
+    overtakes is returned but not cached.
+    
+    health_check probes with ``ping`` (falling back to tools/list for
+    servers without it) and stores the outcome in ``health``, which
+    start_health_checks keeps current from a jittered background loop.
     """
     
-    def __init__(self, server_name: str, logger: Optional[logging.Logger] = None):
+    def __init__(self, server_name: str, logger: Optional[logging.Logger] = None,
+                 read_limit: int = DEFAULT_READ_LIMIT,
+                 max_in_flight: Optional[int] = None,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 batch_requests: Optional[bool] = None,
+                 catalog_cache: Optional[ToolCatalogCache] = None,
+                 codec: Optional[JSONCodec] = None,
+                 streaming: bool = False,
+                 latency_tracker: Optional[LatencyTracker] = None,
+                 auto_reconnect: bool = False,
+                 idempotent_tools: Optional[Iterable[str]] = None,
+                 max_reconnect_attempts: int = DEFAULT_RECONNECT_ATTEMPTS,
+                 reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF,
+                 stderr_capture: int = DEFAULT_STDERR_CAPTURE,
+                 stderr_log_level: Optional[int] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 result_cache: Optional[ToolResultCache] = None,
+                 admission: Optional[AdmissionController] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 recorder: Optional[SessionRecorder] = None,
+                 resource_cache: Optional[ResourceCache] = None):
         self.server_name = server_name
         self.logger = logger or logging.getLogger(__name__)
-        self.process: Optional[subprocess.Popen] = None
+        self.read_limit = read_limit
+        self.request_timeout = request_timeout
+        self.codec = codec or get_codec()
+        self.streaming = streaming
+        self.latency_tracker = latency_tracker
+        self.auto_reconnect = auto_reconnect
+        self.idempotent_tools = set(idempotent_tools or [])
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_backoff = reconnect_backoff
+        self.stderr_buffer = OutputRingBuffer(stderr_capture)
+        self.stderr_log_level = stderr_log_level
+        self.single_flight = single_flight
+        self.result_cache = result_cache
+        self.admission = admission
+        self.circuit_breaker = circuit_breaker
+        self.recorder = recorder
+        self.resource_cache = resource_cache
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.command: Optional[List[str]] = None
+        self.env: Optional[Dict[str, str]] = None
+        self.transport: Optional[str] = None
+        self.address: Optional[Union[str, Tuple[str, int]]] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._http = None
+        self._http_posts: Dict[Any, asyncio.Task] = {}
         self.is_connected = False
         self.is_initialized = False
         self.server_info: Optional[Dict[str, Any]] = None
         self.capabilities: Optional[MCPServerCapabilities] = None
         self.request_id = 1
         self._response_handlers: Dict[Union[str, int], asyncio.Future] = {}
+        self._stream_queues: Dict[Union[str, int], asyncio.Queue] = {}
+        self._pending_requests: Dict[Union[str, int], Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._cancelled_ids: Deque[Union[str, int]] = deque()
+        self._cancelled_lookup: set = set()
+        self._background_tasks: set = set()
+        self._notification_listeners: List[Callable[[Dict[str, Any]], None]] = []
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._subscriptions: set = set()
+        # Bumped by update notifications so a read racing one is not cached
+        self._resource_generations: Dict[str, int] = {}
+        self._resources_generation = 0
+        self._catalog_cache = catalog_cache
+        self._tools_refresh_task: Optional[asyncio.Task] = None
         self._reader_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._window = RequestWindow(max_in_flight)
+        self._batch_supported = batch_requests
+        self._batch_probe_id: Optional[int] = None
+        self._batch_probe_task: Optional[asyncio.Task] = None
+        self.health = HealthStatus()
+        self._ping_supported: Optional[bool] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self._watcher_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._reconnected: Optional[asyncio.Future] = None
+        self._closing = False
+        self.reconnect_count = 0
         
     async def connect_stdio(self, command: List[str], env: Optional[Dict[str, str]] = None) -> bool:
         """
@@ -82,6 +513,10 @@ class RealMCPClient:
         """
         try:
             self.logger.info(f"Starting MCP server process: {' '.join(command)}")
+            self.command = list(command)
+            self.env = env
+            self.transport = "stdio"
+            self._closing = False
             
             # Prepare environment
             server_env = os.environ.copy()
@@ -89,27 +524,29 @@ class RealMCPClient:
                 server_env.update(env)
             
             # Start the MCP server process
-            self.process = subprocess.Popen(
-                command,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            self.process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=server_env,
-                text=True,
-                bufsize=0  # Unbuffered for real-time communication
+                limit=self.read_limit
             )
             
             # Verify process started successfully
-            if self.process.poll() is not None:
-                stderr_output = self.process.stderr.read() if self.process.stderr else "No error output"
-                self.logger.error(f"MCP server process failed to start: {stderr_output}")
+            if self.process.returncode is not None:
+                stderr_output = await self.process.stderr.read() if self.process.stderr else b"No error output"
+                self.logger.error(f"MCP server process failed to start: {stderr_output.decode(errors='replace')}")
                 return False
             
+            self._reader, self._writer = self.process.stdout, self.process.stdin
             self.is_connected = True
             self.logger.info(f"✅ MCP server process started successfully (PID: {self.process.pid})")
             
-            # Start background reader task
+            # Start background reader, stderr drain and exit watcher tasks
             self._reader_task = asyncio.create_task(self._read_responses())
+            self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
+            self._watcher_task = asyncio.create_task(self._watch_process(self.process))
             
             return True
             
@@ -117,6 +554,120 @@ class RealMCPClient:
             self.logger.error(f"Failed to start MCP server: {e}")
             return False
     
+    async def connect_unix(self, path: str) -> bool:
+        """
+        Connect to a running MCP server listening on a Unix domain socket
+        
+        Args:
+            path: Socket path
+            
+        Returns:
+            True if connection successful, False otherwise
+        """
+        self.transport, self.address = "unix", path
+        return await self._connect_socket(
+            lambda: asyncio.open_unix_connection(path, limit=self.read_limit), f"unix:{path}"
+        )
+    
+    async def connect_tcp(self, host: str, port: int) -> bool:
+        """
+        Connect to a running MCP server listening on a TCP port
+        
+        Args:
+            host: Host name or address
+            port: Port number
+            
+        Returns:
+            True if connection successful, False otherwise
+        """
+        self.transport, self.address = "tcp", (host, port)
+        return await self._connect_socket(
+            lambda: asyncio.open_connection(host, port, limit=self.read_limit), f"tcp:{host}:{port}"
+        )
+    
+    async def _connect_socket(self, open_connection, endpoint: str) -> bool:
+        """Open a socket stream and start the response reader on it"""
+        try:
+            self.logger.info(f"Connecting to MCP server at {endpoint}")
+            self._closing = False
+            self._reader, self._writer = await open_connection()
+            
+            sock = self._writer.get_extra_info("socket")
+            if self.transport == "tcp" and sock is not None:
+                # Requests are small and latency-bound; do not let Nagle hold them back
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
+            self.is_connected = True
+            self.logger.info(f"✅ Connected to MCP server at {endpoint}")
+            self._reader_task = asyncio.create_task(self._read_responses())
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to connect to MCP server at {endpoint}: {e}")
+            self._reader = self._writer = None
+            return False
+    
+    async def connect_http(self, url: str, headers: Optional[Dict[str, str]] = None,
+                           http_client: Optional[Any] = None, http2: bool = False) -> bool:
+        """
+        Use an MCP server hosted behind a Streamable HTTP endpoint
+        
+        No connection is made until the first request; initialize then
+        establishes the session.
+        
+        Args:
+            url: MCP endpoint URL
+            headers: Extra headers for every request (e.g. Authorization)
+            http_client: Shared httpx.AsyncClient, e.g. from
+                http_transport.make_http_client() (owned by the caller)
+            http2: Negotiate HTTP/2 when no shared client is given
+            
+        Returns:
+            True if the transport is ready, False otherwise
+        """
+        try:
+            from .http_transport import HTTPTransport
+            self._http = HTTPTransport(url, headers, http_client, http2, logger=self.logger)
+        except ImportError as e:
+            self.logger.error(f"HTTP transport needs httpx and httpx-sse (and h2 for HTTP/2): {e}")
+            return False
+        self.transport, self.address = "http", url
+        return self._open_http()
+    
+    def _open_http(self) -> bool:
+        """Start a fresh HTTP session on the existing connection pool"""
+        self._http.session_id = None
+        self._http.protocol_version = None
+        self._closing = False
+        self.is_connected = True
+        self.logger.info(f"✅ Using MCP server at {self.address}")
+        return True
+    
+    @property
+    def _transport_open(self) -> bool:
+        return self._writer is not None or self._http is not None
+    
+    async def _open_transport(self) -> bool:
+        """Open the connection again the way it was first opened"""
+        if self.transport == "http":
+            return self._open_http()
+        if self.transport == "unix":
+            return await self.connect_unix(self.address)
+        if self.transport == "tcp":
+            return await self.connect_tcp(*self.address)
+        return await self.connect_stdio(self.command, self.env)
+    
+    @property
+    def endpoint(self) -> Optional[List[str]]:
+        """Identity of the server connected to: its command line, or its socket address or URL"""
+        if self.transport == "http":
+            return [self.address]
+        if self.transport == "unix":
+            return [f"unix:{self.address}"]
+        if self.transport == "tcp":
+            return [f"tcp:{self.address[0]}:{self.address[1]}"]
+        return self.command
+    
     async def send_initialize(self) -> bool:
         """
         Send MCP initialize handshake
@@ -138,10 +689,16 @@ class RealMCPClient:
             if response and "result" in response:
                 self.server_info = response["result"]
                 server_capabilities = response["result"].get("capabilities", {})
-                self.capabilities = MCPServerCapabilities(**server_capabilities)
+                self.capabilities = MCPServerCapabilities.from_dict(server_capabilities)
+                
+                if self._http is not None:
+                    self._http.protocol_version = self.server_info.get("protocolVersion")
                 
                 # Send initialized notification
-                await self.send_notification("initialized", {})
+                await self.send_notification("notifications/initialized", {})
+                
+                if self._http is not None:
+                    self._reader_task = asyncio.create_task(self._listen_http())
                 
                 self.is_initialized = True
                 self.logger.info(f"✅ MCP server initialized successfully")
@@ -156,55 +713,396 @@ class RealMCPClient:
             self.logger.error(f"Failed to initialize MCP server: {e}")
             return False
     
-    async def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    async def send_request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                           timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Send JSON-RPC 2.0 request and wait for response
         
         Args:
             method: RPC method name
             params: Method parameters
+            timeout: Seconds to wait, including time queued behind the
+                in-flight window (defaults to the adaptive timeout, or
+                request_timeout without a latency tracker)
             
         Returns:
             Response dictionary or None if failed
         """
-        if not self.is_connected or not self.process:
+        return await self._send_request(method, params, timeout, method not in UNBROKEN_METHODS)
+    
+    async def _send_request(self, method: str, params: Optional[Dict[str, Any]],
+                            timeout: Optional[float], counted: bool) -> Optional[Dict[str, Any]]:
+        """Send one request; only ``counted`` requests pass through the circuit breaker"""
+        if not self._reconnect_pending() and (not self.is_connected or not self._transport_open):
             self.logger.error("Cannot send request: not connected")
             return None
         
+        # Create message with unique ID
+        message_id = self.request_id
+        self.request_id += 1
+        
+        tool = params.get("name") if method == "tools/call" and params else None
+        if timeout is None:
+            timeout = self.get_timeout(method, tool)
+        started = time.monotonic()
+        
+        breaker = self.circuit_breaker if counted else None
+        ticket = breaker.allow() if breaker else None
+        if breaker and ticket is None:
+            self.logger.error(f"Circuit open for {self.server_name}, refusing {method}")
+            return None
+        
+        outcome_recorded = False
         try:
-            # Create message with unique ID
-            message_id = self.request_id
-            self.request_id += 1
-            
-            message = MCPMessage(
-                id=message_id,
-                method=method,
-                params=params
+            response = await asyncio.wait_for(
+                self._send_admitted(message_id, method, params, tool, timeout),
+                timeout=timeout
             )
+            if response is None and message_id in self._cancelled_lookup:
+                # Cancelled by the client; says nothing about the server
+                return None
+            if self.latency_tracker and response is not None:
+                self.latency_tracker.record(self.server_name, method, tool, time.monotonic() - started)
+            if breaker:
+                if self._is_server_failure(response):
+                    breaker.record_failure(ticket=ticket)
+                else:
+                    breaker.record_success(ticket)
+                outcome_recorded = True
+            return response
+        except RateLimitExceeded as e:
+            self.logger.error(f"Request not admitted: {method} (ID: {message_id}): {e}")
+            return None
+        except asyncio.TimeoutError:
+            self.logger.error(f"Request timeout: {method} (ID: {message_id}) after {timeout:.1f}s")
+            if self.latency_tracker:
+                self.latency_tracker.record_timeout(self.server_name, method, tool, timeout)
+            if breaker:
+                breaker.record_failure(timeout=True, ticket=ticket)
+                outcome_recorded = True
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to send request {method}: {e}")
+            if breaker and not self._closing:
+                # Requests failed by close() say nothing about the server
+                breaker.record_failure(ticket=ticket)
+                outcome_recorded = True
+            return None
+        finally:
+            if breaker and not outcome_recorded:
+                breaker.release(ticket)
+    
+    @staticmethod
+    def _is_server_failure(response: Optional[Dict[str, Any]]) -> bool:
+        """Whether a response shows the server itself failing, not just rejecting the request"""
+        if response is None:
+            return True
+        error = response.get("error")
+        if not isinstance(error, dict):
+            return False
+        code = error.get("code")
+        return code == INTERNAL_ERROR or code in SERVER_ERROR_RANGE
+    
+    async def _send_admitted(self, message_id: int, method: str, params: Optional[Dict[str, Any]],
+                             tool: Optional[str], timeout: float) -> Dict[str, Any]:
+        """Pass the admission controller, if any, then send the request"""
+        if self.admission is None:
+            return await self._send_pipelined(message_id, method, params)
+        
+        deadline = time.monotonic() + timeout
+        async with self.admission.admit(self.server_name, method, tool, deadline):
+            return await self._send_pipelined(message_id, method, params)
+    
+    def get_timeout(self, method: str, tool: Optional[str] = None) -> float:
+        """
+        Get the timeout the next request of this kind will use
+        
+        Args:
+            method: JSON-RPC method
+            tool: Tool name for tools/call
             
-            # Prepare response future
-            response_future = asyncio.Future()
+        Returns:
+            Timeout in seconds
+        """
+        if self.latency_tracker:
+            timeout = self.latency_tracker.timeout_for(self.server_name, method, tool)
+            if timeout is not None:
+                return timeout
+        return self.request_timeout
+    
+    async def _send_pipelined(self, message_id: int, method: str,
+                              params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Take a window slot, send the request and wait, replaying it after a reconnect if safe"""
+        if self._reconnect_pending() and not await self._wait_reconnected():
+            raise MCPConnectionLost(f"{self.server_name} is not connected")
+        
+        await self._window.acquire()
+        try:
+            while True:
+                try:
+                    return await self._send_once(message_id, method, params)
+                except MCPConnectionLost:
+                    if not self._is_replayable(method, params) or not await self._wait_reconnected():
+                        raise
+                    self.logger.info(f"Replaying {method} (ID: {message_id}) on restarted {self.server_name}")
+        finally:
+            self._window.release()
+    
+    async def _send_once(self, message_id: int, method: str,
+                         params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write the request and wait for its response"""
+        # Prepare response future
+        response_future = asyncio.get_running_loop().create_future()
+        try:
             self._response_handlers[message_id] = response_future
             
             # Send message
-            message_json = json.dumps(asdict(message)) + "\n"
-            self.process.stdin.write(message_json)
-            self.process.stdin.flush()
+            await self._write_message(make_request(message_id, method, params))
+            self._pending_requests[message_id] = (method, params)
             
             self.logger.debug(f"Sent MCP request: {method} (ID: {message_id})")
             
-            # Wait for response with timeout
-            try:
-                response = await asyncio.wait_for(response_future, timeout=30.0)
-                return response
-            except asyncio.TimeoutError:
-                self.logger.error(f"Request timeout: {method} (ID: {message_id})")
-                self._response_handlers.pop(message_id, None)
-                return None
+            return await response_future
+        finally:
+            self._response_handlers.pop(message_id, None)
+            self._finish_request(message_id, answered=response_future.done() and not response_future.cancelled())
+    
+    def _is_replayable(self, method: str, params: Optional[Dict[str, Any]]) -> bool:
+        """Whether a request may be sent again to a respawned server"""
+        if not self.auto_reconnect or self._closing:
+            return False
+        if method == "tools/call":
+            return bool(params) and params.get("name") in self.idempotent_tools
+        return method in IDEMPOTENT_METHODS
+    
+    def _finish_request(self, message_id: Union[str, int], answered: bool):
+        """Forget a written request, telling the server if it was abandoned"""
+        pending = self._pending_requests.pop(message_id, None)
+        if self.recorder:
+            # A recorded response has been written already; anything else
+            # (timeout, cancel, crash, stream) never will be
+            self.recorder.request_abandoned(message_id)
+        if pending is not None and not answered:
+            if pending[0] == "initialize":
+                # The spec forbids cancelling initialize; just ignore a late answer
+                self._remember_cancelled(message_id)
+            else:
+                self._notify_cancelled(message_id, "Client stopped waiting for the response")
+            post = self._http_posts.pop(message_id, None)
+            if post is not None:
+                # Free the pooled connection still waiting on the answer
+                post.cancel()
+    
+    def _remember_cancelled(self, message_id: Union[str, int]):
+        """Record a cancelled ID so a late response can be dropped cheaply"""
+        if len(self._cancelled_ids) >= CANCELLED_HISTORY:
+            self._cancelled_lookup.discard(self._cancelled_ids.popleft())
+        self._cancelled_ids.append(message_id)
+        self._cancelled_lookup.add(message_id)
+    
+    def _notify_cancelled(self, message_id: Union[str, int], reason: str):
+        """Send notifications/cancelled in the background"""
+        self._remember_cancelled(message_id)
+        if not self.is_connected:
+            return
+        
+        task = asyncio.create_task(self.send_notification("notifications/cancelled", {
+            "requestId": message_id,
+            "reason": reason
+        }))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def cancel(self, request_id: Union[str, int], reason: str = "Cancelled by client") -> bool:
+        """
+        Cancel an in-flight request
+        
+        Sends notifications/cancelled so the server can stop working on it,
+        and completes the caller's wait with None (a streaming call ends).
+        initialize cannot be cancelled.
+        
+        Args:
+            request_id: ID of a request returned by get_pending_requests()
+            reason: Human-readable reason passed to the server
+            
+        Returns:
+            True if the request was in flight, False otherwise
+        """
+        pending = self._pending_requests.get(request_id)
+        if pending is None or pending[0] == "initialize":
+            return False
+        del self._pending_requests[request_id]
+        
+        self._remember_cancelled(request_id)
+        await self.send_notification("notifications/cancelled", {
+            "requestId": request_id,
+            "reason": reason
+        })
+        
+        future = self._response_handlers.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+        
+        queue = self._stream_queues.get(request_id)
+        if queue is not None:
+            queue.put_nowait((EVENT_MESSAGE, {
+                "id": request_id,
+                "error": {"code": REQUEST_CANCELLED, "message": "Request cancelled"}
+            }))
+        
+        self.logger.info(f"Cancelled request {request_id} on {self.server_name}")
+        return True
+    
+    def get_pending_requests(self) -> Dict[Union[str, int], str]:
+        """
+        Get requests that have been written and await a response
+        
+        Returns:
+            Mapping of request ID to method name
+        """
+        return {message_id: method for message_id, (method, _) in self._pending_requests.items()}
+    
+    async def send_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]],
+                         timeout: Optional[float] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send several requests as JSON-RPC 2.0 batch arrays
+        
+        Requests are written as one array per window-sized chunk and the
+        response array is matched back by ID. Servers that reject batches,
+        and clients with an admission controller or circuit breaker, send
+        the same requests as pipelined single messages instead.
+        
+        Args:
+            requests: (method, params) pairs
+            timeout: Seconds to wait for the whole batch (defaults to request_timeout)
+            
+        Returns:
+            Responses in request order, None for any that failed
+        """
+        if not self.is_connected or not self._transport_open:
+            self.logger.error("Cannot send batch: not connected")
+            return [None] * len(requests)
+        
+        if not requests:
+            return []
+        
+        if timeout is None:
+            timeout = self.request_timeout
+        
+        if self._batch_supported is None:
+            if self._batch_probe_task is None:
+                self._batch_probe_task = asyncio.create_task(self._probe_batch_support())
+            self._batch_supported = await asyncio.shield(self._batch_probe_task)
+        
+        if not self._batch_supported or self.admission is not None or self.circuit_breaker is not None:
+            return list(await asyncio.gather(*[
+                self.send_request(method, params, timeout=timeout)
+                for method, params in requests
+            ]))
+        
+        chunk_size = self._window.max_in_flight or len(requests)
+        chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+        deadline = asyncio.get_running_loop().time() + timeout
+        
+        results = await asyncio.gather(*[
+            self._send_batch_chunk(chunk, deadline) for chunk in chunks
+        ])
+        return [response for chunk_results in results for response in chunk_results]
+    
+    async def _send_batch_chunk(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]],
+                                deadline: float) -> List[Optional[Dict[str, Any]]]:
+        """Write one batch array within the window and collect its responses"""
+        loop = asyncio.get_running_loop()
+        count = len(requests)
+        
+        try:
+            await asyncio.wait_for(self._window.acquire(count),
+                                   timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            self.logger.error(f"Batch timeout: {count} requests still queued")
+            return [None] * count
+        
+        message_ids: List[int] = []
+        futures: List[asyncio.Future] = []
+        try:
+            messages = []
+            for method, params in requests:
+                message_id = self.request_id
+                self.request_id += 1
+                message_ids.append(message_id)
                 
+                future = loop.create_future()
+                self._response_handlers[message_id] = future
+                futures.append(future)
+                messages.append(make_request(message_id, method, params))
+            
+            await self._write_message(messages)
+            for message_id, (method, params) in zip(message_ids, requests):
+                self._pending_requests[message_id] = (method, params)
+            self.logger.debug(f"Sent MCP batch of {count} requests (IDs: {message_ids[0]}-{message_ids[-1]})")
+            
+            done, pending = await asyncio.wait(futures, timeout=max(0.0, deadline - loop.time()))
+            if pending:
+                self.logger.error(f"Batch timeout: {len(pending)} of {count} responses missing")
+            
+            return [future.result() if future in done and not future.cancelled() and future.exception() is None
+                    else None for future in futures]
+            
         except Exception as e:
-            self.logger.error(f"Failed to send request {method}: {e}")
-            return None
+            self.logger.error(f"Failed to send batch: {e}")
+            return [None] * count
+        finally:
+            for message_id, future in zip(message_ids, futures):
+                self._response_handlers.pop(message_id, None)
+                self._finish_request(message_id, answered=future.done() and not future.cancelled())
+            self._window.release(count)
+    
+    async def _probe_batch_support(self) -> bool:
+        """
+        Send a one-element ping batch to learn whether the server accepts batches
+        
+        Returns:
+            True if the server answered with a response array
+        """
+        message_id = self.request_id
+        self.request_id += 1
+        
+        future = asyncio.get_running_loop().create_future()
+        self._response_handlers[message_id] = future
+        self._batch_probe_id = message_id
+        
+        try:
+            await self._write_message([make_request(message_id, "ping", {})])
+            await asyncio.wait_for(future, timeout=DEFAULT_BATCH_PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Batch probe failed: {e}")
+        finally:
+            self._response_handlers.pop(message_id, None)
+            self._batch_probe_id = None
+        
+        supported = self._batch_supported is True
+        self.logger.info(f"JSON-RPC batches {'supported' if supported else 'not supported'} by {self.server_name}")
+        return supported
+    
+    @property
+    def outstanding_requests(self) -> int:
+        """Requests awaiting a response plus those queued for the window"""
+        return self._window.in_flight + self._window.queue_depth
+    
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """
+        Get in-flight window counters for this connection
+        
+        Returns:
+            Dictionary with queue depth, window utilization and peaks
+        """
+        stats = self._window.get_stats()
+        stats['server_name'] = self.server_name
+        stats['pending_responses'] = len(self._response_handlers)
+        stats['reconnects'] = self.reconnect_count
+        return stats
     
     async def send_notification(self, method: str, params: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -217,25 +1115,12 @@ class RealMCPClient:
         Returns:
             True if sent successfully, False otherwise
         """
-        if not self.is_connected or not self.process:
+        if not self.is_connected or not self._transport_open:
             self.logger.error("Cannot send notification: not connected")
             return False
         
         try:
-            message = MCPMessage(
-                method=method,
-                params=params
-            )
-            
-            # Remove ID for notifications
-            message_dict = asdict(message)
-            message_dict.pop('id', None)
-            message_dict.pop('result', None)
-            message_dict.pop('error', None)
-            
-            message_json = json.dumps(message_dict) + "\n"
-            self.process.stdin.write(message_json)
-            self.process.stdin.flush()
+            await self._write_message(make_notification(method, params))
             
             self.logger.debug(f"Sent MCP notification: {method}")
             return True
@@ -244,48 +1129,292 @@ class RealMCPClient:
             self.logger.error(f"Failed to send notification {method}: {e}")
             return False
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get list of tools from MCP server via real protocol call
         
+        The catalogue is served from memory, or from the persistent catalogue
+        cache (refreshed in the background), before asking the server.
+        
+        Args:
+            refresh: Skip the caches and fetch tools/list from the server
+        
         Returns:
             List of tool definitions
         """
-        if not self.is_initialized:
+        if not self.is_initialized and not self._reconnect_pending():
             self.logger.error("Cannot list tools: server not initialized")
             return []
         
+        if not refresh:
+            if self._tools_cache is not None:
+                return self._tools_cache
+            
+            if self._catalog_cache and self.endpoint:
+                entry = self._catalog_cache.get(self.endpoint, server_version(self.server_info))
+                if entry is not None:
+                    self._tools_cache = entry["tools"]
+                    self.logger.info(f"✅ Loaded {len(self._tools_cache)} cached tools for {self.server_name}")
+                    self._schedule_tools_refresh()
+                    return self._tools_cache
+        
+        return await self._fetch_tools()
+    
+    async def _fetch_tools(self) -> List[Dict[str, Any]]:
+        """Request tools/list from the server and update both caches"""
         try:
-            response = await self.send_request("tools/list", {})
+            tools = await self._list_all("tools/list")
             
-            if response and "result" in response:
-                tools = response["result"].get("tools", [])
+            if tools is not None:
                 self._tools_cache = tools
+                if self._catalog_cache and self.endpoint:
+                    self._catalog_cache.put(self.endpoint, server_version(self.server_info), tools)
                 self.logger.info(f"✅ Discovered {len(tools)} tools from {self.server_name}")
                 return tools
             else:
-                self.logger.error(f"Failed to list tools: {response}")
                 return []
                 
         except Exception as e:
             self.logger.error(f"Failed to list tools: {e}")
             return []
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _schedule_tools_refresh(self):
+        """Refresh the tool catalogue in the background unless already running"""
+        if self._tools_refresh_task is None or self._tools_refresh_task.done():
+            self._tools_refresh_task = asyncio.create_task(self._fetch_tools())
+    
+    def _invalidate_tools(self):
+        """Forget the cached catalogue after the server reports a change"""
+        self._tools_cache = None
+        if self._catalog_cache and self.endpoint:
+            self._catalog_cache.invalidate(self.endpoint)
+        if self.is_initialized:
+            self._schedule_tools_refresh()
+    
+    async def list_page(self, method: str,
+                        cursor: Optional[str] = None) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """
+        Fetch one page of a paginated list
+        
+        Args:
+            method: tools/list, resources/list, resources/templates/list or prompts/list
+            cursor: nextCursor from the previous page (first page if omitted)
+            
+        Returns:
+            (items, next cursor or None on the last page), or None if failed
+        """
+        response = await self.send_request(method, {"cursor": cursor} if cursor else {})
+        if not response or "result" not in response:
+            self.logger.error(f"Failed to {method} on {self.server_name}: {response}")
+            return None
+        result = response["result"]
+        return result.get(LIST_RESULT_KEYS[method], []), result.get("nextCursor")
+    
+    async def _list_all(self, method: str) -> Optional[List[Dict[str, Any]]]:
+        """Follow nextCursor through every page of a list (None if any page failed)"""
+        items: List[Dict[str, Any]] = []
+        cursor = None
+        for _ in range(MAX_LIST_PAGES):
+            page = await self.list_page(method, cursor)
+            if page is None:
+                # A partial list must not pass for the full one
+                return None
+            items.extend(page[0])
+            cursor = page[1]
+            if not cursor:
+                return items
+        self.logger.error(f"{method} on {self.server_name} still paginating after {MAX_LIST_PAGES} pages")
+        return None
+    
+    async def list_resources(self) -> List[Dict[str, Any]]:
+        """
+        Get every resource the server offers, across all pages
+        
+        Returns:
+            List of resource descriptions
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot list resources: server not initialized")
+            return []
+        return await self._list_all("resources/list") or []
+    
+    async def list_resource_templates(self) -> List[Dict[str, Any]]:
+        """
+        Get every resource template the server offers, across all pages
+        
+        Returns:
+            List of URI template descriptions
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot list resource templates: server not initialized")
+            return []
+        return await self._list_all("resources/templates/list") or []
+    
+    async def read_resource(self, uri: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Read a resource, from the resource cache when possible
+        
+        Args:
+            uri: Resource URI
+            use_cache: Answer from and store into the resource cache
+            
+        Returns:
+            Result with the resource ``contents``, or None if failed
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot read resource: server not initialized")
+            return None
+        
+        cache = self.resource_cache if use_cache else None
+        if cache is not None:
+            cached = cache.get(self.server_name, uri)
+            if cached is not None:
+                return cached
+            # Subscribe before reading so no update can slip in between
+            if self.supports_subscriptions and uri not in self._subscriptions:
+                await self.subscribe_resource(uri)
+        
+        generation = self._resource_generation(uri)
+        response = await self.send_request("resources/read", {"uri": uri})
+        if not response or "result" not in response:
+            self.logger.error(f"Failed to read resource {uri}: {response}")
+            return None
+        
+        result = response["result"]
+        if cache is not None and (uri in self._subscriptions or cache.ttl is not None):
+            # An update handled while the read was in flight may postdate these contents
+            if self._resource_generation(uri) == generation:
+                cache.put(self.server_name, uri, result)
+        return result
+    
+    def _resource_generation(self, uri: str) -> Tuple[int, int]:
+        """Change counters for one resource and for the server's resources as a whole"""
+        return self._resources_generation, self._resource_generations.get(uri, 0)
+    
+    @property
+    def supports_subscriptions(self) -> bool:
+        """Whether the server can notify about changed resources"""
+        return bool(self.capabilities and self.capabilities.resources.get("subscribe"))
+    
+    async def subscribe_resource(self, uri: str) -> bool:
+        """
+        Ask the server to send notifications/resources/updated for a URI
+        
+        Args:
+            uri: Resource URI
+            
+        Returns:
+            True if the subscription was accepted
+        """
+        response = await self.send_request("resources/subscribe", {"uri": uri})
+        if not response or "result" not in response:
+            self.logger.warning(f"Failed to subscribe to {uri} on {self.server_name}: {response}")
+            return False
+        self._subscriptions.add(uri)
+        return True
+    
+    async def unsubscribe_resource(self, uri: str) -> bool:
+        """
+        Stop update notifications for a URI and drop its cached contents
+        
+        Args:
+            uri: Resource URI
+            
+        Returns:
+            True if the server accepted the request
+        """
+        self._subscriptions.discard(uri)
+        if self.resource_cache is not None:
+            self.resource_cache.invalidate(self.server_name, uri)
+        response = await self.send_request("resources/unsubscribe", {"uri": uri})
+        return bool(response and "result" in response)
+    
+    async def list_prompts(self) -> List[Dict[str, Any]]:
+        """
+        Get every prompt the server offers, across all pages
+        
+        Returns:
+            List of prompt descriptions
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot list prompts: server not initialized")
+            return []
+        return await self._list_all("prompts/list") or []
+    
+    async def get_prompt(self, name: str, arguments: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Render a prompt
+        
+        Args:
+            name: Prompt name
+            arguments: Prompt arguments
+            
+        Returns:
+            Result with the prompt ``messages``, or None if failed
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot get prompt: server not initialized")
+            return None
+        
+        params: Dict[str, Any] = {"name": name}
+        if arguments:
+            params["arguments"] = arguments
+        response = await self.send_request("prompts/get", params)
+        if not response or "result" not in response:
+            self.logger.error(f"Failed to get prompt {name}: {response}")
+            return None
+        return response["result"]
+    
+    def add_notification_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """
+        Receive every notification the server sends
+        
+        Args:
+            listener: Called with each notification message, on the reader task
+        """
+        self._notification_listeners.append(listener)
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any],
+                        timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Execute tool via real MCP protocol call
         
         Args:
             name: Tool name
             arguments: Tool arguments
+            timeout: Override for this call's timeout in seconds
             
         Returns:
             Tool execution result or None if failed
         """
-        if not self.is_initialized:
+        if not self.is_initialized and not self._reconnect_pending():
             self.logger.error("Cannot call tool: server not initialized")
             return None
         
+        if self.result_cache:
+            cached = self.result_cache.get(self.server_name, name, arguments)
+            if cached is not None:
+                self.logger.debug(f"Tool '{name}' answered from result cache")
+                return cached
+        
+        if self.single_flight and self.single_flight.applies_to(self.server_name, name):
+            return await self.single_flight.call(
+                self.server_name, name, arguments,
+                lambda: self._call_tool(name, arguments, timeout)
+            )
+        return await self._call_tool(name, arguments, timeout)
+    
+    async def _call_tool(self, name: str, arguments: Dict[str, Any],
+                         timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Send one tools/call request, unwrap its result and cache it if allowed"""
+        result = await self._send_tool_call(name, arguments, timeout)
+        if self.result_cache and result is not None:
+            self.result_cache.put(self.server_name, name, arguments, result)
+        return result
+    
+    async def _send_tool_call(self, name: str, arguments: Dict[str, Any],
+                              timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Send one tools/call request and unwrap its result"""
         try:
             params = {
                 "name": name,
@@ -293,7 +1422,7 @@ class RealMCPClient:
             }
             
             self.logger.info(f"Calling tool '{name}' with args: {arguments}")
-            response = await self.send_request("tools/call", params)
+            response = await self.send_request("tools/call", params, timeout=timeout)
             
             if response and "result" in response:
                 result = response["result"]
@@ -307,29 +1436,473 @@ class RealMCPClient:
             self.logger.error(f"Failed to call tool '{name}': {e}")
             return None
     
-    async def _read_responses(self):
-        """Background task to read and handle responses from the server"""
-        if not self.process or not self.process.stdout:
+    async def call_tool_stream(self, name: str, arguments: Dict[str, Any],
+                               timeout: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute tool and yield its result content items as they are parsed
+        
+        With ``streaming`` enabled each item is decoded and yielded as soon
+        as it is complete on the wire; otherwise the whole response is
+        awaited first and its items are yielded afterwards.
+        
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            timeout: Longest wait for the next item (defaults to the adaptive
+                timeout, or request_timeout without a latency tracker)
+            
+        Yields:
+            Entries of the tool result's ``content`` list
+        """
+        if not self.is_initialized and not self._reconnect_pending():
+            self.logger.error("Cannot call tool: server not initialized")
+            return
+        
+        if not self.streaming:
+            result = await self.call_tool(name, arguments, timeout=timeout)
+            for item in (result or {}).get("content", []):
+                yield item
             return
         
+        if timeout is None:
+            timeout = self.get_timeout("tools/call", name)
+        
+        breaker = self.circuit_breaker
+        ticket = breaker.allow() if breaker else None
+        if breaker and ticket is None:
+            self.logger.error(f"Circuit open for {self.server_name}, refusing tools/call")
+            return
+        
+        deadline = time.monotonic() + timeout
+        outcome_recorded = False
         try:
-            while self.is_connected and self.process.poll() is None:
-                line = self.process.stdout.readline()
-                if not line:
-                    break
+            async with AsyncExitStack() as admitted:
+                if self.admission is not None:
+                    # Held for the whole stream, like a request in _send_admitted
+                    await admitted.enter_async_context(
+                        self.admission.admit(self.server_name, "tools/call", name, deadline))
+                
+                if self._reconnect_pending() and not await self._wait_reconnected():
+                    self.logger.error(f"Cannot call tool: {self.server_name} could not be restarted")
+                    if breaker:
+                        breaker.record_failure(ticket=ticket)
+                        outcome_recorded = True
+                    return
+                
+                message_id = self.request_id
+                self.request_id += 1
                 
                 try:
-                    message = json.loads(line.strip())
-                    await self._handle_message(message)
-                except json.JSONDecodeError as e:
-                    self.logger.warning(f"Invalid JSON received: {line.strip()}")
-                except Exception as e:
-                    self.logger.error(f"Error handling message: {e}")
+                    await asyncio.wait_for(self._window.acquire(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    self.logger.error(f"Request timeout: tools/call (ID: {message_id})")
+                    if breaker:
+                        breaker.record_failure(timeout=True, ticket=ticket)
+                        outcome_recorded = True
+                    return
+                
+                queue: asyncio.Queue = asyncio.Queue()
+                self._stream_queues[message_id] = queue
+                answered = False
+                
+                try:
+                    self.logger.info(f"Streaming tool '{name}' with args: {arguments}")
+                    params = {
+                        "name": name,
+                        "arguments": arguments
+                    }
+                    await self._write_message(make_request(message_id, "tools/call", params))
+                    self._pending_requests[message_id] = ("tools/call", params)
                     
+                    while True:
+                        event, value = await asyncio.wait_for(queue.get(), timeout=timeout)
+                        if event == EVENT_ITEM:
+                            yield value
+                            continue
+                        
+                        answered = True
+                        if "error" in value:
+                            self.logger.error(f"Tool call failed: {value}")
+                        else:
+                            self.logger.info(f"✅ Tool '{name}' streamed successfully")
+                        error = value.get("error")
+                        # A stream the client cancelled says nothing about the server
+                        if breaker and not (isinstance(error, dict) and error.get("code") == REQUEST_CANCELLED):
+                            if self._is_server_failure(value):
+                                breaker.record_failure(ticket=ticket)
+                            else:
+                                breaker.record_success(ticket)
+                            outcome_recorded = True
+                        return
+                        
+                except asyncio.TimeoutError:
+                    self.logger.error(f"Stream timeout: tools/call (ID: {message_id})")
+                    if breaker:
+                        breaker.record_failure(timeout=True, ticket=ticket)
+                        outcome_recorded = True
+                except Exception as e:
+                    self.logger.error(f"Failed to stream tool '{name}': {e}")
+                    if breaker:
+                        breaker.record_failure(ticket=ticket)
+                        outcome_recorded = True
+                finally:
+                    self._stream_queues.pop(message_id, None)
+                    self._finish_request(message_id, answered=answered)
+                    self._window.release()
+        except RateLimitExceeded as e:
+            self.logger.error(f"Request not admitted: tools/call '{name}': {e}")
+        finally:
+            if breaker and not outcome_recorded:
+                breaker.release(ticket)
+    
+    async def _write_message(self, message: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """Write one newline-delimited JSON-RPC message (or batch) and drain the pipe"""
+        data = self.codec.encode_line(message)
+        
+        if self._http is not None:
+            if isinstance(message, dict) and "id" not in message:
+                # Notifications are acknowledged at once; waiting keeps them
+                # ordered before later requests (notifications/initialized)
+                await self._post_http(data, message)
+                return
+            # Each request is its own POST; the answer is read by a background task
+            task = asyncio.create_task(self._post_http(data, message))
+            key = message.get("id", task) if isinstance(message, dict) else task
+            self._http_posts[key] = task
+            task.add_done_callback(lambda _: self._http_posts.get(key) is task and self._http_posts.pop(key))
+            if self.recorder:
+                self.recorder.request_sent(message)
+            return
+        
+        # Serialise writers so concurrent requests never interleave bytes
+        # and only one coroutine waits on drain() at a time
+        async with self._write_lock:
+            self._writer.write(data)
+            if self.recorder:
+                self.recorder.request_sent(message)
+            await self._writer.drain()
+    
+    async def _read_responses(self):
+        """Background task to read and handle responses from the server"""
+        if self._reader is None:
+            return
+        
+        try:
+            if self.streaming:
+                await self._read_frames_incrementally()
+            else:
+                await self._read_lines()
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"Error in response reader: {e}")
         finally:
             self.logger.debug("Response reader task ended")
+        
+        self._connection_lost("server closed its output")
+    
+    async def _post_http(self, data: bytes, message: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """POST one message and dispatch whatever the server answers with"""
+        from .http_transport import HTTPRequestFailed, MCPSessionExpired
+        
+        try:
+            frames = self._http.post(data, incremental=self.streaming)
+            if self.streaming:
+                await self._read_frames_incrementally(frames)
+            else:
+                async for frame in frames:
+                    await self._dispatch_frame(frame)
+        except MCPSessionExpired:
+            self._connection_lost("HTTP session expired")
+        except HTTPRequestFailed as e:
+            # Only the requests in this POST failed; answer them with the HTTP error
+            code = INTERNAL_ERROR if e.status >= 500 else INVALID_REQUEST
+            for request in message if isinstance(message, list) else [message]:
+                if "id" in request:
+                    await self._handle_message({
+                        "jsonrpc": "2.0", "id": request["id"],
+                        "error": {"code": code, "message": str(e)}
+                    })
+        except ConnectionError as e:
+            self._connection_lost(f"HTTP request failed: {e}")
+    
+    async def _listen_http(self):
+        """Dispatch notifications from the session's server message stream"""
+        from .http_transport import MCPSessionExpired
+        
+        while self.is_connected and not self._closing:
+            try:
+                received = False
+                async for frame in self._http.listen():
+                    received = True
+                    await self._dispatch_frame(frame)
+                if not received:
+                    # The server offers no stream (or closed it straight away)
+                    return
+            except MCPSessionExpired:
+                self._connection_lost("HTTP session expired")
+                return
+            except ConnectionError as e:
+                self.logger.debug(f"Server message stream of {self.server_name} dropped: {e}")
+            await asyncio.sleep(HTTP_LISTEN_RETRY)
+    
+    async def _drain_stderr(self, process: asyncio.subprocess.Process):
+        """Read server stderr until EOF into the ring buffer (and the logger)"""
+        stream = process.stderr
+        while True:
+            line = await self._read_stderr_line(stream)
+            if not line:
+                break
+            self.stderr_buffer.append(line)
+            if self.stderr_log_level is not None:
+                self.logger.log(self.stderr_log_level,
+                                f"[{self.server_name}] {line.decode('utf-8', 'replace').rstrip()}")
+    
+    async def _read_stderr_line(self, stream: asyncio.StreamReader) -> bytes:
+        """
+        Read one stderr line, or the unterminated rest at EOF
+        
+        A line longer than the stream limit is read in pieces, keeping only
+        as much of its end as the ring buffer can hold. (readline() would
+        raise ValueError for it after discarding the buffered data.)
+        """
+        line = b""
+        while True:
+            try:
+                return line + await stream.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                return line + e.partial
+            except asyncio.LimitOverrunError as e:
+                chunk = await stream.read(e.consumed)
+                line = (line + chunk)[-self.stderr_buffer.max_bytes:]
+    
+    def get_stderr_tail(self, lines: int = 20) -> str:
+        """
+        Get the last lines the server wrote to stderr
+        
+        Args:
+            lines: Number of lines to return
+            
+        Returns:
+            Newline-joined lines, oldest first
+        """
+        return "\n".join(self.stderr_buffer.get_lines(lines))
+    
+    async def _watch_process(self, process: asyncio.subprocess.Process):
+        """Detect the server process exiting even if its stdout stays open"""
+        returncode = await process.wait()
+        if process is self.process:
+            self._connection_lost(f"process exited with code {returncode}")
+    
+    def _connection_lost(self, reason: str):
+        """Fail in-flight requests at once and start reconnecting if enabled"""
+        if not self.is_connected or self._closing:
+            return
+        
+        self.is_connected = False
+        self.is_initialized = False
+        self.logger.error(f"❌ Lost connection to {self.server_name}: {reason}")
+        tail = self.get_stderr_tail(5)
+        if tail:
+            self.logger.error(f"Last stderr output of {self.server_name}:\n{tail}")
+        self._record_health(False, None, None, reason)
+        self._stop_process()
+        
+        # Subscriptions die with the session, so cached contents can no longer be trusted
+        self._subscriptions.clear()
+        self._resources_generation += 1
+        if self.resource_cache is not None:
+            self.resource_cache.invalidate(self.server_name)
+        
+        # Requests waiting to be replayed need the reconnect future before they wake up
+        if self.auto_reconnect and not self._reconnect_pending():
+            self._reconnected = asyncio.get_running_loop().create_future()
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+        
+        error = MCPConnectionLost(f"{self.server_name}: {reason}")
+        self._pending_requests.clear()
+        handlers, self._response_handlers = self._response_handlers, {}
+        for future in handlers.values():
+            if not future.done():
+                future.set_exception(error)
+        for message_id, queue in self._stream_queues.items():
+            queue.put_nowait((EVENT_MESSAGE, {
+                "id": message_id,
+                "error": {"code": -32000, "message": f"Connection lost: {reason}"}
+            }))
+    
+    def _stop_process(self):
+        """Stop the I/O tasks of the current connection and kill its process or close its socket"""
+        current = asyncio.current_task()
+        for task in (self._reader_task, self._watcher_task):
+            if task and task is not current and not task.done():
+                task.cancel()
+        if self.transport == "http":
+            for task in list(self._http_posts.values()):
+                if task is not current:
+                    task.cancel()
+            self._http_posts.clear()
+        elif self.transport != "stdio":
+            if self._writer is not None:
+                self._writer.close()
+        elif self.process and self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+    
+    def _reconnect_pending(self) -> bool:
+        """Whether callers should wait for a reconnect that is in progress"""
+        return (self._reconnected is not None and not self._reconnected.done()
+                and _reconnecting_client.get() is not self)
+    
+    async def _wait_reconnected(self) -> bool:
+        """Wait for the reconnect in progress; False if there is none or it failed"""
+        if self._reconnected is None:
+            return False
+        return await asyncio.shield(self._reconnected)
+    
+    async def _reconnect(self):
+        """Respawn (or reconnect to) and re-initialize the server with exponential backoff"""
+        _reconnecting_client.set(self)
+        previous_version = server_version(self.server_info)
+        
+        for attempt in range(self.max_reconnect_attempts):
+            delay = min(MAX_RECONNECT_BACKOFF, self.reconnect_backoff * 2 ** attempt)
+            self.logger.info(f"Restarting {self.server_name} in {delay:.1f}s "
+                             f"(attempt {attempt + 1}/{self.max_reconnect_attempts})")
+            await asyncio.sleep(delay)
+            if self._closing:
+                break
+            
+            if await self._open_transport() and await self.send_initialize():
+                self.reconnect_count += 1
+                self._record_health(True, "initialize", None, None)
+                # The cached tool list survives the restart unless the server itself changed
+                if server_version(self.server_info) != previous_version:
+                    self._invalidate_tools()
+                self.logger.info(f"✅ Reconnected to {self.server_name}")
+                self._reconnected.set_result(True)
+                return
+            
+            self.is_connected = False
+            self._stop_process()
+        
+        self.logger.error(f"Giving up on restarting {self.server_name}")
+        self._reconnected.set_result(False)
+    
+    async def _read_lines(self):
+        """Read whole newline-delimited frames and decode each in one pass"""
+        while self.is_connected:
+            try:
+                line = await self._reader.readline()
+            except ValueError as e:
+                # Message exceeded read_limit; the stream cannot be resynchronised
+                self.logger.error(f"Message from {self.server_name} exceeds read limit: {e}")
+                break
+            if not line:
+                break
+            await self._dispatch_frame(line)
+    
+    async def _dispatch_frame(self, line: bytes):
+        """Decode one complete frame and dispatch it"""
+        # Blank keep-alive lines; the codecs ignore surrounding whitespace,
+        # so large frames are decoded without a stripped copy
+        if line.isspace():
+            return
+        
+        if self._cancelled_ids and self._is_late_response(line):
+            return
+        
+        try:
+            message = self.codec.decode(line)
+        except ValueError:
+            self.logger.warning(f"Invalid JSON received: {line[:200]!r}")
+            return
+        
+        await self._dispatch_message(message)
+    
+    async def _read_chunks(self) -> AsyncIterator[bytes]:
+        """Raw chunks from the server's output stream"""
+        while self.is_connected:
+            data = await self._reader.read(STREAM_CHUNK_SIZE)
+            if not data:
+                return
+            yield data
+    
+    async def _read_frames_incrementally(self, chunks: Optional[AsyncIterator[bytes]] = None):
+        """
+        Read raw chunks and route result content items as they are parsed
+        
+        Items for a streaming call go straight to its queue. Items for an
+        ordinary request are collected and put back into the response, and
+        items for a request nobody is waiting on any more are dropped.
+        """
+        parser = StreamingResponseParser(self.codec)
+        frame_id: Optional[Union[str, int]] = None
+        frame_items: List[Any] = []
+        
+        async for data in chunks or self._read_chunks():
+            for event, value in parser.feed(data):
+                if event == EVENT_ITEM:
+                    queue = self._stream_queues.get(frame_id) if frame_id is not None else None
+                    if queue is not None:
+                        queue.put_nowait((EVENT_ITEM, value))
+                    elif frame_id is None or frame_id in self._response_handlers:
+                        frame_items.append(value)
+                
+                elif event == EVENT_ID:
+                    frame_id = value
+                    queue = self._stream_queues.get(frame_id)
+                    if queue is not None:
+                        # Items parsed before the ID was seen
+                        for item in frame_items:
+                            queue.put_nowait((EVENT_ITEM, item))
+                        frame_items = []
+                
+                elif event == EVENT_MESSAGE:
+                    message_id = value.get("id") if isinstance(value, dict) else None
+                    queue = self._stream_queues.get(message_id) if message_id is not None else None
+                    if queue is not None:
+                        for item in frame_items:
+                            queue.put_nowait((EVENT_ITEM, item))
+                        queue.put_nowait((EVENT_MESSAGE, value))
+                    else:
+                        if frame_items and message_id in self._response_handlers:
+                            value["result"]["content"] = frame_items
+                        await self._dispatch_message(value)
+                    frame_id = None
+                    frame_items = []
+                
+                elif event == EVENT_INVALID:
+                    self.logger.warning(f"Invalid JSON received: {value[:200]!r}")
+    
+    def _is_late_response(self, frame: bytes) -> bool:
+        """Check a raw frame's leading ID against cancelled requests without decoding it"""
+        match = _LEADING_ID.match(frame)
+        if match is None:
+            return False
+        try:
+            message_id = self.codec.decode(match.group(1))
+        except ValueError:
+            return False
+        if message_id not in self._cancelled_lookup:
+            return False
+        self.logger.debug(f"Dropped late response for cancelled request {message_id}")
+        return True
+    
+    async def _dispatch_message(self, message: Any):
+        """Hand a decoded frame (single message or batch array) to _handle_message"""
+        try:
+            if isinstance(message, list):
+                # Batch response: a server that answers with an array supports batches
+                self._batch_supported = True
+                for item in message:
+                    await self._handle_message(item)
+            else:
+                await self._handle_message(message)
+        except Exception as e:
+            self.logger.error(f"Error handling message: {e}")
     
     async def _handle_message(self, message: Dict[str, Any]):
         """Handle incoming message from server"""
@@ -338,93 +1911,241 @@ class RealMCPClient:
             
             if message_id is not None and message_id in self._response_handlers:
                 # This is a response to a request
+                if self.recorder:
+                    self.recorder.response_received(message)
                 future = self._response_handlers.pop(message_id)
                 if not future.done():
                     future.set_result(message)
+            elif message_id is not None and message_id in self._cancelled_lookup:
+                self.logger.debug(f"Dropped late response for cancelled request {message_id}")
+            elif message_id is None and "error" in message and self._batch_probe_id in self._response_handlers:
+                # Error without an ID while probing: the server rejected the batch itself
+                future = self._response_handlers.pop(self._batch_probe_id)
+                if not future.done():
+                    future.set_result(message)
             else:
                 # This is a notification or unexpected message
                 method = message.get("method")
-                if method:
-                    self.logger.debug(f"Received notification: {method}")
-                else:
+                if not method:
                     self.logger.debug(f"Received unexpected message: {message}")
+                    return
+                
+                if method == "notifications/tools/list_changed":
+                    self.logger.info(f"Tool list changed on {self.server_name}, refreshing catalogue")
+                    self._invalidate_tools()
+                elif method == "notifications/resources/updated":
+                    uri = (message.get("params") or {}).get("uri")
+                    self.logger.debug(f"Resource {uri} changed on {self.server_name}")
+                    if uri:
+                        self._resource_generations[uri] = self._resource_generations.get(uri, 0) + 1
+                        if self.resource_cache is not None:
+                            self.resource_cache.invalidate(self.server_name, uri)
+                elif method == "notifications/resources/list_changed":
+                    self.logger.debug(f"Resource list changed on {self.server_name}")
+                    self._resources_generation += 1
+                    if self.resource_cache is not None:
+                        self.resource_cache.invalidate(self.server_name)
+                else:
+                    self.logger.debug(f"Received notification: {method}")
+                for listener in self._notification_listeners:
+                    listener(message)
                     
         except Exception as e:
             self.logger.error(f"Error handling message: {e}")
     
-    async def health_check(self) -> bool:
+    async def health_check(self, timeout: float = DEFAULT_HEALTH_TIMEOUT) -> bool:
         """
         Check if the MCP server is healthy and responsive
         
+        Sends ``ping``; servers that answer it with "method not found" are
+        remembered and probed with tools/list instead. The outcome is stored
+        in ``health``.
+        
+        Args:
+            timeout: Seconds to wait for the probe response
+            
         Returns:
             True if server is healthy, False otherwise
         """
-        if not self.is_connected or not self.process:
-            return False
+        if not self.is_connected or not self._transport_open:
+            return self._record_health(False, None, None, "not connected")
         
         # Check if process is still running
-        if self.process.poll() is not None:
+        if self.process and self.process.returncode is not None:
             self.logger.warning(f"MCP server process has terminated")
-            return False
+            return self._record_health(False, None, None, f"process exited ({self.process.returncode})")
         
+        method = "tools/list" if self._ping_supported is False else "ping"
+        started = time.monotonic()
         try:
-            # Send a simple ping request (list tools is a good health check)
-            response = await self.send_request("tools/list", {})
-            return response is not None and "result" in response
+            response = await self._send_request(method, {}, timeout, counted=False)
+            if method == "ping" and response and response.get("error", {}).get("code") == METHOD_NOT_FOUND:
+                self.logger.info(f"{self.server_name} does not support ping, probing with tools/list")
+                self._ping_supported = False
+                method = "tools/list"
+                response = await self._send_request(method, {}, timeout, counted=False)
+            elif method == "ping" and response is not None:
+                self._ping_supported = True
         except Exception as e:
             self.logger.error(f"Health check failed: {e}")
-            return False
+            return self._record_health(False, method, None, str(e))
+        
+        if response is None:
+            return self._record_health(False, method, None, "no response")
+        # Any other reply, even an error, shows the server is reading and answering
+        return self._record_health(True, method, time.monotonic() - started, None)
     
-    async def close(self):
-        """Clean up connection and terminate server process"""
+    def _record_health(self, healthy: bool, method: Optional[str],
+                       latency: Optional[float], error: Optional[str]) -> bool:
+        """Store the outcome of a health probe"""
+        failures = 0 if healthy else self.health.consecutive_failures + 1
+        self.health = HealthStatus(healthy, time.monotonic(), latency, method, failures, error)
+        return healthy
+    
+    @property
+    def is_healthy(self) -> bool:
+        """Cached health from the last probe, without contacting the server"""
+        return self.health.healthy and self.is_connected
+    
+    def start_health_checks(self, interval: float = DEFAULT_HEALTH_INTERVAL,
+                            jitter: float = DEFAULT_HEALTH_JITTER,
+                            timeout: float = DEFAULT_HEALTH_TIMEOUT):
+        """
+        Probe the server periodically in the background
+        
+        Args:
+            interval: Mean seconds between probes
+            jitter: Fraction of the interval to randomise each wait by, so
+                probes to many servers do not line up
+            timeout: Seconds to wait for each probe
+        """
+        self.stop_health_checks()
+        self._health_task = asyncio.create_task(self._health_loop(interval, jitter, timeout))
+    
+    def stop_health_checks(self):
+        """Stop the background health probes"""
+        if self._health_task and not self._health_task.done():
+            self._health_task.cancel()
+        self._health_task = None
+    
+    async def _health_loop(self, interval: float, jitter: float, timeout: float):
+        """Run health_check forever with jittered waits"""
+        # Random initial offset spreads the first round of probes across the interval
+        await asyncio.sleep(random.uniform(0, interval))
+        while not self._closing:
+            healthy = await self.health_check(timeout)
+            if not healthy and self.health.consecutive_failures == 1:
+                self.logger.warning(f"Health check failed for {self.server_name}: {self.health.error}")
+            await asyncio.sleep(interval * random.uniform(1 - jitter, 1 + jitter))
+    
+    async def close(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT, deadline: Optional[float] = None):
+        """
+        Clean up connection and terminate server process
+        
+        The server is sent SIGTERM before anything else is awaited and its
+        exit is awaited directly; it is killed if still running at the
+        deadline.
+        
+        Args:
+            timeout: Seconds the server is given to exit
+            deadline: time.monotonic() value to use instead of ``timeout``,
+                shared by a fleet of clients (see close_clients)
+        """
+        if deadline is None:
+            deadline = time.monotonic() + timeout
         try:
+            self._closing = True
             self.is_connected = False
             self.is_initialized = False
             
-            # Cancel reader task
-            if self._reader_task and not self._reader_task.done():
-                self._reader_task.cancel()
+            process, self.process = self.process, None
+            if process is not None and process.returncode is None:
                 try:
-                    await self._reader_task
-                except asyncio.CancelledError:
+                    process.terminate()
+                except ProcessLookupError:
+                    # Process already exited
                     pass
             
-            # Clean up pending response handlers
+            if self._reconnected is not None and not self._reconnected.done():
+                self._reconnected.set_result(False)
+            
+            # Cancel reader, stderr, watcher, reconnect, catalogue refresh and health tasks
+            for task in (self._reader_task, self._stderr_task, self._watcher_task, self._reconnect_task,
+                         self._tools_refresh_task, self._health_task):
+                if task and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+            
+            # Drop cancellation notices still queued; the session is ending anyway
+            background = list(self._background_tasks)
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            self._background_tasks.clear()
+            
+            # Fail pending requests; their callers get None rather than a stray CancelledError
+            error = MCPConnectionLost(f"{self.server_name}: client closed")
             for future in self._response_handlers.values():
                 if not future.done():
-                    future.cancel()
+                    future.set_exception(error)
             self._response_handlers.clear()
+            self._pending_requests.clear()
+            
+            self._subscriptions.clear()
+            if self.resource_cache is not None:
+                self.resource_cache.invalidate(self.server_name)
             
-            # Terminate process
-            if self.process:
+            if process is not None:
+                # Wait for graceful shutdown
                 try:
-                    self.process.terminate()
-                    
-                    # Wait for graceful shutdown
+                    await asyncio.wait_for(process.wait(), timeout=max(0.0, deadline - time.monotonic()))
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"{self.server_name} didn't terminate gracefully, killing...")
                     try:
-                        await asyncio.wait_for(
-                            asyncio.create_task(self._wait_for_process()),
-                            timeout=5.0
-                        )
-                    except asyncio.TimeoutError:
-                        self.logger.warning("Process didn't terminate gracefully, killing...")
-                        self.process.kill()
-                        
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
                 except Exception as e:
                     self.logger.error(f"Error terminating process: {e}")
-                finally:
-                    self.process = None
+            elif self._writer is not None:
+                self._writer.close()
+                try:
+                    await asyncio.wait_for(self._writer.wait_closed(),
+                                           timeout=max(0.0, deadline - time.monotonic()))
+                except (asyncio.TimeoutError, OSError):
+                    pass
+            elif self._http is not None:
+                for task in list(self._http_posts.values()):
+                    task.cancel()
+                self._http_posts.clear()
+                await self._http.aclose()
+                self._http = None
+            self._reader = self._writer = None
             
             self.logger.info(f"✅ MCP client connection closed: {self.server_name}")
             
         except Exception as e:
             self.logger.error(f"Error closing MCP client: {e}")
+
+
+async def close_clients(clients: Iterable[RealMCPClient], timeout: float = DEFAULT_SHUTDOWN_TIMEOUT):
+    """
+    Close many clients at once under one shared deadline
+    
+    Every server is sent SIGTERM in the same pass and all exits are
+    awaited together, so shutdown takes as long as the slowest server
+    (at most ``timeout``) rather than the sum of them.
     
-    async def _wait_for_process(self):
-        """Wait for process to terminate"""
-        if self.process:
-            while self.process.poll() is None:
-                await asyncio.sleep(0.1)
+    Args:
+        clients: Clients to close
+        timeout: Seconds every server is given to exit before it is killed
+    """
+    deadline = time.monotonic() + timeout
+    await asyncio.gather(*[client.close(deadline=deadline) for client in clients], return_exceptions=True)
 
 
 def asdict(obj):
@@ -0,0 +1,257 @@
+"""
+MCP Session Record and Replay
+
+This module captures the JSON-RPC exchanges of a live RealMCPClient
+session, with their latencies, to a compact JSON-lines file (gzip when the
+name ends in .gz), and serves them back from a small stdio replay server.
+Pointing a client at the replay server gives reproducible offline runs of
+the whole client -> chainer -> executor path at the recorded speed, scaled
+or as fast as possible.
+
+Run the replay server with:
+    python -m autonomous_mcp.replay RECORDING [--speed FACTOR | --max-speed]
+"""
+
+import argparse
+import asyncio
+import gzip
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+from .codec import JSONCodec, get_codec
+from .single_flight import canonical_arguments
+
+
+RECORDING_FORMAT = "mcp-recording"
+RECORDING_VERSION = 1
+
+# JSON-RPC error code for a request that has no recorded response
+NOT_RECORDED = -32601
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    """Open a recording, compressed if the name ends in .gz"""
+    return gzip.open(path, mode) if path.suffix == ".gz" else open(path, mode)
+
+
+def exchange_key(method: str, params: Optional[Dict[str, Any]]) -> str:
+    """Match key for a request: method plus canonical params"""
+    return f"{method} {canonical_arguments(params)}"
+
+
+class SessionRecorder:
+    """
+    Writes every answered request of a client session to a recording
+
+    Each line after the header holds one exchange: the offset of the
+    request from the start of the session, its latency, the method and
+    params, and the result or error. Pass the recorder to RealMCPClient as
+    ``recorder``; responses to streamed calls are not recorded, and neither
+    are requests the client gave up on (timed out, cancelled, or lost in a
+    crash).
+    """
+
+    def __init__(self, path: Union[str, Path], server_name: str = "",
+                 codec: Optional[JSONCodec] = None):
+        self.path = Path(path)
+        self.codec = codec or get_codec()
+        self.exchanges = 0
+        self._started = time.monotonic()
+        self._pending: Dict[Union[str, int], Tuple[float, str, Optional[Dict[str, Any]]]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = _open(self.path, "wb")
+        self._file.write(self.codec.encode_line({
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "server": server_name,
+            "recorded_at": time.time()
+        }))
+
+    def request_sent(self, message: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """Note the send time of a request (or each request of a batch)"""
+        now = time.monotonic()
+        for request in message if isinstance(message, list) else [message]:
+            if "id" in request and "method" in request:
+                self._pending[request["id"]] = (now, request["method"], request.get("params"))
+
+    def response_received(self, message: Dict[str, Any]):
+        """Write the exchange a response completes"""
+        pending = self._pending.pop(message.get("id"), None)
+        if pending is None or self._file is None:
+            return
+        sent_at, method, params = pending
+        exchange = {
+            "t": round(sent_at - self._started, 6),
+            "latency": round(time.monotonic() - sent_at, 6),
+            "method": method,
+            "params": params
+        }
+        if "error" in message:
+            exchange["error"] = message["error"]
+        else:
+            exchange["result"] = message.get("result")
+        self._file.write(self.codec.encode_line(exchange))
+        self.exchanges += 1
+
+    def request_abandoned(self, message_id: Union[str, int]):
+        """Forget a request that will not get a response worth recording"""
+        self._pending.pop(message_id, None)
+
+    def close(self):
+        """Finish the recording file"""
+        self._pending.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Recording:
+    """A loaded recording: header plus exchanges in request order"""
+
+    def __init__(self, header: Dict[str, Any], exchanges: List[Dict[str, Any]]):
+        self.header = header
+        self.exchanges = exchanges
+
+    @classmethod
+    def load(cls, path: Union[str, Path], codec: Optional[JSONCodec] = None) -> "Recording":
+        """
+        Read a recording file
+
+        Raises:
+            ValueError: If the file is not an MCP recording
+        """
+        codec = codec or get_codec()
+        with _open(Path(path), "rb") as f:
+            lines = [line for line in f if line.strip()]
+        if not lines:
+            raise ValueError(f"Empty recording: {path}")
+        header = codec.decode(lines[0])
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"Not an MCP recording: {path}")
+        return cls(header, [codec.decode(line) for line in lines[1:]])
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first request to the last response"""
+        return max((e["t"] + e["latency"] for e in self.exchanges), default=0.0)
+
+
+class ReplayServer:
+    """
+    Stdio MCP server that answers from a recording
+
+    Requests are matched by method and canonical params; repeated
+    identical requests cycle through their recorded responses in order.
+    Each response is delayed by its recorded latency divided by ``speed``
+    (no delay when ``speed`` is None). ping always answers and
+    unrecorded requests get a JSON-RPC error.
+    """
+
+    def __init__(self, recording: Recording, speed: Optional[float] = 1.0,
+                 codec: Optional[JSONCodec] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (None replays at maximum speed)")
+        self.recording = recording
+        self.speed = speed
+        self.codec = codec or get_codec()
+        self._responses: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._next: Dict[str, int] = defaultdict(int)
+        for exchange in recording.exchanges:
+            self._responses[exchange_key(exchange["method"], exchange.get("params"))].append(exchange)
+
+    def _lookup(self, method: str, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        key = exchange_key(method, params)
+        candidates = self._responses.get(key)
+        if not candidates and method == "initialize":
+            # Client info may differ between runs; any recorded handshake will do
+            candidates = [e for e in self.recording.exchanges if e["method"] == "initialize"]
+        if not candidates:
+            return None
+        index = self._next[key] % len(candidates)
+        self._next[key] += 1
+        return candidates[index]
+
+    async def _answer(self, request: Dict[str, Any], out: IO[bytes]):
+        method = request.get("method")
+        exchange = self._lookup(method, request.get("params"))
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request["id"]}
+
+        if exchange is None:
+            if method == "ping":
+                response["result"] = {}
+            else:
+                response["error"] = {"code": NOT_RECORDED, "message": f"No recorded response for {method}"}
+        else:
+            if self.speed is not None and exchange["latency"]:
+                await asyncio.sleep(exchange["latency"] / self.speed)
+            if "error" in exchange:
+                response["error"] = exchange["error"]
+            else:
+                response["result"] = exchange["result"]
+
+        out.write(self.codec.encode_line(response))
+        out.flush()
+
+    async def serve(self, stdin: IO[bytes] = None, stdout: IO[bytes] = None):
+        """Answer newline-delimited requests until stdin closes"""
+        stdin = stdin or sys.stdin
+        out = stdout or sys.stdout.buffer
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=64 * 1024 * 1024)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), stdin)
+
+        tasks = set()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.isspace():
+                continue
+            try:
+                message = self.codec.decode(line)
+            except ValueError:
+                continue
+            for request in message if isinstance(message, list) else [message]:
+                # Notifications need no answer
+                if isinstance(request, dict) and "id" in request and "method" in request:
+                    task = asyncio.create_task(self._answer(request, out))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def replay_command(path: Union[str, Path], speed: Optional[float] = 1.0) -> List[str]:
+    """
+    Command line that starts a replay server, for RealMCPClient.connect_stdio
+
+    Args:
+        path: Recording file
+        speed: Latency divisor (None for maximum speed)
+
+    Returns:
+        Command and arguments
+    """
+    command = [sys.executable, "-m", "autonomous_mcp.replay", str(path)]
+    return command + (["--max-speed"] if speed is None else ["--speed", str(speed)])
+
+
+def main():
+    """Run the replay server from the command line"""
+    parser = argparse.ArgumentParser(description="Serve a recorded MCP session over stdio")
+    parser.add_argument("recording", help="Recording file written by SessionRecorder")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Divide recorded latencies by this factor (default 1.0)")
+    parser.add_argument("--max-speed", action="store_true", help="Answer without any delay")
+    args = parser.parse_args()
+
+    server = ReplayServer(Recording.load(args.recording), None if args.max_speed else args.speed)
+    asyncio.run(server.serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Resource Content Cache
+
+This module keeps resources/read results in memory, keyed by server and
+URI, so agents that keep re-reading the same large documents are answered
+without a round-trip. Entries stay valid until the server reports the
+resource changed (``notifications/resources/updated`` for a subscribed
+URI) or, for servers that cannot notify, until an optional TTL expires.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
+
+from .codec import JSONCodec, get_codec
+
+
+# Default bounds for the cache
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+class ResourceCache:
+    """
+    LRU cache of resource contents keyed by (server, URI)
+
+    The cache is bounded by entry count and by the encoded size of the
+    contents; a single result larger than ``max_bytes`` is not stored.
+    ``ttl`` limits how long an entry is trusted without an update
+    notification (None trusts it until invalidated). Cached results are
+    shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None,
+                 codec: Optional[JSONCodec] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Most resources kept
+            max_bytes: Most encoded content bytes kept
+            ttl: Seconds an entry is trusted (None until invalidated)
+            codec: Codec used to size results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.codec = codec or get_codec()
+
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0,
+                       'expirations': 0, 'invalidations': 0, 'rejected': 0}
+
+    def get(self, server: str, uri: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached contents
+
+        Args:
+            server: Server name
+            uri: Resource URI
+
+        Returns:
+            Cached resources/read result, or None on a miss
+        """
+        key = (server, uri)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            self._stats['expirations'] += 1
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry[0]
+
+    def put(self, server: str, uri: str, result: Dict[str, Any]) -> bool:
+        """
+        Store a resources/read result
+
+        Args:
+            server: Server name
+            uri: Resource URI
+            result: Result with the resource contents
+
+        Returns:
+            True if the result was stored
+        """
+        size = len(self.codec.encode(result))
+        if size > self.max_bytes:
+            self._stats['rejected'] += 1
+            return False
+
+        key = (server, uri)
+        self._remove(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (result, expires_at, size)
+        self._bytes += size
+        self._stats['stores'] += 1
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._stats['evictions'] += 1
+        return True
+
+    def _remove(self, key: Tuple[str, str]) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def invalidate(self, server: str, uri: Optional[str] = None):
+        """
+        Drop cached contents
+
+        Args:
+            server: Server name
+            uri: Resource URI (every resource of the server if omitted)
+        """
+        if uri is not None:
+            if self._remove((server, uri)):
+                self._stats['invalidations'] += 1
+            return
+
+        for key in [key for key in self._entries if key[0] == server]:
+            self._remove(key)
+            self._stats['invalidations'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters and occupancy
+
+        Returns:
+            Dictionary with hits, misses, invalidations, entries and bytes held
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes
+        }
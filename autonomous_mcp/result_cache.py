@@ -0,0 +1,362 @@
+"""
+Tool Result Cache
+
+This module caches tools/call results of read-only tools (search, docs
+lookup, repository reads) for a per-tool time-to-live. The cache is an LRU
+bounded both by entry count and by the encoded size of the results, and
+can mirror its entries to disk so they survive an agent restart.
+"""
+
+import fnmatch
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Any
+
+from .codec import JSONCodec, get_codec
+from .single_flight import canonical_arguments
+
+
+# Default bounds for the in-memory cache
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_results_dir() -> Path:
+    """
+    Get the directory used for persisted tool results
+
+    Returns:
+        Path under the user's cache directory
+    """
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "autonomous-mcp-agent" / "tool_results"
+
+
+class _CacheEntry:
+    """One cached result with its expiry and encoded size"""
+
+    __slots__ = ("result", "expires_at", "size")
+
+    def __init__(self, result: Dict[str, Any], expires_at: float, size: int):
+        self.result = result
+        self.expires_at = expires_at
+        self.size = size
+
+
+class ToolResultCache:
+    """
+    TTL + LRU cache of tool results keyed by (server, tool, arguments)
+
+    Only tools with a TTL are cached: ``ttls`` maps a bare (``search``) or
+    namespaced (``docs.search``) tool name to seconds, and ``default_ttl``
+    applies to every other tool unless it is listed in ``uncacheable``.
+    Error results (``isError``) are never stored. Cached results are
+    shared between callers and must be treated as read-only.
+
+    With ``persist_dir`` every entry is also written there, one file per
+    key, and loaded back on a memory miss; entries evicted from memory are
+    removed from disk as well, so the directory obeys the same bounds.
+    Expired and unreadable files left by earlier runs are swept when the
+    cache is created, and the rest are trimmed to the bounds, oldest first.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: Optional[float] = None,
+                 uncacheable: Optional[Iterable[str]] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 persist_dir: Optional[Path] = None,
+                 codec: Optional[JSONCodec] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache
+
+        Args:
+            ttls: Seconds to keep results, per tool name
+            default_ttl: Seconds for tools not in ``ttls`` (None caches nothing else)
+            uncacheable: Tool names never cached
+            max_entries: Most results kept
+            max_bytes: Most encoded result bytes kept
+            persist_dir: Directory to mirror entries to, e.g. default_results_dir()
+                (memory only if omitted)
+            codec: Codec used to size and persist results
+            logger: Logger to use
+        """
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.uncacheable = set(uncacheable or [])
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.codec = codec or get_codec()
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0,
+                       'expirations': 0, 'disk_hits': 0, 'rejected': 0}
+
+        if self.persist_dir is not None:
+            self._sweep()
+
+    def ttl_for(self, server: str, tool: str) -> Optional[float]:
+        """
+        Get the TTL that applies to a tool
+
+        Args:
+            server: Server name
+            tool: Tool name on that server
+
+        Returns:
+            Seconds to cache results, or None if the tool is not cacheable
+        """
+        namespaced = f"{server}.{tool}"
+        if tool in self.uncacheable or namespaced in self.uncacheable:
+            return None
+        if namespaced in self.ttls:
+            return self.ttls[namespaced]
+        return self.ttls.get(tool, self.default_ttl)
+
+    @staticmethod
+    def _digest(text: str, length: int) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:length]
+
+    @classmethod
+    def make_key(cls, server: str, tool: str, arguments: Optional[Dict[str, Any]]) -> str:
+        """
+        Hash a server, tool and canonical arguments into a cache key
+
+        The key starts with short digests of the server and the tool name,
+        so the entries (and files) of one server or tool can be found
+        without reading them.
+        """
+        material = f"{server}\0{tool}\0{canonical_arguments(arguments)}"
+        return f"{cls._digest(server, 8)}-{cls._digest(tool, 8)}-{cls._digest(material, 40)}"
+
+    def _path(self, key: str) -> Path:
+        return self.persist_dir / f"{key}.json"
+
+    @classmethod
+    def _key_pattern(cls, server: Optional[str], tool: Optional[str]) -> str:
+        """Glob matching the keys of one server and/or tool"""
+        server_part = cls._digest(server, 8) if server is not None else "*"
+        tool_part = cls._digest(tool, 8) if tool is not None else "*"
+        return f"{server_part}-{tool_part}-*"
+
+    def get(self, server: str, tool: str, arguments: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result
+
+        Args:
+            server: Server name
+            tool: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Cached result, or None on a miss or for uncacheable tools
+        """
+        if self.ttl_for(server, tool) is None:
+            return None
+
+        key = self.make_key(server, tool, arguments)
+        entry = self._entries.get(key)
+        if entry is None and self.persist_dir is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._stats['disk_hits'] += 1
+
+        if entry is not None and entry.expires_at <= time.time():
+            self._stats['expirations'] += 1
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry.result
+
+    def put(self, server: str, tool: str, arguments: Optional[Dict[str, Any]],
+            result: Optional[Dict[str, Any]]) -> bool:
+        """
+        Store a result if the tool is cacheable and the call succeeded
+
+        Args:
+            server: Server name
+            tool: Tool name
+            arguments: Tool arguments
+            result: Tool result
+
+        Returns:
+            True if the result was stored
+        """
+        ttl = self.ttl_for(server, tool)
+        if ttl is None or result is None or result.get("isError"):
+            return False
+
+        encoded = self.codec.encode(result)
+        if len(encoded) > self.max_bytes:
+            self._stats['rejected'] += 1
+            return False
+
+        key = self.make_key(server, tool, arguments)
+        expires_at = time.time() + ttl
+        self._insert(key, _CacheEntry(result, expires_at, len(encoded)))
+        self._stats['stores'] += 1
+
+        if self.persist_dir is not None:
+            self._save(key, expires_at, encoded)
+        return True
+
+    def _insert(self, key: str, entry: _CacheEntry):
+        """Add an entry at the most-recent end and evict down to the bounds"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted_key, _ = next(iter(self._entries.items()))
+            self._remove(evicted_key)
+            self._stats['evictions'] += 1
+
+    def _remove(self, key: str):
+        """Drop an entry from memory and disk"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        if self.persist_dir is not None:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Failed to remove cached tool result: {e}")
+
+    def _read_file(self, path: Path) -> Optional[_CacheEntry]:
+        """
+        Decode a persisted entry, deleting the file if it is unusable
+
+        Truncated files and files in an older format count as a miss.
+        """
+        try:
+            with open(path, "rb") as f:
+                stored = self.codec.decode(f.read())
+            return _CacheEntry(stored["result"], float(stored["expires_at"]), int(stored["size"]))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Discarding unreadable cached tool result {path.name}: {e}")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+    def _load(self, key: str) -> Optional[_CacheEntry]:
+        """Read a persisted entry back into memory"""
+        entry = self._read_file(self._path(key))
+        if entry is not None:
+            self._insert(key, entry)
+        return entry
+
+    def _sweep(self):
+        """Drop expired, unreadable and surplus files left by earlier runs"""
+        if not self.persist_dir.is_dir():
+            return
+
+        now = time.time()
+        kept = []
+        try:
+            for path in self.persist_dir.iterdir():
+                if path.suffix not in (".json", ".tmp"):
+                    continue
+                # Interrupted writes and files named by an older key scheme
+                if path.suffix == ".tmp" or path.stem.count("-") != 2:
+                    path.unlink(missing_ok=True)
+                    continue
+                entry = self._read_file(path)
+                if entry is None:
+                    continue
+                if entry.expires_at <= now:
+                    path.unlink(missing_ok=True)
+                    self._stats['expirations'] += 1
+                    continue
+                kept.append((path.stat().st_mtime, path, entry.size))
+
+            # Newest files first; whatever does not fit the bounds goes
+            kept.sort(key=lambda item: item[0], reverse=True)
+            total = 0
+            for index, (_, path, size) in enumerate(kept):
+                total += size
+                if index >= self.max_entries or total > self.max_bytes:
+                    path.unlink(missing_ok=True)
+                    self._stats['evictions'] += 1
+        except OSError as e:
+            self.logger.warning(f"Failed to sweep cached tool results: {e}")
+
+    def _save(self, key: str, expires_at: float, encoded: bytes):
+        """Write an entry to disk atomically"""
+        try:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(b'{"expires_at":' + repr(expires_at).encode() +
+                        b',"size":' + str(len(encoded)).encode() + b',"result":' + encoded + b'}')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to persist tool result: {e}")
+
+    def invalidate(self, server: Optional[str] = None, tool: Optional[str] = None,
+                   arguments: Optional[Dict[str, Any]] = None):
+        """
+        Drop cached results, in memory and on disk
+
+        With server, tool and arguments one entry is dropped. Otherwise
+        every entry of the given server and/or tool is dropped, or the
+        whole cache if neither is given.
+
+        Args:
+            server: Server name
+            tool: Tool name
+            arguments: Tool arguments
+        """
+        if server is not None and tool is not None and arguments is not None:
+            self._remove(self.make_key(server, tool, arguments))
+            return
+
+        pattern = self._key_pattern(server, tool)
+        for key in list(self._entries):
+            if fnmatch.fnmatchcase(key, pattern):
+                self._remove(key)
+        if self.persist_dir is not None and self.persist_dir.is_dir():
+            for path in self.persist_dir.glob(f"{pattern}.json"):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    self.logger.warning(f"Failed to remove cached tool result: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters and occupancy
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries and bytes held
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes
+        }
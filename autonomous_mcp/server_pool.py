@@ -0,0 +1,335 @@
+"""
+MCP Server Process Pool
+
+This module runs several worker processes of the same MCP server command
+behind one client-like interface, so CPU-bound servers can use more than
+one core instead of serialising every tool call behind a single process.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Any
+
+from .real_mcp_client import RealMCPClient, MCPServerCapabilities, close_clients
+
+
+class MCPServerPool:
+    """
+    Pool of identical MCP server processes
+
+    Tool calls are routed to the worker with the fewest outstanding
+    requests. Every worker performs the mandatory initialize handshake, but
+    the pool keeps a single server_info/capabilities result and fetches
+    tools/list only once. Workers are added while the average backlog per
+    worker stays above ``scale_up_threshold`` and reaped after sitting idle
+    for ``idle_timeout`` seconds, never going below ``min_workers``.
+    Workers whose process has died are taken out of rotation and replaced.
+
+    Every worker carries the pool's ``server_name``, so admission limits,
+    result caching, single-flight, latency tracking and the circuit breaker
+    treat the pool as the one server it stands for; ``server#N`` labels
+    only tell the workers apart in logs and stats.
+    """
+
+    def __init__(self, server_name: str, command: List[str],
+                 env: Optional[Dict[str, str]] = None,
+                 min_workers: int = 1,
+                 max_workers: Optional[int] = None,
+                 scale_up_threshold: float = 4.0,
+                 idle_timeout: float = 60.0,
+                 logger: Optional[logging.Logger] = None,
+                 **client_options: Any):
+        """
+        Initialize the pool
+
+        Args:
+            server_name: Name of the pooled server
+            command: Command and arguments to start one worker
+            env: Environment variables for the worker processes
+            min_workers: Workers kept running at all times
+            max_workers: Upper bound on workers (defaults to CPU count)
+            scale_up_threshold: Average outstanding requests per worker that triggers growth
+            idle_timeout: Seconds a surplus worker may stay idle before it is reaped
+            logger: Logger to use
+            **client_options: Extra keyword arguments for each RealMCPClient
+        """
+        if min_workers < 1:
+            raise ValueError("min_workers must be at least 1")
+
+        self.server_name = server_name
+        self.command = command
+        self.env = env
+        self.min_workers = min_workers
+        self.max_workers = max(min_workers, max_workers or os.cpu_count() or 1)
+        self.scale_up_threshold = scale_up_threshold
+        self.idle_timeout = idle_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.client_options = client_options
+
+        self.workers: List[RealMCPClient] = []
+        self.server_info: Optional[Dict[str, Any]] = None
+        self.capabilities: Optional[MCPServerCapabilities] = None
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._last_used: Dict[int, float] = {}
+        self._labels: Dict[int, str] = {}
+        self._outstanding: Dict[int, int] = {}
+        self._worker_counter = 0
+        self._scale_task: Optional[asyncio.Task] = None
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._replace_task: Optional[asyncio.Task] = None
+        self._is_running = False
+
+    async def start(self) -> bool:
+        """
+        Start the minimum number of workers concurrently
+
+        Returns:
+            True if at least one worker came up, False otherwise
+        """
+        workers = await asyncio.gather(*[self._spawn_worker() for _ in range(self.min_workers)])
+        self.workers = [worker for worker in workers if worker is not None]
+
+        if not self.workers:
+            self.logger.error(f"No workers could be started for {self.server_name}")
+            return False
+
+        self._is_running = True
+        await self.list_tools()
+        self._reaper_task = asyncio.create_task(self._reap_idle_workers())
+
+        self.logger.info(f"✅ Server pool {self.server_name} started with {len(self.workers)} workers")
+        return True
+
+    async def _spawn_worker(self) -> Optional[RealMCPClient]:
+        """Start and initialize one worker process"""
+        self._worker_counter += 1
+        label = f"{self.server_name}#{self._worker_counter}"
+        worker = RealMCPClient(self.server_name, logger=self.logger, **self.client_options)
+
+        if not await worker.connect_stdio(self.command, self.env) or not await worker.send_initialize():
+            self.logger.error(f"Failed to start pool worker {label}")
+            await worker.close()
+            return None
+
+        # Keep the first handshake result; later workers share it
+        if self.server_info is None:
+            self.server_info = worker.server_info
+            self.capabilities = worker.capabilities
+
+        worker._tools_cache = self._tools_cache
+        self._labels[id(worker)] = label
+        self._last_used[id(worker)] = time.monotonic()
+        self._outstanding[id(worker)] = 0
+        return worker
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        """
+        Get the shared tool list, fetching it from one worker if needed
+
+        Returns:
+            List of tool definitions
+        """
+        if self._tools_cache is not None:
+            return self._tools_cache
+
+        if not self.workers:
+            return []
+
+        worker = self._select_worker()
+        if worker is None:
+            return []
+
+        tools = await worker.list_tools()
+        if tools:
+            self._tools_cache = tools
+            for worker in self.workers:
+                worker._tools_cache = tools
+        return tools
+
+    def _select_worker(self) -> Optional[RealMCPClient]:
+        """Pick the live worker with the fewest outstanding requests"""
+        live = [worker for worker in self.workers if self._is_live(worker)]
+        if not live:
+            return None
+        return min(live, key=self._outstanding_for)
+
+    @staticmethod
+    def _is_live(worker: RealMCPClient) -> bool:
+        """Whether a worker can take calls (connected, or being restarted by its client)"""
+        return worker.is_connected or worker._reconnect_pending()
+
+    def _outstanding_for(self, worker: RealMCPClient) -> int:
+        """Requests routed to a worker that have not completed yet"""
+        return self._outstanding.get(id(worker), 0)
+
+    def _forget_worker(self, worker: RealMCPClient):
+        """Drop the bookkeeping for a worker leaving the pool"""
+        self.workers.remove(worker)
+        self._last_used.pop(id(worker), None)
+        self._outstanding.pop(id(worker), None)
+        self._labels.pop(id(worker), None)
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Execute a tool on the least loaded worker
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            **kwargs: Extra keyword arguments for RealMCPClient.call_tool
+
+        Returns:
+            Tool execution result or None if failed
+        """
+        self._maybe_replace_dead()
+        worker = self._select_worker()
+        if worker is None:
+            self.logger.error(f"Cannot call tool: server pool {self.server_name} has no live workers")
+            return None
+
+        key = id(worker)
+        self._outstanding[key] = self._outstanding.get(key, 0) + 1
+        self._last_used[key] = time.monotonic()
+        self._maybe_scale_up()
+
+        try:
+            return await worker.call_tool(name, arguments, **kwargs)
+        finally:
+            if key in self._outstanding:
+                self._outstanding[key] -= 1
+            self._last_used[key] = time.monotonic()
+
+    def _maybe_scale_up(self):
+        """Add a worker in the background when the pool is saturated"""
+        if not self._is_running or len(self.workers) >= self.max_workers:
+            return
+        if self._scale_task is not None and not self._scale_task.done():
+            return
+
+        backlog = sum(self._outstanding_for(worker) for worker in self.workers) / len(self.workers)
+        if backlog >= self.scale_up_threshold:
+            self._scale_task = asyncio.create_task(self._add_worker())
+
+    def _maybe_replace_dead(self):
+        """Replace dead workers in the background instead of waiting for the reaper"""
+        if not self._is_running or all(self._is_live(worker) for worker in self.workers):
+            return
+        if self._replace_task is None or self._replace_task.done():
+            self._replace_task = asyncio.create_task(self._replace_dead_workers())
+
+    async def _add_worker(self):
+        """Spawn one more worker and put it into rotation"""
+        worker = await self._spawn_worker()
+        if worker is None:
+            self.logger.warning(f"Failed to grow server pool {self.server_name}")
+            return
+        if not self._is_running:
+            await worker.close()
+            return
+
+        self.workers.append(worker)
+        self.logger.info(f"Server pool {self.server_name} grew to {len(self.workers)} workers")
+
+    async def _reap_idle_workers(self):
+        """Background task replacing dead workers and closing surplus idle ones"""
+        interval = max(1.0, self.idle_timeout / 2)
+        try:
+            while self._is_running:
+                await asyncio.sleep(interval)
+                if self._replace_task is None or self._replace_task.done():
+                    await self._replace_dead_workers()
+                now = time.monotonic()
+
+                for worker in list(self.workers):
+                    if len(self.workers) <= self.min_workers:
+                        break
+                    idle_for = now - self._last_used.get(id(worker), now)
+                    if self._outstanding_for(worker) == 0 and idle_for >= self.idle_timeout:
+                        self._forget_worker(worker)
+                        await worker.close()
+                        self.logger.info(f"Server pool {self.server_name} shrank to {len(self.workers)} workers")
+        except asyncio.CancelledError:
+            pass
+
+    async def _replace_dead_workers(self):
+        """Drop workers whose process has died and respawn up to min_workers"""
+        dead = [worker for worker in self.workers if not self._is_live(worker)]
+        if dead:
+            labels = ", ".join(self._labels.get(id(worker), "?") for worker in dead)
+            self.logger.warning(f"Server pool {self.server_name} dropped dead workers: {labels}")
+            for worker in dead:
+                self._forget_worker(worker)
+            await close_clients(dead)
+
+        missing = self.min_workers - len(self.workers)
+        if missing <= 0:
+            return
+        workers = await asyncio.gather(*[self._spawn_worker() for _ in range(missing)])
+        workers = [worker for worker in workers if worker is not None]
+        if not self._is_running:
+            await close_clients(workers)
+            return
+        self.workers.extend(workers)
+        if workers:
+            self.logger.info(f"Server pool {self.server_name} respawned {len(workers)} workers")
+
+    async def scale_to(self, count: int):
+        """
+        Resize the pool to an explicit number of workers
+
+        Args:
+            count: Target worker count, clamped to [min_workers, max_workers]
+        """
+        count = max(self.min_workers, min(self.max_workers, count))
+
+        if count > len(self.workers):
+            workers = await asyncio.gather(*[self._spawn_worker() for _ in range(count - len(self.workers))])
+            self.workers.extend(worker for worker in workers if worker is not None)
+        else:
+            # Drop the least busy workers first
+            surplus = sorted(self.workers, key=self._outstanding_for)[:len(self.workers) - count]
+            for worker in surplus:
+                self._forget_worker(worker)
+            await asyncio.gather(*[worker.close() for worker in surplus])
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get worker count and per-worker load
+
+        Returns:
+            Dictionary with pool size and outstanding requests per worker
+        """
+        return {
+            'server_name': self.server_name,
+            'workers': len(self.workers),
+            'min_workers': self.min_workers,
+            'max_workers': self.max_workers,
+            'outstanding_requests': {self._labels.get(id(worker)): self._outstanding_for(worker)
+                                     for worker in self.workers},
+            'tools_cached': self._tools_cache is not None
+        }
+
+    async def close(self):
+        """Stop background tasks and close every worker"""
+        self._is_running = False
+
+        if self._reaper_task and not self._reaper_task.done():
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+
+        # Let a pending grow or respawn finish; it closes its workers once it sees the pool stopped
+        for task in (self._scale_task, self._replace_task):
+            if task and not task.done():
+                await task
+
+        workers, self.workers = self.workers, []
+        self._last_used.clear()
+        self._labels.clear()
+        self._outstanding.clear()
+        await close_clients(workers)
+        self.logger.info(f"✅ Server pool closed: {self.server_name}")
@@ -0,0 +1,153 @@
+"""
+Single-Flight Tool Call Deduplication
+
+This module coalesces identical tool calls that are in flight at the same
+time. The first caller sends the request; callers with the same server,
+tool and arguments that arrive before it completes wait for that request
+and receive the same result instead of sending their own.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+
+FlightKey = Tuple[str, str, str]
+
+
+def canonical_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Serialise tool arguments so that equal arguments give equal strings
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        JSON with sorted keys and no insignificant whitespace
+    """
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False, default=str)
+
+
+class SingleFlight:
+    """
+    Opt-in coalescing of concurrent identical tool calls
+
+    Only tools that are enabled are coalesced, so side-effecting tools
+    (writes, sends, payments) keep one request per call. Tools are named
+    either bare (``web_search``, any server) or namespaced
+    (``brave.web_search``, one server); ``disabled`` always wins. With
+    ``default_enabled`` every tool not explicitly disabled is coalesced.
+
+    Waiters share the leader's result object, so results must be treated
+    as read-only. A caller that is cancelled (the leader included) does
+    not cancel the shared request for the others; once every caller has
+    been cancelled, the request is cancelled too.
+    """
+
+    def __init__(self, tools: Optional[Iterable[str]] = None,
+                 disabled: Optional[Iterable[str]] = None,
+                 default_enabled: bool = False):
+        """
+        Initialize single-flight deduplication
+
+        Args:
+            tools: Tool names to coalesce
+            disabled: Tool names never to coalesce
+            default_enabled: Coalesce every tool not in ``disabled``
+        """
+        self.enabled = set(tools or [])
+        self.disabled = set(disabled or [])
+        self.default_enabled = default_enabled
+        self._in_flight: Dict[FlightKey, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self._stats = {'calls': 0, 'executed': 0, 'coalesced': 0}
+
+    def enable(self, tool: str):
+        """Coalesce calls to a tool"""
+        self.disabled.discard(tool)
+        self.enabled.add(tool)
+
+    def disable(self, tool: str):
+        """Never coalesce calls to a tool"""
+        self.enabled.discard(tool)
+        self.disabled.add(tool)
+
+    def applies_to(self, server: str, tool: str) -> bool:
+        """
+        Check whether calls to a tool are coalesced
+
+        Args:
+            server: Server name
+            tool: Tool name on that server
+
+        Returns:
+            True if identical concurrent calls share one request
+        """
+        namespaced = f"{server}.{tool}"
+        if tool in self.disabled or namespaced in self.disabled:
+            return False
+        return self.default_enabled or tool in self.enabled or namespaced in self.enabled
+
+    async def call(self, server: str, tool: str, arguments: Optional[Dict[str, Any]],
+                   execute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a tool call, or join an identical one already in flight
+
+        Args:
+            server: Server name
+            tool: Tool name
+            arguments: Tool arguments
+            execute: Performs the call when no identical call is in flight
+
+        Returns:
+            Result of the shared call
+        """
+        self._stats['calls'] += 1
+        key = (server, tool, canonical_arguments(arguments))
+
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self._stats['coalesced'] += 1
+        else:
+            self._stats['executed'] += 1
+            flight = asyncio.ensure_future(execute())
+            self._in_flight[key] = flight
+            flight.add_done_callback(lambda _: self._forget(key, flight))
+        return await self._join(key, flight)
+
+    async def _join(self, key: FlightKey, flight: asyncio.Future) -> Any:
+        """Wait for a shared call, cancelling it when the last caller gives up"""
+        self._waiters[flight] = self._waiters.get(flight, 0) + 1
+        try:
+            return await asyncio.shield(flight)
+        finally:
+            self._waiters[flight] -= 1
+            if not self._waiters[flight]:
+                del self._waiters[flight]
+                if not flight.done():
+                    # Nobody wants the result any more; later callers start afresh
+                    self._forget(key, flight)
+                    flight.cancel()
+
+    def _forget(self, key: FlightKey, flight: asyncio.Future):
+        """Stop offering a call to new callers"""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Distinct calls currently in flight"""
+        return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get deduplication counters
+
+        Returns:
+            Dictionary with calls seen, requests executed and calls coalesced
+        """
+        stats = dict(self._stats)
+        stats['in_flight'] = self.in_flight
+        stats['coalesce_rate'] = stats['coalesced'] / stats['calls'] if stats['calls'] else 0.0
+        return stats
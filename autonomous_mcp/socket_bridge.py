@@ -0,0 +1,330 @@
+"""
+Shared MCP Server Bridge
+
+This module puts one stdio MCP server behind a Unix domain socket or TCP
+port, so every agent worker on a host can connect to the same long-lived
+server instance with RealMCPClient.connect_unix or connect_tcp instead of
+spawning its own copy.
+
+The bridge owns a single RealMCPClient to the server and multiplexes all
+socket connections onto it: requests are forwarded with fresh IDs and the
+responses routed back under the caller's ID, the initialize handshake is
+answered from the bridge's own, cancellations are passed through and
+server notifications are broadcast to every connection.
+
+Run the bridge with:
+    python -m autonomous_mcp.socket_bridge (--unix PATH | --tcp HOST:PORT) -- COMMAND [ARGS...]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .codec import JSONCodec, get_codec
+from .real_mcp_client import DEFAULT_READ_LIMIT, INTERNAL_ERROR, RealMCPClient
+
+
+# Forwarded requests are bounded by the caller's own timeout and
+# cancellation; this only stops the bridge waiting forever
+DEFAULT_BRIDGE_TIMEOUT = 600.0
+
+
+class _Connection:
+    """One socket client of the bridge"""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.write_lock = asyncio.Lock()
+        self.in_flight: Dict[Union[str, int], asyncio.Task] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+    def cancel_all(self):
+        for task in list(self.in_flight.values()) + list(self.tasks):
+            task.cancel()
+
+
+class SocketBridge:
+    """
+    Serves one stdio MCP server to many socket clients
+
+    The server is started (and restarted after a crash) by an internal
+    RealMCPClient with ``auto_reconnect``; ``client_options`` are passed to
+    it, so limits, circuit breaking and caching apply once for all workers.
+    """
+
+    def __init__(self, command: List[str], env: Optional[Dict[str, str]] = None,
+                 server_name: str = "bridge",
+                 request_timeout: float = DEFAULT_BRIDGE_TIMEOUT,
+                 codec: Optional[JSONCodec] = None,
+                 logger: Optional[logging.Logger] = None,
+                 **client_options: Any):
+        """
+        Initialize the bridge
+
+        Args:
+            command: Command and arguments to start the MCP server
+            env: Environment variables for the server process
+            server_name: Name used in logs
+            request_timeout: Longest the bridge waits for one forwarded response
+            codec: Codec for socket framing
+            logger: Logger to use
+            **client_options: Extra keyword arguments for the RealMCPClient
+        """
+        self.command = list(command)
+        self.env = env
+        self.request_timeout = request_timeout
+        self.codec = codec or get_codec()
+        self.logger = logger or logging.getLogger(__name__)
+        client_options.setdefault("auto_reconnect", True)
+        self.client = RealMCPClient(server_name, logger=self.logger, codec=self.codec,
+                                    request_timeout=request_timeout, **client_options)
+
+        self._servers: List[asyncio.AbstractServer] = []
+        self._unix_paths: List[str] = []
+        self._connections: Set[_Connection] = set()
+        self._stats = {'connections_total': 0, 'requests': 0, 'notifications': 0, 'failures': 0}
+
+    async def start(self) -> bool:
+        """
+        Start and initialize the shared server
+
+        Returns:
+            True if the server is ready for connections
+        """
+        self.client.add_notification_listener(self._broadcast)
+        if not await self.client.connect_stdio(self.command, self.env):
+            return False
+        if not await self.client.send_initialize():
+            await self.client.close()
+            return False
+        return True
+
+    async def listen_unix(self, path: str):
+        """
+        Accept connections on a Unix domain socket
+
+        A stale socket file left by a previous bridge is replaced.
+
+        Args:
+            path: Socket path
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self._serve_connection, path, limit=DEFAULT_READ_LIMIT)
+        self._servers.append(server)
+        self._unix_paths.append(path)
+        self.logger.info(f"✅ Bridge for {self.client.server_name} listening on unix:{path}")
+
+    async def listen_tcp(self, host: str, port: int):
+        """
+        Accept connections on a TCP port
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 picks a free one; see ``ports``)
+        """
+        server = await asyncio.start_server(self._serve_connection, host, port, limit=DEFAULT_READ_LIMIT)
+        self._servers.append(server)
+        self.logger.info(f"✅ Bridge for {self.client.server_name} listening on tcp:{host}:{self.ports[-1]}")
+
+    @property
+    def ports(self) -> List[int]:
+        """TCP ports the bridge is bound to"""
+        return [sock.getsockname()[1] for server in self._servers for sock in server.sockets
+                if sock.family in (socket.AF_INET, socket.AF_INET6)]
+
+    async def serve_forever(self):
+        """Serve until cancelled"""
+        await asyncio.gather(*[server.serve_forever() for server in self._servers])
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read requests from one socket client until it disconnects"""
+        connection = _Connection(writer)
+        self._connections.add(connection)
+        self._stats['connections_total'] += 1
+        sock = writer.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError as e:
+                    self.logger.error(f"Bridge client message exceeds read limit: {e}")
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if line.isspace():
+                    continue
+
+                try:
+                    message = self.codec.decode(line)
+                except ValueError:
+                    self.logger.warning(f"Invalid JSON from bridge client: {line[:200]!r}")
+                    continue
+
+                if isinstance(message, list):
+                    self._spawn(connection, None, self._answer_batch(connection, message))
+                elif isinstance(message, dict):
+                    await self._handle(connection, message)
+        finally:
+            self._connections.discard(connection)
+            # The caller is gone; stop the server working on its requests
+            connection.cancel_all()
+            writer.close()
+
+    def _spawn(self, connection: _Connection, request_id: Optional[Union[str, int]], coroutine):
+        """Run a forwarded request in the background, tracked for cancellation"""
+        task = asyncio.create_task(coroutine)
+        if request_id is not None:
+            connection.in_flight[request_id] = task
+            task.add_done_callback(
+                lambda _: connection.in_flight.get(request_id) is task and connection.in_flight.pop(request_id)
+            )
+        else:
+            connection.tasks.add(task)
+            task.add_done_callback(connection.tasks.discard)
+
+    async def _handle(self, connection: _Connection, message: Dict[str, Any]):
+        """Dispatch one request or notification from a socket client"""
+        method = message.get("method")
+        if "id" in message and method:
+            self._spawn(connection, message["id"], self._answer_one(connection, message))
+            return
+
+        if method == "notifications/initialized":
+            # The bridge completed the handshake on the server's behalf
+            return
+        if method == "notifications/cancelled":
+            task = connection.in_flight.get((message.get("params") or {}).get("requestId"))
+            if task is not None:
+                # Cancelling the forwarding task sends the server its own cancellation
+                task.cancel()
+            return
+        if method:
+            await self.client.send_notification(method, message.get("params"))
+
+    async def _answer_one(self, connection: _Connection, request: Dict[str, Any]):
+        response = await self._forward(request)
+        await self._send(connection, response)
+
+    async def _answer_batch(self, connection: _Connection, batch: List[Any]):
+        requests = [item for item in batch if isinstance(item, dict)]
+        for item in requests:
+            if "id" not in item:
+                await self._handle(connection, item)
+        responses = await asyncio.gather(*[self._forward(item) for item in requests if "id" in item])
+        if responses:
+            await self._send(connection, list(responses))
+
+    async def _forward(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to the shared server and rewrite the response to the caller's ID"""
+        self._stats['requests'] += 1
+        method = request.get("method")
+        if method == "initialize" and self.client.server_info is not None:
+            return {"jsonrpc": "2.0", "id": request["id"], "result": self.client.server_info}
+
+        response = await self.client.send_request(method, request.get("params"), timeout=self.request_timeout)
+        if response is None:
+            self._stats['failures'] += 1
+            return {"jsonrpc": "2.0", "id": request["id"],
+                    "error": {"code": INTERNAL_ERROR, "message": f"No response from {self.client.server_name}"}}
+
+        answer = {"jsonrpc": "2.0", "id": request["id"]}
+        if "error" in response:
+            answer["error"] = response["error"]
+        else:
+            answer["result"] = response.get("result")
+        return answer
+
+    async def _send(self, connection: _Connection, message: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """Write one message to a socket client, dropping it if the client has gone"""
+        try:
+            async with connection.write_lock:
+                connection.writer.write(self.codec.encode_line(message))
+                await connection.writer.drain()
+        except ConnectionError:
+            self._connections.discard(connection)
+
+    def _broadcast(self, notification: Dict[str, Any]):
+        """Pass a server notification on to every connected client"""
+        self._stats['notifications'] += 1
+        for connection in list(self._connections):
+            self._spawn(connection, None, self._send(connection, notification))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get bridge counters
+
+        Returns:
+            Dictionary with connection and request counts
+        """
+        return {
+            **self._stats,
+            'connections': len(self._connections),
+            'in_flight': sum(len(c.in_flight) for c in self._connections),
+            'server_connected': self.client.is_connected
+        }
+
+    async def close(self):
+        """Stop accepting connections, drop clients and stop the server"""
+        for server in self._servers:
+            server.close()
+        for connection in list(self._connections):
+            connection.cancel_all()
+            connection.writer.close()
+        self._connections.clear()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        for path in self._unix_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._unix_paths.clear()
+        await self.client.close()
+
+
+async def _run(args: argparse.Namespace):
+    bridge = SocketBridge(args.command)
+    if not await bridge.start():
+        raise SystemExit(f"Failed to start MCP server: {' '.join(args.command)}")
+    try:
+        if args.unix:
+            await bridge.listen_unix(args.unix)
+        if args.tcp:
+            host, _, port = args.tcp.rpartition(":")
+            await bridge.listen_tcp(host or "127.0.0.1", int(port))
+        await bridge.serve_forever()
+    finally:
+        await bridge.close()
+
+
+def main():
+    """Run the bridge from the command line"""
+    parser = argparse.ArgumentParser(description="Share one stdio MCP server over a socket")
+    parser.add_argument("--unix", help="Unix domain socket path to listen on")
+    parser.add_argument("--tcp", help="HOST:PORT to listen on")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="MCP server command (after --)")
+    args = parser.parse_args()
+    if args.command and args.command[0] == "--":
+        args.command = args.command[1:]
+    if not args.command or not (args.unix or args.tcp):
+        parser.error("a server command and --unix or --tcp are required")
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
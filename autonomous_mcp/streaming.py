@@ -0,0 +1,268 @@
+"""
+Incremental JSON-RPC Response Parser
+
+This module scans newline-delimited JSON-RPC frames as raw bytes arrive and
+decodes each element of a response's ``result.content`` array as soon as
+its closing bracket is seen. Consumers can start on the first content
+blocks of a multi-megabyte tool result long before the last byte arrives,
+and the raw bytes of each element are released once it has been decoded.
+"""
+
+import re
+from typing import Any, List, Optional, Tuple
+
+from .codec import JSONCodec, get_codec
+
+
+# Bytes that change the scanner state outside of strings
+_STRUCTURAL = re.compile(rb'[{}\[\],:"]')
+
+# Bytes that matter inside a string
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+# Inside a content element only bracket depth matters: skip complete strings
+# and other bytes in C, then capture the next bracket or an unfinished string
+_ELEMENT_SKIP = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*([\[\]{}"])?')
+
+_WHITESPACE = b" \t\r\n"
+_OPEN_OBJECT, _OPEN_ARRAY = ord("{"), ord("[")
+_CLOSE_OBJECT, _CLOSE_ARRAY = ord("}"), ord("]")
+_COMMA, _COLON, _QUOTE, _BACKSLASH = ord(","), ord(":"), ord('"'), ord("\\")
+
+# Parser events
+EVENT_ID = "id"
+EVENT_ITEM = "item"
+EVENT_MESSAGE = "message"
+EVENT_INVALID = "invalid"
+
+
+class _Container:
+    """One open JSON object or array on the scanner stack"""
+
+    __slots__ = ("kind", "key", "expect_key")
+
+    def __init__(self, kind: int):
+        self.kind = kind
+        self.key: Optional[str] = None
+        self.expect_key = kind == _OPEN_OBJECT
+
+
+class StreamingResponseParser:
+    """
+    Byte-level scanner for newline-delimited JSON-RPC frames
+
+    ``feed()`` returns events in arrival order:
+
+    - ``("id", value)`` once a frame's top-level ``id`` has been read
+    - ``("item", obj)`` for each completed element of ``result.content``
+    - ``("message", obj)`` when a frame ends; if content items were emitted
+      the message carries an empty ``result.content``
+    - ``("invalid", bytes)`` for a line or frame that is not valid JSON
+
+    Only the bytes of the element currently being parsed (plus the short
+    frame header) are kept, so peak memory is bounded by the largest
+    single content block rather than the whole response. Servers that
+    write ``id`` after ``result`` still stream items; the caller just
+    learns which request they belong to at the end of the frame.
+    """
+
+    def __init__(self, codec: Optional[JSONCodec] = None):
+        self.codec = codec or get_codec()
+        self._buf = bytearray()
+        self._pos = 0
+        self._reset_frame()
+
+    def _reset_frame(self):
+        self._stack: List[_Container] = []
+        self._in_string = False
+        self._key_start: Optional[int] = None
+        self._id_start: Optional[int] = None
+        self._head: Optional[bytearray] = None
+        self._content_level: Optional[int] = None
+        self._element_depth = 0
+
+    def feed(self, data: bytes) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of bytes from the wire
+
+        Args:
+            data: Raw bytes in arrival order
+
+        Returns:
+            Events completed by this chunk
+        """
+        self._buf += data
+        events: List[Tuple[str, Any]] = []
+        self._scan(events)
+        return events
+
+    def _decode(self, data: bytes, events: List[Tuple[str, Any]]) -> Tuple[bool, Any]:
+        try:
+            return True, self.codec.decode(data)
+        except ValueError:
+            events.append((EVENT_INVALID, bytes(data)))
+            return False, None
+
+    def _scan(self, events: List[Tuple[str, Any]]):
+        buf = self._buf
+        pos = self._pos
+
+        while True:
+            stack = self._stack
+
+            if not stack:
+                # Between frames: skip blank space, then expect an object or array
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                del buf[:pos]
+                pos = 0
+                if not buf:
+                    break
+
+                if buf[0] not in (_OPEN_OBJECT, _OPEN_ARRAY):
+                    newline = buf.find(b"\n")
+                    if newline < 0:
+                        break
+                    events.append((EVENT_INVALID, bytes(buf[:newline])))
+                    del buf[:newline + 1]
+                    continue
+
+                stack.append(_Container(buf[0]))
+                pos = 1
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                special = match.start()
+                if buf[special] == _BACKSLASH:
+                    if special + 1 >= len(buf):
+                        # Escape split across chunks; wait for the next byte
+                        pos = special
+                        break
+                    pos = special + 2
+                    continue
+
+                self._in_string = False
+                if self._key_start is not None:
+                    stack[-1].key = bytes(buf[self._key_start:special]).decode("utf-8", "replace")
+                    self._key_start = None
+                pos = special + 1
+                continue
+
+            if self._element_depth:
+                # Inside a nested content element: find its closing bracket
+                depth = self._element_depth
+                while depth:
+                    match = _ELEMENT_SKIP.match(buf, pos)
+                    pos = match.end()
+                    token = match.group(1)
+                    if token is None:
+                        break
+                    if token == b'"':
+                        # String continues in a later chunk
+                        self._in_string = True
+                        break
+                    if token in (b"{", b"["):
+                        depth += 1
+                    else:
+                        depth -= 1
+                self._element_depth = depth
+                if depth == 0:
+                    # Element closed: decode it now rather than at the next delimiter
+                    ok, item = self._decode(bytes(buf[:pos]), events)
+                    if ok:
+                        events.append((EVENT_ITEM, item))
+                    del buf[:pos]
+                    pos = 0
+                elif not self._in_string:
+                    break
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            at = match.start()
+            char = buf[at]
+            top = stack[-1]
+
+            if char == _QUOTE:
+                self._in_string = True
+                if top.expect_key:
+                    self._key_start = at + 1
+                pos = at + 1
+
+            elif char == _COLON:
+                top.expect_key = False
+                if len(stack) == 1 and top.key == "id":
+                    self._id_start = at + 1
+                pos = at + 1
+
+            elif char in (_OPEN_OBJECT, _OPEN_ARRAY):
+                if (char == _OPEN_ARRAY and self._head is None and len(stack) == 2
+                        and stack[0].kind == _OPEN_OBJECT and stack[0].key == "result"
+                        and stack[1].kind == _OPEN_OBJECT and stack[1].key == "content"):
+                    # Entering result.content: keep the header, stream the elements
+                    self._head = bytearray(buf[:at + 1])
+                    del buf[:at + 1]
+                    stack.append(_Container(char))
+                    self._content_level = len(stack)
+                    pos = 0
+                    continue
+                if self._content_level == len(stack):
+                    # Start of a nested content element
+                    self._element_depth = 1
+                    pos = at + 1
+                    continue
+                stack.append(_Container(char))
+                pos = at + 1
+
+            else:
+                # Comma or closing bracket
+                if self._id_start is not None and len(stack) == 1:
+                    ok, message_id = self._decode(bytes(buf[self._id_start:at]), events)
+                    if ok:
+                        events.append((EVENT_ID, message_id))
+                    self._id_start = None
+
+                if self._content_level == len(stack):
+                    element = bytes(buf[:at])
+                    if element.strip(_WHITESPACE):
+                        ok, item = self._decode(element, events)
+                        if ok:
+                            events.append((EVENT_ITEM, item))
+                    if char == _COMMA:
+                        del buf[:at + 1]
+                        pos = 0
+                        continue
+                    # End of the content array; the header already holds '['
+                    del buf[:at]
+                    stack.pop()
+                    self._content_level = None
+                    pos = 1
+                    continue
+
+                if char == _COMMA:
+                    if top.kind == _OPEN_OBJECT:
+                        top.expect_key = True
+                    pos = at + 1
+                    continue
+
+                stack.pop()
+                if stack:
+                    pos = at + 1
+                    continue
+
+                # Frame complete
+                frame = bytes(self._head + buf[:at + 1]) if self._head is not None else bytes(buf[:at + 1])
+                del buf[:at + 1]
+                pos = 0
+                self._reset_frame()
+                ok, message = self._decode(frame, events)
+                if ok:
+                    events.append((EVENT_MESSAGE, message))
+
+        self._pos = pos
@@ -0,0 +1,136 @@
+"""
+Persistent Tool Catalogue Cache
+
+This module stores each MCP server's tools/list result on disk so that a
+freshly started agent can serve the catalogue immediately and refresh it
+from the server in the background instead of blocking on the round-trip.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the directory used for cached tool catalogues
+
+    Returns:
+        Path under the user's cache directory
+    """
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "autonomous-mcp-agent" / "tool_catalog"
+
+
+def server_version(server_info: Optional[Dict[str, Any]]) -> str:
+    """
+    Build the version tag a cached catalogue is validated against
+
+    Args:
+        server_info: Result of the initialize handshake
+
+    Returns:
+        String combining server name, server version and protocol version
+    """
+    server_info = server_info or {}
+    info = server_info.get("serverInfo", {})
+    return f"{info.get('name', '')}@{info.get('version', '')}/{server_info.get('protocolVersion', '')}"
+
+
+class ToolCatalogCache:
+    """
+    On-disk cache of tool catalogues keyed by server command
+
+    Each entry records the server version it was fetched from; a lookup
+    with a different version is treated as a miss.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, logger: Optional[logging.Logger] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def make_key(command: List[str]) -> str:
+        """Hash a server command line into a cache key"""
+        return hashlib.sha256(json.dumps(list(command)).encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, command: List[str], version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached catalogue for a server command
+
+        Args:
+            command: Server command line
+            version: Expected server version tag (any version if omitted)
+
+        Returns:
+            Entry with 'tools', 'version' and 'saved_at', or None on a miss
+        """
+        key = self.make_key(command)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable tool catalogue cache: {e}")
+                return None
+            self._entries[key] = entry
+
+        if version is not None and entry.get("version") != version:
+            return None
+        return entry
+
+    def put(self, command: List[str], version: str, tools: List[Dict[str, Any]]):
+        """
+        Store a server's catalogue
+
+        Args:
+            command: Server command line
+            version: Server version tag the tools were fetched from
+            tools: Tool definitions from tools/list
+        """
+        key = self.make_key(command)
+        entry = {
+            "command": list(command),
+            "version": version,
+            "tools": tools,
+            "saved_at": time.time()
+        }
+        self._entries[key] = entry
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to persist tool catalogue: {e}")
+
+    def invalidate(self, command: List[str]):
+        """
+        Drop the cached catalogue for a server command
+
+        Args:
+            command: Server command line
+        """
+        key = self.make_key(command)
+        self._entries.pop(key, None)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to remove tool catalogue cache: {e}")
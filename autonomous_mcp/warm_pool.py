@@ -0,0 +1,190 @@
+"""
+Warm MCP Server Process Pool
+
+This module keeps already-spawned, already-initialized spare server
+processes per command, so handing out a fresh client costs no process
+start or initialize handshake. Spares are replenished in the background
+after each acquire, which makes one-server-per-tenant isolation practical
+even for servers that take seconds to start (npx, uvx, docker).
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Any, Tuple
+
+from .real_mcp_client import RealMCPClient, close_clients
+
+
+# Pool key: command plus a frozen view of its environment overrides
+WarmKey = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+
+class WarmProcessPool:
+    """
+    Spare initialized MCP clients, grouped by command and environment
+
+    Each key registered with prewarm() or used with acquire() is topped up
+    to ``spares`` idle clients. acquire() hands out a spare if one is alive
+    and starts a replacement in the background; with no spare available it
+    falls back to a normal cold start. Acquired clients belong to the
+    caller, who closes them when done.
+    """
+
+    def __init__(self, spares: int = 1,
+                 logger: Optional[logging.Logger] = None,
+                 **client_options: Any):
+        """
+        Initialize the pool
+
+        Args:
+            spares: Idle clients kept ready per command
+            logger: Logger to use
+            **client_options: Extra keyword arguments for each RealMCPClient
+        """
+        if spares < 0:
+            raise ValueError("spares must not be negative")
+
+        self.spares = spares
+        self.logger = logger or logging.getLogger(__name__)
+        self.client_options = client_options
+
+        self._idle: Dict[WarmKey, List[RealMCPClient]] = {}
+        self._starting: Dict[WarmKey, int] = {}
+        self._tasks: set = set()
+        self._spawn_counter = 0
+        self._stats = {'warm_hits': 0, 'cold_starts': 0, 'spawned': 0, 'spawn_failures': 0, 'discarded': 0}
+        self._is_closed = False
+
+    @staticmethod
+    def make_key(command: List[str], env: Optional[Dict[str, str]] = None) -> WarmKey:
+        """Pool key for a command and environment"""
+        return tuple(command), tuple(sorted((env or {}).items()))
+
+    async def prewarm(self, command: List[str], env: Optional[Dict[str, str]] = None,
+                      wait: bool = True):
+        """
+        Start the spare processes for a command
+
+        Args:
+            command: Command and arguments to start the server
+            env: Environment variables for the server processes
+            wait: Wait until the spares are initialized instead of returning at once
+        """
+        tasks = self._replenish(self.make_key(command, env), command, env)
+        if wait and tasks:
+            await asyncio.gather(*tasks)
+
+    async def acquire(self, server_name: str, command: List[str],
+                      env: Optional[Dict[str, str]] = None) -> Optional[RealMCPClient]:
+        """
+        Get an initialized client for a command, warm if possible
+
+        Args:
+            server_name: Name to give the client
+            command: Command and arguments to start the server
+            env: Environment variables for the server process
+
+        Returns:
+            Connected, initialized client owned by the caller, or None if a
+            cold start failed
+        """
+        if self._is_closed:
+            raise RuntimeError("Warm process pool is closed")
+
+        key = self.make_key(command, env)
+        idle = self._idle.setdefault(key, [])
+        client = None
+
+        while idle:
+            candidate = idle.pop(0)
+            if candidate.is_connected and candidate.process and candidate.process.returncode is None:
+                client = candidate
+                break
+            # Spare died while waiting; throw it away
+            self._stats['discarded'] += 1
+            self._spawn_background(candidate.close())
+
+        self._replenish(key, command, env)
+
+        if client is not None:
+            self._stats['warm_hits'] += 1
+            client.server_name = server_name
+            return client
+
+        self._stats['cold_starts'] += 1
+        self.logger.info(f"No warm spare for {server_name}, starting cold")
+        client = await self._spawn(server_name, command, env)
+        if client is None:
+            self._stats['spawn_failures'] += 1
+        return client
+
+    def _replenish(self, key: WarmKey, command: List[str],
+                   env: Optional[Dict[str, str]]) -> List[asyncio.Task]:
+        """Start enough background spawns to bring a key back to ``spares``"""
+        missing = self.spares - len(self._idle.get(key, [])) - self._starting.get(key, 0)
+        return [self._spawn_background(self._add_spare(key, command, env)) for _ in range(max(0, missing))]
+
+    def _spawn_background(self, coroutine) -> asyncio.Task:
+        """Run a coroutine as a tracked background task"""
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _add_spare(self, key: WarmKey, command: List[str], env: Optional[Dict[str, str]]):
+        """Spawn one spare and park it in the idle list"""
+        self._starting[key] = self._starting.get(key, 0) + 1
+        try:
+            self._spawn_counter += 1
+            client = await self._spawn(f"warm#{self._spawn_counter}", command, env)
+        finally:
+            self._starting[key] -= 1
+
+        if client is None:
+            self._stats['spawn_failures'] += 1
+        elif self._is_closed:
+            await client.close()
+        else:
+            self._idle.setdefault(key, []).append(client)
+
+    async def _spawn(self, server_name: str, command: List[str],
+                     env: Optional[Dict[str, str]]) -> Optional[RealMCPClient]:
+        """Start and initialize one client"""
+        client = RealMCPClient(server_name, logger=self.logger, **self.client_options)
+        try:
+            if await client.connect_stdio(command, env) and await client.send_initialize():
+                self._stats['spawned'] += 1
+                return client
+        except asyncio.CancelledError:
+            await client.close()
+            raise
+        await client.close()
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with idle/starting spares per command and hit counters
+        """
+        return {
+            'spares': self.spares,
+            'commands': {
+                " ".join(key[0]): {'idle': len(idle), 'starting': self._starting.get(key, 0)}
+                for key, idle in self._idle.items()
+            },
+            **self._stats
+        }
+
+    async def close(self):
+        """Stop background spawns and close every idle spare"""
+        self._is_closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        idle = [client for clients in self._idle.values() for client in clients]
+        self._idle.clear()
+        await close_clients(idle)
+        self.logger.info(f"✅ Warm process pool closed ({len(idle)} spares)")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Micro-Benchmark
+
+Compares the MCP wire codecs (orjson, msgspec, stdlib json) on payloads
+shaped like real MCP traffic:
+- a tools/list catalogue from a server with many tools
+- a multi-megabyte tools/call result holding a scraped web page
+- a tools/call result holding a large repository file listing
+- a small tools/call request, the most frequent outgoing message
+
+Usage:
+    python benchmarks/codec_benchmark.py [--iterations N]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from autonomous_mcp.codec import available_codecs
+
+
+def make_tool_catalogue(tool_count: int = 150) -> Dict[str, Any]:
+    """tools/list response with realistic input schemas"""
+    tools = []
+    for i in range(tool_count):
+        tools.append({
+            "name": f"tool_{i}",
+            "description": f"Performs operation {i} against the upstream service. " * 3,
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"},
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+                    "filters": {"type": "object", "additionalProperties": {"type": "string"}},
+                    "include_metadata": {"type": "boolean"}
+                },
+                "required": ["query"]
+            }
+        })
+    return {"jsonrpc": "2.0", "id": 2, "result": {"tools": tools}}
+
+
+def make_scraped_page(size_bytes: int = 4 * 1024 * 1024) -> Dict[str, Any]:
+    """tools/call response carrying a large page of mixed text"""
+    rng = random.Random(42)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+             for _ in range(2000)]
+    words += ["naïve", "café", "Straße", "東京", "\"quoted\"", "back\\slash", "tab\there"]
+
+    chunks, length = [], 0
+    while length < size_bytes:
+        sentence = " ".join(rng.choice(words) for _ in range(20)) + ".\n"
+        chunks.append(sentence)
+        length += len(sentence)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "result": {"content": [{"type": "text", "text": "".join(chunks)}], "isError": False}
+    }
+
+
+def make_repo_listing(entry_count: int = 50000) -> Dict[str, Any]:
+    """tools/call response carrying many small structured entries"""
+    entries = [{
+        "path": f"src/package_{i % 50}/module_{i}.py",
+        "type": "file" if i % 7 else "dir",
+        "size": i * 37 % 100000,
+        "sha": f"{i * 2654435761 % (1 << 64):016x}"
+    } for i in range(entry_count)]
+    return {
+        "jsonrpc": "2.0",
+        "id": 4,
+        "result": {"content": [{"type": "resource", "resource": {"uri": "repo://listing", "entries": entries}}]}
+    }
+
+
+def make_small_request() -> Dict[str, Any]:
+    """Typical outgoing tools/call request"""
+    return {
+        "jsonrpc": "2.0",
+        "id": 1234,
+        "method": "tools/call",
+        "params": {"name": "brave_web_search", "arguments": {"query": "python asyncio streams", "count": 10}}
+    }
+
+
+def time_operation(operation: Callable[[], Any], iterations: int) -> float:
+    """Best-of-three mean seconds per call"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            operation()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+def run_benchmark(iterations: int):
+    """Encode and decode every payload with every installed codec"""
+    payloads = {
+        "tools/list (150 tools)": (make_tool_catalogue(), iterations),
+        "scraped page (4 MiB)": (make_scraped_page(), max(1, iterations // 20)),
+        "repo listing (50k entries)": (make_repo_listing(), max(1, iterations // 20)),
+        "small request": (make_small_request(), iterations * 100),
+    }
+    codecs = available_codecs()
+
+    print("🔬 MCP JSON Codec Benchmark")
+    print("=" * 78)
+    print(f"Codecs available: {', '.join(codecs)}")
+
+    for label, (payload, count) in payloads.items():
+        frame = codecs["json"].encode_line(payload)
+        print(f"\n📦 {label}: {len(frame) / 1024:.1f} KiB per frame, {count} iterations")
+        print(f"   {'codec':<10}{'encode':>14}{'decode':>14}{'MiB/s decode':>16}{'vs json':>10}")
+
+        baseline = None
+        for name, codec in reversed(list(codecs.items())):
+            encode_time = time_operation(lambda: codec.encode_line(payload), count)
+            decode_time = time_operation(lambda: codec.decode(frame), count)
+            total = encode_time + decode_time
+            if baseline is None:
+                baseline = total
+            throughput = len(frame) / decode_time / (1024 * 1024)
+            print(f"   {name:<10}{encode_time * 1e6:>12.1f}µs{decode_time * 1e6:>12.1f}µs"
+                  f"{throughput:>16.1f}{baseline / total:>9.2f}x")
+
+
+def main():
+    """Run the codec benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Compare MCP JSON codecs on realistic payloads")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="Iterations for the catalogue payload (others are scaled)")
+    args = parser.parse_args()
+    run_benchmark(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Replayed MCP Load Test
+
+Re-issues the requests of a recorded MCP session through RealMCPClient
+against the replay server, keeping their recorded start offsets, and
+reports client-side latency and throughput. Recordings are made by passing
+a SessionRecorder to RealMCPClient during a live session.
+
+Usage:
+    python benchmarks/replay_load.py RECORDING [--speed FACTOR | --max-speed]
+                                     [--repeat N] [--max-in-flight N]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+from autonomous_mcp.replay import Recording, replay_command
+
+
+async def run_load(path: str, speed: Optional[float], repeat: int, max_in_flight: Optional[int]):
+    """Replay every recorded request ``repeat`` times and print latency statistics"""
+    recording = Recording.load(path)
+    requests = [e for e in recording.exchanges if e["method"] != "initialize"]
+    if not requests:
+        print("Recording holds no requests to replay")
+        return
+
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    client = RealMCPClient("replay", max_in_flight=max_in_flight)
+    if not await client.connect_stdio(replay_command(path, speed), {"PYTHONPATH": root}):
+        return
+    await client.send_initialize()
+
+    latencies: List[float] = []
+    failures = 0
+
+    async def issue(exchange, offset: float, started: float):
+        nonlocal failures
+        if speed is not None:
+            await asyncio.sleep(max(0.0, started + offset / speed - time.monotonic()))
+        sent = time.monotonic()
+        response = await client.send_request(exchange["method"], exchange.get("params"))
+        if response is None or "error" in response and "error" not in exchange:
+            failures += 1
+        else:
+            latencies.append(time.monotonic() - sent)
+
+    first = requests[0]["t"]
+    span = recording.duration - first
+    started = time.monotonic()
+    await asyncio.gather(*[
+        issue(exchange, exchange["t"] - first + round_index * span, started)
+        for round_index in range(repeat)
+        for exchange in requests
+    ])
+    elapsed = time.monotonic() - started
+    await client.close()
+
+    mode = "max speed" if speed is None else f"{speed}x"
+    print(f"🔁 Replayed {len(requests) * repeat} requests from {path} at {mode}")
+    print("=" * 60)
+    print(f"Recorded duration: {span:.3f}s    Replay wall time: {elapsed:.3f}s")
+    print(f"Throughput: {len(latencies) / elapsed:.1f} req/s    Failures: {failures}")
+    if latencies:
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"Latency p50: {statistics.median(latencies) * 1000:.2f}ms    "
+              f"p99: {p99 * 1000:.2f}ms    max: {latencies[-1] * 1000:.2f}ms")
+
+
+def main():
+    """Run the replay load test from the command line"""
+    parser = argparse.ArgumentParser(description="Replay a recorded MCP session as a load test")
+    parser.add_argument("recording", help="Recording file written by SessionRecorder")
+    parser.add_argument("--speed", type=float, default=1.0, help="Time compression factor (default 1.0)")
+    parser.add_argument("--max-speed", action="store_true", help="Send everything at once, no latency")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the session N times back to back")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Client in-flight window")
+    args = parser.parse_args()
+    asyncio.run(run_load(args.recording, None if args.max_speed else args.speed,
+                         args.repeat, args.max_in_flight))
+
+
+if __name__ == "__main__":
+    main()
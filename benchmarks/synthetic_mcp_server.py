@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Synthetic MCP Benchmark Server
+
+A stand-in for the real server fleet, built on the same mcp.server.Server
+scaffolding as minimal_mcp_server.py. It offers any number of tools whose
+latency, payload size, failure rate, hang rate and CPU cost are
+configurable, so client pipelining, pooling, timeouts and circuit breaking
+can be measured locally without network access.
+
+With --http the server is served over Streamable HTTP (starlette and
+uvicorn) at http://HOST:PORT/mcp/ instead of stdio, as a local fixture for
+RealMCPClient.connect_http; --json-response answers with plain JSON bodies
+instead of SSE streams.
+
+Latency distributions:
+    fixed:SECONDS                 every call takes the same time
+    lognormal:MEDIAN,SIGMA        typical service latency
+    pareto:MINIMUM,ALPHA          heavy tail (smaller ALPHA = heavier)
+
+Usage:
+    python benchmarks/synthetic_mcp_server.py [--tools N] [--latency SPEC]
+        [--payload-bytes N] [--error-rate P] [--timeout-rate P]
+        [--cpu-iterations N] [--seed N] [--http HOST:PORT [--json-response]]
+
+Every tool also accepts per-call overrides in its arguments:
+latency_ms, payload_bytes, cpu_iterations and fail.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class SyntheticConfig:
+    """Behaviour shared by every synthetic tool, and how the server is reached"""
+    tools: int = 20
+    latency: str = "fixed:0"
+    payload_bytes: int = 256
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    cpu_iterations: int = 0
+    seed: int = 0
+    http: Optional[str] = None
+    json_response: bool = False
+
+
+def parse_latency(spec: str, rng: random.Random) -> Callable[[], float]:
+    """
+    Build a latency sampler from a distribution spec
+
+    Args:
+        spec: 'fixed:S', 'lognormal:MEDIAN,SIGMA' or 'pareto:MINIMUM,ALPHA'
+        rng: Random source
+
+    Returns:
+        Function returning one latency in seconds
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    kind, _, values = spec.partition(":")
+    try:
+        params = [float(value) for value in values.split(",")] if values else []
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    if kind == "fixed" and len(params) == 1:
+        return lambda: params[0]
+    if kind == "lognormal" and len(params) == 2 and params[0] > 0:
+        mu, sigma = math.log(params[0]), params[1]
+        return lambda: rng.lognormvariate(mu, sigma)
+    if kind == "pareto" and len(params) == 2:
+        minimum, alpha = params
+        return lambda: minimum * rng.paretovariate(alpha)
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+
+def burn_cpu(iterations: int) -> str:
+    """Hash in a loop on the event loop thread, like a CPU-bound handler"""
+    digest = b"synthetic"
+    for _ in range(iterations):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+def make_payload(size: int, rng: random.Random) -> str:
+    """Text of roughly ``size`` bytes"""
+    alphabet = "abcdefghijklmnopqrstuvwxyz     "
+    return "".join(rng.choices(alphabet, k=max(0, size)))
+
+
+def build_server(config: SyntheticConfig):
+    """Create the synthetic mcp.server.Server with its tools registered"""
+    from mcp.server import Server
+    from mcp import types
+
+    rng = random.Random(config.seed)
+    sample_latency = parse_latency(config.latency, rng)
+    server = Server("synthetic-benchmark-server")
+    stats = {"calls": 0, "errors": 0, "hangs": 0}
+
+    tool_schema = {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Free-form input echoed in the result"},
+            "latency_ms": {"type": "number", "description": "Override the sampled latency"},
+            "payload_bytes": {"type": "integer", "description": "Override the result size"},
+            "cpu_iterations": {"type": "integer", "description": "Override the CPU work"},
+            "fail": {"type": "boolean", "description": "Force an error result"}
+        },
+        "required": []
+    }
+    tool_names = [f"synthetic_{i}" for i in range(config.tools)]
+
+    @server.list_tools()
+    async def list_tools() -> List[types.Tool]:
+        return [
+            types.Tool(name=name, description=f"Synthetic benchmark tool {name}", inputSchema=tool_schema)
+            for name in tool_names
+        ] + [
+            types.Tool(name="server_stats", description="Calls, errors and hangs so far",
+                       inputSchema={"type": "object", "properties": {}, "required": []})
+        ]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        if name == "server_stats":
+            return [types.TextContent(type="text", text=json.dumps(stats))]
+        if name not in tool_names:
+            raise ValueError(f"Unknown tool: {name}")
+
+        stats["calls"] += 1
+        if rng.random() < config.timeout_rate:
+            # Never answer; the client's timeout and cancellation take over
+            stats["hangs"] += 1
+            await asyncio.Event().wait()
+
+        latency = arguments.get("latency_ms")
+        await asyncio.sleep(latency / 1000 if latency is not None else sample_latency())
+
+        iterations = arguments.get("cpu_iterations", config.cpu_iterations)
+        digest = burn_cpu(iterations) if iterations else None
+
+        if arguments.get("fail") or rng.random() < config.error_rate:
+            stats["errors"] += 1
+            raise RuntimeError(f"Injected failure in {name}")
+
+        result = {
+            "tool": name,
+            "query": arguments.get("query"),
+            "digest": digest,
+            "payload": make_payload(arguments.get("payload_bytes", config.payload_bytes), rng)
+        }
+        return [types.TextContent(type="text", text=json.dumps(result))]
+
+    return server
+
+
+async def serve_http(server, address: str, json_response: bool = False):
+    """Serve over Streamable HTTP at http://ADDRESS/mcp/"""
+    import contextlib
+    import uvicorn
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    manager = StreamableHTTPSessionManager(app=server, json_response=json_response)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        async with manager.run():
+            yield
+
+    host, _, port = address.rpartition(":")
+    app = Starlette(routes=[Mount("/mcp", app=manager.handle_request)], lifespan=lifespan)
+    config = uvicorn.Config(app, host=host or "127.0.0.1", port=int(port), log_level="warning")
+    await uvicorn.Server(config).serve()
+
+
+async def main(config: SyntheticConfig):
+    """Run the synthetic server on stdio, or over HTTP with --http"""
+    server = build_server(config)
+    if config.http:
+        await serve_http(server, config.http, config.json_response)
+        return
+
+    from mcp.server.stdio import stdio_server
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, server.create_initialization_options())
+
+
+def parse_args() -> SyntheticConfig:
+    """Read the server configuration from the command line"""
+    parser = argparse.ArgumentParser(description="Synthetic MCP server for load and latency simulation")
+    parser.add_argument("--tools", type=int, default=20, help="Number of synthetic tools")
+    parser.add_argument("--latency", default="fixed:0",
+                        help="fixed:S, lognormal:MEDIAN,SIGMA or pareto:MINIMUM,ALPHA (seconds)")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Result text size")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability a call fails")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Probability a call never answers")
+    parser.add_argument("--cpu-iterations", type=int, default=0, help="SHA-256 rounds per call")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--http", metavar="HOST:PORT", help="Serve Streamable HTTP instead of stdio")
+    parser.add_argument("--json-response", action="store_true",
+                        help="With --http, answer with JSON bodies instead of SSE streams")
+    args = parser.parse_args()
+
+    config = SyntheticConfig(**vars(args))
+    parse_latency(config.latency, random.Random())
+    return config
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        pass
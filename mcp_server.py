@@ -316,12 +316,16 @@ class RealAutonomousMCPServer:
         external_servers = []
         
         try:
-            # Check if external integration is available
-            result = await self._connect_external_servers({"force_reconnect": False})
-            if result.get("success") and result.get("connected_servers", 0) > 0:
-                external_tools = result.get("sample_tools", [])
-                external_servers = result.get("server_list", [])
+            from autonomous_mcp.multi_server_manager import get_client_manager
+            
+            # Report what is connected; starting servers is connect_external_servers' job
+            manager = get_client_manager(exclude=[self.server.name])
+            if manager.connected_servers:
+                external_tools = list(manager.get_all_tools().keys())[:10]
+                external_servers = list(manager.connected_servers.keys())
                 self.external_integration_available = True
+        except ImportError:
+            logger.info("External integration components not available")
         except Exception as e:
             logger.warning(f"External tool discovery failed: {e}")
         
@@ -597,36 +601,45 @@ class RealAutonomousMCPServer:
         logger.info("Attempting to connect to external MCP servers...")
         
         try:
-            # Try to import and use the external client
-            sys.path.insert(0, 'autonomous_mcp')
-            from autonomous_mcp.real_mcp_client_new import get_mcp_client
+            from autonomous_mcp.multi_server_manager import get_client_manager
             
-            client = get_mcp_client()
+            # Never spawn this agent as one of its own external servers
+            manager = get_client_manager(exclude=[self.server.name])
             
-            # Check existing connections
-            if not force_reconnect and hasattr(client, 'connected_servers') and client.connected_servers:
-                connected_count = len(client.connected_servers)
-                all_tools = client.get_all_tools()
+            # Check existing connections; a fleet that failed is only retried on force_reconnect
+            if not force_reconnect and not server_filter and manager.startup_attempted:
+                connected_count = len(manager.connected_servers)
+                all_tools = manager.get_all_tools()
                 
                 return {
                     "success": True,
                     "connected_servers": connected_count,
                     "total_external_tools": len(all_tools),
-                    "server_list": list(client.connected_servers.keys()),
+                    "server_list": list(manager.connected_servers.keys()),
+                    "failed_servers": manager.failed_servers,
                     "sample_tools": list(all_tools.keys())[:10],
-                    "status": "Using existing connections",
+                    "status": "Using existing connections" if connected_count else "No external servers connected",
                     "integration_available": True
                 }
             
-            # Try new connection (async required)
-            logger.info("External integration available but requires async initialization")
+            if force_reconnect:
+                await manager.close_all()
+            
+            # Start every configured server concurrently under one deadline
+            await manager.start_all(server_filter=server_filter or None)
+            all_tools = manager.get_all_tools()
+            
             return {
                 "success": True,
-                "connected_servers": 0,
-                "status": "External integration framework available",
-                "note": "Run async initialization to connect to external servers",
-                "integration_available": True,
-                "framework_ready": True
+                "connected_servers": len(manager.connected_servers),
+                "total_external_tools": len(all_tools),
+                "server_list": list(manager.connected_servers.keys()),
+                "failed_servers": manager.failed_servers,
+                "sample_tools": list(all_tools.keys())[:10],
+                "startup_time": manager.startup_time,
+                "status": ("Connected to external servers" if manager.connected_servers
+                           else "No external servers connected"),
+                "integration_available": True
             }
             
         except ImportError:
@@ -0,0 +1,26 @@
+"""Shared fixtures: clients connected to the stub server"""
+
+import pytest
+
+from helpers import start_client
+
+
+@pytest.fixture
+async def connect():
+    """Factory for initialized clients to the stub server, closed after the test"""
+    clients = []
+
+    async def _connect(*flags, **options):
+        client = await start_client(*flags, **options)
+        clients.append(client)
+        return client
+
+    yield _connect
+    for client in clients:
+        await client.close()
+
+
+@pytest.fixture
+async def client(connect):
+    """An initialized client to a default stub server"""
+    return await connect()
@@ -0,0 +1,40 @@
+"""Helpers shared by the tests: stub server commands and tool call shortcuts"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autonomous_mcp.real_mcp_client import RealMCPClient  # noqa: E402
+
+
+STUB_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_mcp_server.py")
+
+SYNTHETIC_SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "benchmarks", "synthetic_mcp_server.py")
+
+
+def stub_command(*flags: str) -> List[str]:
+    """Command line starting the stub server with the given flags"""
+    return [sys.executable, STUB_SERVER, *flags]
+
+
+def synthetic_command(*flags: str) -> List[str]:
+    """Command line starting the synthetic benchmark server with the given flags"""
+    return [sys.executable, SYNTHETIC_SERVER, *flags]
+
+
+async def call_text(client: Any, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs: Any) -> str:
+    """Call a tool and return the text of its first content item"""
+    result = await client.call_tool(name, arguments or {}, **kwargs)
+    assert result is not None, f"{name} failed"
+    return result["content"][0]["text"]
+
+
+async def start_client(*flags: str, server_name: str = "stub", **options: Any) -> RealMCPClient:
+    """Connect and initialize a client to a stub server"""
+    client = RealMCPClient(server_name, **options)
+    assert await client.connect_stdio(stub_command(*flags))
+    assert await client.send_initialize()
+    return client
@@ -0,0 +1,239 @@
+"""
+Scripted MCP Server for Tests
+
+A dependency-free JSON-RPC stdio server whose behaviour the tests control
+through command-line flags and tool arguments. Unlike the synthetic
+benchmark server it writes raw frames, so tests can pin down message
+ordering, batches, partial writes and crashes exactly.
+
+Tools:
+    echo {...}                      result text is the JSON of the arguments
+    sleep {seconds}                 answers after a delay (other calls proceed)
+    fail                            answers with an internal error
+    crash                           exits at once without answering
+    stderr {lines, size}            writes lines to stderr, then answers
+    chunky {n, size, gap}           writes a large result in n pieces
+    touch {uri}                     bumps a resource version, notifying subscribers
+    notify_change                   sends notifications/tools/list_changed
+    stats                           counters: calls per tool, reads, cancelled IDs
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+
+INTERNAL_ERROR = -32603
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+
+
+class StubServer:
+    """Line-oriented JSON-RPC server over stdin/stdout"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.lock = threading.Lock()
+        self.versions = {}
+        self.subscriptions = set()
+        self.calls = {}
+        self.reads = 0
+        self.cancelled = []
+
+    def write(self, message):
+        with self.lock:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+    def result(self, message_id, result):
+        return {"jsonrpc": "2.0", "id": message_id, "result": result}
+
+    def error(self, message_id, code, text):
+        return {"jsonrpc": "2.0", "id": message_id, "error": {"code": code, "message": text}}
+
+    def text(self, message_id, value):
+        return self.result(message_id, {"content": [{"type": "text", "text": value}]})
+
+    def tools(self):
+        names = ["echo", "sleep", "fail", "crash", "stderr", "chunky", "touch", "notify_change", "stats"]
+        return [{"name": name, "description": f"Stub tool {name}", "inputSchema": {"type": "object"}}
+                for name in names]
+
+    def handle(self, message):
+        """Answer one request; returns the response or None when answered elsewhere"""
+        method = message.get("method")
+        message_id = message.get("id")
+        params = message.get("params") or {}
+
+        if message_id is None:
+            if method == "notifications/cancelled":
+                self.cancelled.append(params.get("requestId"))
+            return None
+
+        if method == "initialize":
+            return self.result(message_id, {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {"listChanged": True},
+                    "resources": {"subscribe": not self.args.no_subscribe, "listChanged": True},
+                    "prompts": {}
+                },
+                "serverInfo": {"name": "stub", "version": self.args.version}
+            })
+        if method == "ping":
+            if self.args.no_ping:
+                return self.error(message_id, METHOD_NOT_FOUND, "Method not found")
+            return self.result(message_id, {})
+        if method == "tools/list":
+            return self.page(message_id, params, "tools", self.tools(), self.args.tool_pages)
+        if method == "tools/call":
+            return self.call(message_id, params.get("name"), params.get("arguments") or {})
+        if method == "resources/list":
+            resources = [{"uri": f"doc://{index}", "name": f"doc{index}"} for index in range(6)]
+            return self.page(message_id, params, "resources", resources, 2)
+        if method == "resources/templates/list":
+            return self.result(message_id, {"resourceTemplates": [{"uriTemplate": "doc://{id}", "name": "doc"}]})
+        if method == "resources/read":
+            return self.read(message_id, params["uri"])
+        if method == "resources/subscribe":
+            self.subscriptions.add(params["uri"])
+            return self.result(message_id, {})
+        if method == "resources/unsubscribe":
+            self.subscriptions.discard(params["uri"])
+            return self.result(message_id, {})
+        if method == "prompts/list":
+            return self.result(message_id, {"prompts": [{"name": "greet", "arguments": [{"name": "who"}]}]})
+        if method == "prompts/get":
+            who = (params.get("arguments") or {}).get("who")
+            return self.result(message_id, {"messages": [
+                {"role": "user", "content": {"type": "text", "text": f"hello {who}"}}
+            ]})
+        return self.error(message_id, METHOD_NOT_FOUND, "Method not found")
+
+    def page(self, message_id, params, key, items, pages):
+        """Split a list result into pages addressed by a numeric cursor"""
+        page = int(params.get("cursor") or 0)
+        if page in self.args.fail_page:
+            return self.error(message_id, INTERNAL_ERROR, f"Page {page} failed")
+        size = -(-len(items) // pages)
+        result = {key: items[page * size:(page + 1) * size]}
+        if page + 1 < pages:
+            result["nextCursor"] = str(page + 1)
+        return self.result(message_id, result)
+
+    def read(self, message_id, uri):
+        self.reads += 1
+        version = self.versions.get(uri, 0)
+        response = self.result(message_id, {"contents": [{"uri": uri, "text": f"{uri} v{version}"}]})
+        if not self.args.update_after_read:
+            return response
+
+        # The content changes right after it was read: the notification
+        # follows the response in the same write
+        self.versions[uri] = version + 1
+        with self.lock:
+            sys.stdout.write(json.dumps(response) + "\n" + json.dumps({
+                "jsonrpc": "2.0", "method": "notifications/resources/updated", "params": {"uri": uri}
+            }) + "\n")
+            sys.stdout.flush()
+        return None
+
+    def call(self, message_id, name, arguments):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+        if name == "echo":
+            return self.text(message_id, json.dumps(arguments, sort_keys=True))
+        if name == "sleep":
+            def answer():
+                time.sleep(arguments.get("seconds", 0.1))
+                self.write(self.text(message_id, json.dumps(arguments, sort_keys=True)))
+            threading.Thread(target=answer, daemon=True).start()
+            return None
+        if name == "fail":
+            return self.error(message_id, INTERNAL_ERROR, "Internal error")
+        if name == "crash":
+            os._exit(3)
+        if name == "stderr":
+            for index in range(arguments.get("lines", 1)):
+                sys.stderr.write(f"line {index} " + "e" * arguments.get("size", 0) + "\n")
+            sys.stderr.flush()
+            return self.text(message_id, "logged")
+        if name == "chunky":
+            threading.Thread(target=self.chunky, args=(message_id, arguments), daemon=True).start()
+            return None
+        if name == "touch":
+            uri = arguments["uri"]
+            self.versions[uri] = self.versions.get(uri, 0) + 1
+            if uri in self.subscriptions:
+                self.write({"jsonrpc": "2.0", "method": "notifications/resources/updated", "params": {"uri": uri}})
+            return self.text(message_id, str(self.versions[uri]))
+        if name == "notify_change":
+            self.write({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+            return self.text(message_id, "changed")
+        if name == "stats":
+            return self.text(message_id, json.dumps({
+                "calls": self.calls, "reads": self.reads, "cancelled": self.cancelled
+            }))
+        return self.error(message_id, METHOD_NOT_FOUND, f"Unknown tool: {name}")
+
+    def chunky(self, message_id, arguments):
+        """Write one response as several pieces with pauses in between"""
+        with self.lock:
+            sys.stdout.write('{"jsonrpc":"2.0","id":%s,"result":{"content":[' % json.dumps(message_id))
+            sys.stdout.flush()
+            for index in range(arguments.get("n", 3)):
+                item = {"type": "text", "text": f"{index}:" + "x" * arguments.get("size", 10)}
+                sys.stdout.write(("," if index else "") + json.dumps(item))
+                sys.stdout.flush()
+                time.sleep(arguments.get("gap", 0.05))
+            sys.stdout.write('],"isError":false}}\n')
+            sys.stdout.flush()
+
+    def handle_batch(self, batch):
+        if self.args.no_batch:
+            self.write(self.error(None, INVALID_REQUEST, "Batches not supported"))
+            return
+        responses = [response for response in (self.handle(item) for item in batch) if response is not None]
+        if responses:
+            self.write(responses)
+
+    def serve(self):
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            message = json.loads(line)
+            if isinstance(message, list):
+                self.handle_batch(message)
+                continue
+            response = self.handle(message)
+            if response is not None:
+                self.write(response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scripted MCP stdio server for tests")
+    parser.add_argument("--version", default="1.0", help="serverInfo version")
+    parser.add_argument("--no-batch", action="store_true", help="Reject JSON-RPC batches")
+    parser.add_argument("--no-ping", action="store_true", help="Answer ping with method not found")
+    parser.add_argument("--no-subscribe", action="store_true", help="Do not offer resource subscriptions")
+    parser.add_argument("--update-after-read", action="store_true",
+                        help="Change a resource right after each read and notify in the same write")
+    parser.add_argument("--tool-pages", type=int, default=1, help="Pages tools/list is split into")
+    parser.add_argument("--fail-page", type=int, action="append", default=[], help="List page that errors")
+    parser.add_argument("--startup-delay", type=float, default=0.0, help="Seconds before serving")
+    parser.add_argument("--ignore-term", action="store_true", help="Ignore SIGTERM")
+    args = parser.parse_args()
+
+    if args.ignore_term:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    time.sleep(args.startup_delay)
+    StubServer(args).serve()
+
+
+if __name__ == "__main__":
+    main()
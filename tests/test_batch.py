@@ -0,0 +1,64 @@
+"""JSON-RPC batches and the batch support probe"""
+
+import json
+
+from helpers import call_text
+
+
+def echo_requests(count):
+    return [("tools/call", {"name": "echo", "arguments": {"n": index}}) for index in range(count)]
+
+
+def texts(responses):
+    return [json.loads(response["result"]["content"][0]["text"])["n"] for response in responses]
+
+
+async def test_batch_is_probed_and_used(client):
+    responses = await client.send_batch(echo_requests(5))
+    assert texts(responses) == list(range(5))
+    assert client._batch_supported is True
+
+
+async def test_batch_is_split_into_window_sized_arrays(connect):
+    client = await connect(max_in_flight=2, batch_requests=True)
+    responses = await client.send_batch(echo_requests(5))
+    assert texts(responses) == list(range(5))
+    assert client.get_pipeline_stats()["peak_in_flight"] == 2
+
+
+async def test_server_without_batches_gets_single_requests(connect):
+    client = await connect("--no-batch")
+    responses = await client.send_batch(echo_requests(3))
+    assert texts(responses) == [0, 1, 2]
+    assert client._batch_supported is False
+
+    # The rejected probe does not disturb later requests
+    assert await call_text(client, "echo", {"n": 9}) == '{"n": 9}'
+
+
+async def test_failed_requests_are_answered_in_place(connect):
+    client = await connect(batch_requests=True)
+    responses = await client.send_batch([
+        ("tools/call", {"name": "echo", "arguments": {"n": 0}}),
+        ("tools/call", {"name": "fail", "arguments": {}}),
+        ("no/such/method", {}),
+    ])
+    assert texts(responses[:1]) == [0]
+    assert responses[1]["error"]["code"] == -32603
+    assert responses[2]["error"]["code"] == -32601
+
+
+async def test_missing_responses_time_out_as_none(connect):
+    client = await connect(batch_requests=True)
+    responses = await client.send_batch([
+        ("tools/call", {"name": "echo", "arguments": {"n": 0}}),
+        ("tools/call", {"name": "sleep", "arguments": {"seconds": 1.0}}),
+    ], timeout=0.3)
+    # The sleep is answered on its own, after the batch deadline
+    assert texts(responses[:1]) == [0]
+    assert responses[1] is None
+    assert client.get_pipeline_stats()["in_flight"] == 0
+
+
+async def test_empty_batch(client):
+    assert await client.send_batch([]) == []
@@ -0,0 +1,62 @@
+"""Cancellation propagation with notifications/cancelled"""
+
+import asyncio
+import json
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+
+from helpers import call_text, stub_command
+
+
+async def cancelled_ids(client):
+    await asyncio.sleep(0.05)
+    return json.loads(await call_text(client, "stats"))["cancelled"]
+
+
+async def test_timeout_notifies_server(client):
+    assert await client.call_tool("sleep", {"seconds": 1}, timeout=0.1) is None
+    assert len(await cancelled_ids(client)) == 1
+    assert client.get_pending_requests() == {}
+
+
+async def test_explicit_cancel_completes_caller_with_none(client):
+    call = asyncio.create_task(client.call_tool("sleep", {"seconds": 1}))
+    await asyncio.sleep(0.1)
+    (request_id,) = client.get_pending_requests()
+    assert await client.cancel(request_id)
+    assert await call is None
+    assert await cancelled_ids(client) == [request_id]
+    assert not await client.cancel(request_id)
+
+
+async def test_cancelled_caller_task_notifies_server(client):
+    call = asyncio.create_task(client.call_tool("sleep", {"seconds": 1}))
+    await asyncio.sleep(0.1)
+    call.cancel()
+    await asyncio.gather(call, return_exceptions=True)
+    assert len(await cancelled_ids(client)) == 1
+
+
+async def test_late_response_is_dropped(client):
+    assert await client.call_tool("sleep", {"seconds": 0.2}, timeout=0.05) is None
+    await asyncio.sleep(0.3)
+    # The late answer must not be matched to anything else
+    assert await call_text(client, "echo", {"a": 1}) == '{"a": 1}'
+
+
+async def test_initialize_is_never_cancelled():
+    client = RealMCPClient("slow", request_timeout=0.2)
+    try:
+        assert await client.connect_stdio(stub_command("--startup-delay", "0.5"))
+        assert not await client.send_initialize()
+        await asyncio.sleep(0.5)
+        response = await client.send_request("tools/call", {"name": "stats", "arguments": {}}, timeout=5)
+        assert json.loads(response["result"]["content"][0]["text"])["cancelled"] == []
+    finally:
+        await client.close()
+
+
+async def test_close_reaps_pending_notifications(client):
+    await client.call_tool("sleep", {"seconds": 1}, timeout=0.05)
+    await client.close()
+    assert not client._background_tasks
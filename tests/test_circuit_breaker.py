@@ -0,0 +1,138 @@
+"""Circuit breaker transitions and how the client feeds it"""
+
+import asyncio
+import time
+
+from autonomous_mcp.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+
+from helpers import call_text
+
+
+def make_breaker(**overrides):
+    config = dict(window=10.0, min_calls=4, failure_rate=0.5, timeout_rate=0.3,
+                  open_duration=0.1, half_open_probes=2)
+    config.update(overrides)
+    return CircuitBreaker("stub", CircuitBreakerConfig(**config))
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.config.min_calls):
+        breaker.record_failure(ticket=breaker.allow())
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_failure_rate_opens_only_after_min_calls():
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(ticket=breaker.allow())
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure(ticket=breaker.allow())
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow() is None
+    assert breaker.get_state()["rejected"] == 1
+
+
+def test_timeout_rate_opens_below_failure_rate():
+    breaker = make_breaker()
+    for _ in range(6):
+        breaker.record_success(breaker.allow())
+    for _ in range(3):
+        breaker.record_failure(timeout=True, ticket=breaker.allow())
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_probes_close_the_circuit():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(0.15)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    probes = [breaker.allow(), breaker.allow()]
+    assert all(probe.probe for probe in probes)
+    assert breaker.allow() is None
+
+    breaker.record_success(probes[0])
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.record_success(probes[1])
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(0.15)
+
+    breaker.record_failure(ticket=breaker.allow())
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.get_state()["times_opened"] == 2
+
+
+def test_released_probe_frees_its_slot():
+    breaker = make_breaker(half_open_probes=1)
+    open_breaker(breaker)
+    time.sleep(0.15)
+
+    breaker.release(breaker.allow())
+    assert breaker.is_available
+
+
+def test_calls_admitted_before_opening_do_not_decide_half_open():
+    breaker = make_breaker(half_open_probes=1)
+    straggler = breaker.allow()
+    open_breaker(breaker)
+    time.sleep(0.15)
+
+    probe = breaker.allow()
+    # A call from the closed period finishing now is neither a probe success...
+    breaker.record_success(straggler)
+    assert breaker.state is CircuitState.HALF_OPEN
+    # ...nor a probe failure
+    breaker.record_failure(timeout=True, ticket=straggler)
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.record_success(probe)
+    assert breaker.state is CircuitState.CLOSED
+
+
+async def test_failing_tool_opens_the_client_circuit(connect):
+    breaker = make_breaker(open_duration=60.0)
+    client = await connect(circuit_breaker=breaker)
+
+    for _ in range(4):
+        assert await client.call_tool("fail", {}) is None
+    assert breaker.state is CircuitState.OPEN
+
+    assert await client.call_tool("echo", {}) is None
+    assert breaker.get_state()["rejected"] == 1
+
+
+async def test_ping_and_health_checks_bypass_the_circuit(connect):
+    breaker = make_breaker(open_duration=60.0)
+    client = await connect(circuit_breaker=breaker)
+
+    for _ in range(10):
+        assert await client.send_request("ping") is not None
+    assert breaker.get_state()["calls_in_window"] == 0
+
+    open_breaker(breaker)
+    assert await client.health_check()
+    assert await client.send_request("ping") is not None
+    assert breaker.get_state()["rejected"] == 0
+
+
+async def test_half_open_follows_the_probe_not_an_older_call(connect):
+    breaker = make_breaker(open_duration=0.2, half_open_probes=1)
+    client = await connect(circuit_breaker=breaker)
+
+    straggler = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.6}))
+    await asyncio.sleep(0.05)
+    open_breaker(breaker)
+    await asyncio.sleep(0.25)
+
+    probe = asyncio.create_task(client.call_tool("sleep", {"seconds": 0.6}))
+    await straggler
+    # The straggler answered first, but the circuit waits for its probe
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert await probe is not None
+    assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,42 @@
+"""Byte-level JSON codecs"""
+
+import pytest
+
+from autonomous_mcp.codec import StdlibJSONCodec, available_codecs, get_codec
+
+from helpers import call_text
+
+
+CODECS = list(available_codecs())
+
+MESSAGE = {"jsonrpc": "2.0", "id": 7, "result": {"content": [{"type": "text", "text": "zürich ✓ \"q\""}],
+                                                  "isError": False, "n": [1, 2.5, None]}}
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_round_trip(name):
+    codec = get_codec(name)
+    line = codec.encode_line(MESSAGE)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert codec.decode(line) == MESSAGE
+    assert StdlibJSONCodec().decode(codec.encode(MESSAGE)) == MESSAGE
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_invalid_json_raises_value_error(name):
+    with pytest.raises(ValueError):
+        get_codec(name).decode(b'{"jsonrpc": ')
+
+
+def test_selection():
+    assert get_codec("json").name == "json"
+    assert get_codec().name == CODECS[0]
+    assert get_codec("auto").name == CODECS[0]
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", CODECS)
+async def test_client_speaks_every_codec(connect, name):
+    client = await connect(codec=get_codec(name))
+    assert await call_text(client, "echo", {"city": "zürich"}) == '{"city": "z\\u00fcrich"}'
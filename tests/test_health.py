@@ -0,0 +1,63 @@
+"""Health probes: ping, the tools/list fallback and background checks"""
+
+import asyncio
+
+from helpers import call_text
+
+
+async def test_ping_probe(client):
+    assert not client.is_healthy
+    assert await client.health_check()
+
+    health = client.health
+    assert client.is_healthy
+    assert health.method == "ping" and health.latency is not None
+    assert health.consecutive_failures == 0 and health.error is None
+
+
+async def test_servers_without_ping_are_probed_with_tools_list(connect):
+    client = await connect("--no-ping")
+    assert await client.health_check()
+    assert client.health.method == "tools/list"
+    assert client._ping_supported is False
+
+    assert await client.health_check()
+    assert client.health.method == "tools/list"
+
+
+async def test_dead_server_is_unhealthy(client):
+    await client.health_check()
+    await client.call_tool("crash", {})
+    for _ in range(100):
+        if not client.is_connected:
+            break
+        await asyncio.sleep(0.01)
+
+    # Losing the connection is itself recorded as a failed check
+    assert client.health.consecutive_failures == 1
+    assert not await client.health_check()
+    assert client.health.consecutive_failures == 2
+    assert client.health.error == "not connected"
+    assert not client.is_healthy
+
+
+async def test_probe_is_answered_while_a_tool_runs(client):
+    slow = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.5}))
+    await asyncio.sleep(0.05)
+    assert await client.health_check(timeout=0.2)
+    await slow
+
+
+async def test_background_checks_refresh_the_status(client):
+    client.start_health_checks(interval=0.05, jitter=0.2, timeout=1.0)
+    for _ in range(100):
+        if client.health.checked_at is not None:
+            break
+        await asyncio.sleep(0.01)
+    first = client.health.checked_at
+    assert first is not None
+
+    await asyncio.sleep(0.2)
+    assert client.health.checked_at > first
+    client.stop_health_checks()
+    assert client._health_task is None
@@ -0,0 +1,120 @@
+"""Streamable HTTP transport against the synthetic server's --http mode"""
+
+import asyncio
+import json
+import socket
+import subprocess
+import time
+
+import pytest
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+
+from helpers import call_text, synthetic_command
+
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("httpx_sse")
+pytest.importorskip("uvicorn")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module", params=["sse", "json"])
+def server_url(request):
+    """URL of a synthetic server answering with SSE streams or JSON bodies"""
+    port = free_port()
+    flags = ["--http", f"127.0.0.1:{port}", "--tools", "2", "--latency", "fixed:0.2"]
+    if request.param == "json":
+        flags.append("--json-response")
+    process = subprocess.Popen(synthetic_command(*flags))
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                assert process.poll() is None and time.monotonic() < deadline, "server did not start"
+                time.sleep(0.05)
+        yield f"http://127.0.0.1:{port}/mcp/"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.fixture
+async def connect_http(server_url):
+    """Factory for initialized HTTP clients, closed after the test"""
+    clients = []
+
+    async def _connect(**options):
+        client = RealMCPClient("http", **options)
+        clients.append(client)
+        assert await client.connect_http(server_url)
+        assert await client.send_initialize()
+        return client
+
+    yield _connect
+    for client in clients:
+        await client.close()
+
+
+async def test_handshake_opens_a_session(connect_http):
+    client = await connect_http()
+    assert client.transport == "http"
+    assert client._http.session_id
+    assert client._http.protocol_version == client.server_info["protocolVersion"]
+    assert [tool["name"] for tool in await client.list_tools()] == ["synthetic_0", "synthetic_1", "server_stats"]
+
+
+async def test_concurrent_calls_share_the_connection_pool(connect_http):
+    client = await connect_http()
+    started = time.monotonic()
+    results = await asyncio.gather(*[call_text(client, "synthetic_0", {"query": str(i)}) for i in range(5)])
+    assert time.monotonic() - started < 0.8
+    assert [json.loads(result)["query"] for result in results] == [str(i) for i in range(5)]
+
+
+async def test_timeout_fails_only_that_request(connect_http):
+    client = await connect_http()
+    assert await client.call_tool("synthetic_1", {"latency_ms": 2000}, timeout=0.2) is None
+    assert client.is_connected
+    assert await client.health_check()
+
+
+async def test_expired_session_is_reopened(connect_http, server_url):
+    client = await connect_http(auto_reconnect=True, reconnect_backoff=0.05)
+    expired = client._http.session_id
+    async with httpx.AsyncClient() as http:
+        response = await http.delete(server_url, headers={"mcp-session-id": expired})
+    assert response.status_code == 200
+
+    assert await client.list_tools()
+    assert client.reconnect_count == 1
+    assert client._http.session_id not in (None, expired)
+
+
+async def test_close_ends_the_session(connect_http, server_url):
+    client = await connect_http()
+    session_id = client._http.session_id
+    await client.close()
+    assert not client.is_connected
+
+    async with httpx.AsyncClient() as http:
+        response = await http.post(
+            server_url, headers={"mcp-session-id": session_id, "Accept": "application/json, text/event-stream"},
+            json={"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        )
+    assert response.status_code == 404
+
+
+async def test_unreachable_server_fails_the_handshake():
+    client = RealMCPClient("http")
+    assert await client.connect_http(f"http://127.0.0.1:{free_port()}/mcp/")
+    assert not await client.send_initialize()
+    await client.close()
@@ -0,0 +1,68 @@
+"""Latency tracking and adaptive timeouts"""
+
+from autonomous_mcp.latency import LatencyTracker, TimeoutPolicy
+
+from helpers import call_text
+
+
+def test_no_timeout_until_min_samples():
+    tracker = LatencyTracker(TimeoutPolicy(min_samples=3, factor=2.0, floor=0.0))
+    for _ in range(2):
+        tracker.record("stub", "tools/call", "echo", 0.5)
+    assert tracker.timeout_for("stub", "tools/call", "echo") is None
+
+    tracker.record("stub", "tools/call", "echo", 0.5)
+    assert tracker.timeout_for("stub", "tools/call", "echo") == 1.0
+    # Keys are per server, method and tool
+    assert tracker.timeout_for("stub", "tools/call", "other") is None
+    assert tracker.timeout_for("other", "tools/call", "echo") is None
+
+
+def test_timeout_follows_the_percentile_within_bounds():
+    tracker = LatencyTracker(TimeoutPolicy(percentile=0.9, factor=2.0, floor=0.5, ceiling=10.0, min_samples=10))
+    for seconds in [0.1] * 9 + [1.0]:
+        tracker.record("stub", "ping", None, seconds)
+    assert tracker.timeout_for("stub", "ping") == 0.5
+
+    tracker.record("stub", "ping", None, 1.0)
+    assert tracker.timeout_for("stub", "ping") == 2.0
+
+    for _ in range(10):
+        tracker.record("stub", "ping", None, 20.0)
+    assert tracker.timeout_for("stub", "ping") == 10.0
+
+
+def test_timeouts_raise_the_estimate():
+    tracker = LatencyTracker(TimeoutPolicy(percentile=0.5, factor=1.0, floor=0.0, min_samples=4, window=4))
+    for _ in range(4):
+        tracker.record("stub", "tools/call", "slow", 1.0)
+    for _ in range(3):
+        tracker.record_timeout("stub", "tools/call", "slow", 3.0)
+
+    assert tracker.timeout_for("stub", "tools/call", "slow") == 3.0
+    stats = tracker.get_stats()["stub/tools/call/slow"]
+    assert stats["timeouts"] == 3 and stats["total_requests"] == 7 and stats["samples"] == 4
+
+
+async def test_client_adapts_per_tool(connect):
+    tracker = LatencyTracker(TimeoutPolicy(min_samples=5, factor=3.0, floor=0.05, ceiling=5.0))
+    client = await connect(latency_tracker=tracker, request_timeout=30.0)
+    assert client.get_timeout("tools/call", "echo") == 30.0
+
+    for _ in range(5):
+        await call_text(client, "echo")
+        await call_text(client, "sleep", {"seconds": 0.2})
+
+    assert client.get_timeout("tools/call", "echo") < 1.0
+    assert 0.6 <= client.get_timeout("tools/call", "sleep") <= 5.0
+    assert client.get_timeout("tools/list") == 30.0
+
+
+async def test_client_records_timeouts(connect):
+    tracker = LatencyTracker(TimeoutPolicy(min_samples=1, factor=1.0, floor=0.0))
+    client = await connect(latency_tracker=tracker)
+
+    assert await client.call_tool("sleep", {"seconds": 1.0}, timeout=0.1) is None
+    stats = tracker.get_stats()["stub/tools/call/sleep"]
+    assert stats["timeouts"] == 1
+    assert client.get_timeout("tools/call", "sleep") == 0.1
@@ -0,0 +1,83 @@
+"""Lazy proxy: start on first call, catalogue without a process, idle reap, failed starts"""
+
+import asyncio
+import json
+
+import pytest
+
+from autonomous_mcp.lazy_client import LazyMCPClient
+from autonomous_mcp.tool_catalog_cache import ToolCatalogCache
+
+from helpers import call_text, stub_command
+
+
+@pytest.fixture
+async def make_proxy(tmp_path):
+    proxies = []
+
+    def _make(*flags, **options):
+        options.setdefault("catalog_cache", ToolCatalogCache(cache_dir=tmp_path))
+        proxy = LazyMCPClient("stub", stub_command(*flags), **options)
+        proxies.append(proxy)
+        return proxy
+
+    yield _make
+    for proxy in proxies:
+        await proxy.close()
+
+
+async def test_first_call_starts_the_server(make_proxy):
+    proxy = make_proxy()
+    assert proxy.is_connected and not proxy.is_running
+
+    assert await call_text(proxy, "echo", {"a": 1}) == '{"a": 1}'
+    assert proxy.is_running
+    assert proxy.get_stats()["starts"] == 1
+
+
+async def test_cached_catalogue_is_served_without_starting(make_proxy):
+    first = make_proxy()
+    tools = await first.list_tools()
+    assert first.is_running
+    await first.close()
+
+    second = make_proxy()
+    assert await second.list_tools() == tools
+    assert not second.is_running
+    assert second.get_stats()["catalog_hits"] == 1
+
+
+async def test_idle_server_is_reaped_and_restarted(make_proxy):
+    proxy = make_proxy(idle_ttl=0.2)
+    await call_text(proxy, "echo")
+    await asyncio.sleep(0.6)
+    assert not proxy.is_running
+    assert proxy.get_stats()["reaped"] == 1
+
+    # The restarted process starts with fresh counters
+    stats = json.loads(await call_text(proxy, "stats"))
+    assert stats["calls"] == {"stats": 1}
+    assert proxy.get_stats()["starts"] == 2
+
+
+async def test_call_in_flight_keeps_the_server(make_proxy):
+    proxy = make_proxy(idle_ttl=0.2)
+    await call_text(proxy, "sleep", {"seconds": 0.6})
+    assert proxy.is_running
+    assert proxy.get_stats()["reaped"] == 0
+
+
+async def test_failed_start_backs_off(make_proxy):
+    proxy = make_proxy("--no-such-flag", start_backoff=0.3)
+
+    assert await proxy.call_tool("echo", {}) is None
+    assert not proxy.is_connected
+    assert await proxy.call_tool("echo", {}) is None
+    assert proxy.get_stats()["start_failures"] == 1
+
+    await asyncio.sleep(0.35)
+    assert proxy.is_connected
+    assert await proxy.call_tool("echo", {}) is None
+    assert proxy.get_stats()["start_failures"] == 2
+    # The second failure doubles the wait
+    assert proxy.get_stats()["retry_in"] > 0.4
@@ -0,0 +1,115 @@
+"""Concurrent startup, namespaced tool index and routing across servers"""
+
+import sys
+import time
+
+import pytest
+
+from autonomous_mcp.multi_server_manager import MultiServerClientManager, load_server_configs
+from autonomous_mcp.tool_catalog_cache import ToolCatalogCache
+
+from helpers import STUB_SERVER, call_text
+
+
+def stub_entry(*flags, **extra):
+    return {"command": sys.executable, "args": [STUB_SERVER, *flags], **extra}
+
+
+@pytest.fixture
+async def make_manager():
+    managers = []
+
+    def _make(configs, **options):
+        manager = MultiServerClientManager(configs, **options)
+        managers.append(manager)
+        return manager
+
+    yield _make
+    for manager in managers:
+        await manager.close_all()
+
+
+async def test_servers_start_concurrently(make_manager):
+    manager = make_manager({name: stub_entry("--startup-delay", "0.5") for name in ("a", "b", "c")})
+    started = time.monotonic()
+    assert await manager.start_all() == {"a": True, "b": True, "c": True}
+
+    assert time.monotonic() - started < 1.2
+    assert manager.startup_time is not None
+    assert "a.echo" in manager.get_all_tools() and "c.stats" in manager.get_all_tools()
+
+
+async def test_failures_and_deadline_are_recorded(make_manager):
+    manager = make_manager({
+        "ok": stub_entry(),
+        "slow": stub_entry("--startup-delay", "5"),
+        "broken": {"command": "/nonexistent/mcp-server"},
+        "empty": {},
+        "off": stub_entry(disabled=True),
+    }, startup_timeout=1.0)
+
+    result = await manager.start_all()
+    assert result == {"ok": True, "slow": False, "broken": False}
+    assert manager.failed_servers["slow"] == "Startup deadline exceeded"
+    assert "broken" in manager.failed_servers and "empty" in manager.failed_servers
+    assert "off" not in manager.failed_servers
+
+
+async def test_filter_and_exclude(make_manager):
+    manager = make_manager({name: stub_entry() for name in ("a", "b", "self")}, exclude=["self"])
+    assert await manager.start_all(server_filter=["a", "self"]) == {"a": True}
+    assert list(manager.connected_servers) == ["a"]
+
+
+async def test_calls_route_by_namespaced_name(make_manager):
+    manager = make_manager({"a": stub_entry(), "b": stub_entry("--version", "2.0")})
+    await manager.start_all()
+
+    assert await call_text(manager, "b.echo", {"x": 1}) == '{"x": 1}'
+    assert manager.resolve_tool("a.echo") == ("a", "echo")
+    # Both servers offer echo, so the bare name is ambiguous
+    assert manager.resolve_tool("echo") is None
+    assert await manager.call_tool("echo", {}) is None
+    assert await manager.call_tool("nope.echo", {}) is None
+
+
+async def test_close_all_stops_every_server(make_manager):
+    manager = make_manager({"a": stub_entry(), "b": stub_entry()})
+    await manager.start_all()
+    processes = [client.process for client in manager.connected_servers.values()]
+
+    await manager.close_all()
+    assert all(process.returncode is not None for process in processes)
+    assert manager.get_all_tools() == {} and manager.connected_servers == {}
+
+
+async def test_lazy_servers_start_on_first_call(make_manager, tmp_path):
+    configs = {"a": stub_entry(), "b": stub_entry()}
+    warm = make_manager(configs, lazy=True, catalog_cache=ToolCatalogCache(cache_dir=tmp_path))
+    await warm.start_all()
+    await warm.close_all()
+
+    # With the catalogue cached nothing is spawned until a tool is called
+    manager = make_manager(configs, lazy=True, catalog_cache=ToolCatalogCache(cache_dir=tmp_path))
+    await manager.start_all()
+    assert len(manager.get_all_tools()) == 18
+    assert not any(proxy.is_running for proxy in manager.connected_servers.values())
+
+    assert await call_text(manager, "b.echo", {"x": 1}) == '{"x": 1}'
+    assert manager.connected_servers["b"].is_running
+    assert not manager.connected_servers["a"].is_running
+
+
+async def test_lazy_server_that_cannot_start_is_unavailable(make_manager, tmp_path):
+    manager = make_manager({"a": stub_entry(), "broken": {"command": "/nonexistent/mcp-server"}},
+                           lazy=True, catalog_cache=ToolCatalogCache(cache_dir=tmp_path))
+    await manager.start_all()
+    assert list(manager.connected_servers) == ["a"]
+    assert not manager.is_available("broken")
+
+
+def test_config_file_is_read(tmp_path):
+    path = tmp_path / "claude_desktop_config.json"
+    path.write_text('{"mcpServers": {"docs": {"command": "docs-server"}}}')
+    assert load_server_configs(path) == {"docs": {"command": "docs-server"}}
+    assert load_server_configs(tmp_path / "missing.json") == {}
@@ -0,0 +1,81 @@
+"""Pipelined requests and the bounded in-flight window"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from autonomous_mcp.real_mcp_client import RequestWindow
+
+from helpers import call_text
+
+
+async def test_requests_overlap_and_match_out_of_order(client):
+    started = time.monotonic()
+    results = await asyncio.gather(*[
+        call_text(client, "sleep", {"seconds": seconds}) for seconds in (0.4, 0.2, 0.3)
+    ])
+    assert time.monotonic() - started < 0.8
+    assert [json.loads(result)["seconds"] for result in results] == [0.4, 0.2, 0.3]
+
+
+async def test_window_caps_requests_in_flight(connect):
+    client = await connect(max_in_flight=2)
+    started = time.monotonic()
+    await asyncio.gather(*[call_text(client, "sleep", {"seconds": 0.2}) for _ in range(4)])
+
+    assert time.monotonic() - started >= 0.4
+    stats = client.get_pipeline_stats()
+    assert stats["peak_in_flight"] == 2
+    assert stats["peak_queue_depth"] == 2
+    assert stats["in_flight"] == 0 and stats["pending_responses"] == 0
+
+
+async def test_timeout_includes_time_queued(connect):
+    client = await connect(max_in_flight=1)
+    slow = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.5}))
+    await asyncio.sleep(0.05)
+
+    assert await client.send_request("ping", timeout=0.2) is None
+    assert client.outstanding_requests == 1
+    await slow
+    assert client.outstanding_requests == 0
+
+
+async def test_window_admits_in_arrival_order():
+    window = RequestWindow(max_in_flight=1)
+    order = []
+
+    async def take(label):
+        await window.acquire()
+        order.append(label)
+
+    await window.acquire()
+    waiters = [asyncio.create_task(take(label)) for label in "abc"]
+    await asyncio.sleep(0)
+    assert window.queue_depth == 3
+    for _ in range(3):
+        window.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*waiters)
+    assert order == ["a", "b", "c"]
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    window = RequestWindow(max_in_flight=1)
+    await window.acquire()
+    waiter = asyncio.create_task(window.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert window.queue_depth == 0
+    window.release()
+    assert window.in_flight == 0
+
+
+def test_window_must_hold_a_request():
+    with pytest.raises(ValueError):
+        RequestWindow(max_in_flight=0)
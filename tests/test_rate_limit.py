@@ -0,0 +1,95 @@
+"""Token buckets, concurrency caps and client admission"""
+
+import asyncio
+import time
+
+import pytest
+
+from autonomous_mcp.rate_limit import AdmissionController, RateLimit, RateLimitExceeded, TokenBucket
+
+
+async def test_bucket_spends_burst_then_paces():
+    bucket = TokenBucket(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(4):
+        assert await bucket.acquire()
+    # Two tokens from the burst, two more at 20/s
+    assert 0.08 <= time.monotonic() - started < 0.3
+
+
+async def test_bucket_refuses_a_token_past_the_deadline():
+    bucket = TokenBucket(rate=1, burst=1)
+    assert await bucket.acquire()
+    assert not await bucket.acquire(deadline=time.monotonic() + 0.1)
+    assert bucket.available() < 0.2
+
+
+async def test_rejection_refunds_tokens_of_earlier_limiters():
+    admission = AdmissionController(
+        server_limits={"s": RateLimit(rate=1, burst=5)},
+        tool_limits={"slow": RateLimit(rate=1, burst=1)}
+    )
+    async with admission.admit("s", "tools/call", "slow"):
+        pass
+    before = admission.get_stats()["s"]["available_tokens"]
+
+    for _ in range(3):
+        with pytest.raises(RateLimitExceeded):
+            async with admission.admit("s", "tools/call", "slow", deadline=time.monotonic() + 0.05):
+                pass
+    # The server bucket was charged first and must get its tokens back
+    assert admission.get_stats()["s"]["available_tokens"] >= before
+    assert admission.get_stats()["s.slow"]["rejected"] == 3
+
+
+async def test_concurrency_cap_and_deadline():
+    admission = AdmissionController(server_limits={"s": RateLimit(max_concurrency=1)})
+    async with admission.admit("s", "tools/call", "a"):
+        with pytest.raises(RateLimitExceeded):
+            async with admission.admit("s", "tools/call", "b", deadline=time.monotonic() + 0.05):
+                pass
+    async with admission.admit("s", "tools/call", "b", deadline=time.monotonic() + 0.05):
+        pass
+    assert admission.get_stats()["s"]["in_flight"] == 0
+
+
+async def test_initialize_and_ping_are_never_limited():
+    admission = AdmissionController(default_server_limit=RateLimit(max_concurrency=1))
+    async with admission.admit("s", "tools/call", "a"):
+        async with admission.admit("s", "ping"):
+            pass
+    assert admission.get_stats()["s"]["admitted"] == 1
+
+
+async def test_client_requests_queue_for_admission(connect):
+    admission = AdmissionController(server_limits={"stub": RateLimit(max_concurrency=1)})
+    client = await connect(admission=admission)
+
+    started = time.monotonic()
+    results = await asyncio.gather(*[client.call_tool("sleep", {"seconds": 0.2, "n": n}) for n in range(3)])
+    assert all(results)
+    assert time.monotonic() - started >= 0.55
+
+
+async def test_client_request_not_admitted_in_time(connect):
+    admission = AdmissionController(server_limits={"stub": RateLimit(max_concurrency=1)})
+    client = await connect(admission=admission)
+
+    slow = asyncio.create_task(client.call_tool("sleep", {"seconds": 0.5}))
+    await asyncio.sleep(0.05)
+    assert await client.call_tool("echo", {}, timeout=0.1) is None
+    assert await slow is not None
+
+
+async def test_streamed_calls_are_admitted(connect):
+    admission = AdmissionController(server_limits={"stub": RateLimit(max_concurrency=1)})
+    client = await connect(admission=admission, streaming=True)
+
+    async def stream():
+        return [item async for item in client.call_tool_stream("chunky", {"n": 3, "gap": 0.1})]
+
+    started = time.monotonic()
+    results = await asyncio.gather(*[stream() for _ in range(3)])
+    assert [len(items) for items in results] == [3, 3, 3]
+    assert time.monotonic() - started >= 0.85
+    assert admission.get_stats()["stub"]["admitted"] >= 3
@@ -0,0 +1,63 @@
+"""Crash detection, reconnect and replay of in-flight requests"""
+
+import asyncio
+import json
+import time
+
+from helpers import call_text
+
+
+async def test_crash_fails_in_flight_requests_at_once(connect):
+    client = await connect(request_timeout=10.0)
+    slow = asyncio.create_task(client.call_tool("sleep", {"seconds": 5}))
+    await asyncio.sleep(0.05)
+
+    started = time.monotonic()
+    await client.call_tool("crash", {})
+    assert await slow is None
+    assert time.monotonic() - started < 2.0
+    assert not client.is_connected
+
+
+async def test_crashed_server_is_respawned(connect):
+    client = await connect(auto_reconnect=True, reconnect_backoff=0.05)
+    tools = await client.list_tools()
+
+    assert await client.call_tool("crash", {}) is None
+    # Calls made while the server restarts wait for it
+    assert await call_text(client, "echo", {"after": "crash"}) == '{"after": "crash"}'
+    assert client.reconnect_count == 1
+    assert client.is_initialized
+    assert await client.list_tools() == tools
+
+
+async def test_idempotent_requests_are_replayed(connect):
+    client = await connect(auto_reconnect=True, reconnect_backoff=0.05, idempotent_tools=["sleep"])
+    replayed = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.3}))
+    listed = asyncio.create_task(client.list_prompts())
+    await asyncio.sleep(0.05)
+
+    await client.call_tool("crash", {})
+    assert json.loads(await replayed) == {"seconds": 0.3}
+    assert [prompt["name"] for prompt in await listed] == ["greet"]
+
+
+async def test_other_requests_are_not_replayed(connect):
+    client = await connect(auto_reconnect=True, reconnect_backoff=0.05)
+    dropped = asyncio.create_task(client.call_tool("sleep", {"seconds": 0.3}))
+    await asyncio.sleep(0.05)
+
+    await client.call_tool("crash", {})
+    assert await dropped is None
+
+    # The new process never saw the sleep
+    stats = json.loads(await call_text(client, "stats"))
+    assert stats["calls"] == {"stats": 1}
+
+
+async def test_without_auto_reconnect_the_client_stays_down(client):
+    await client.call_tool("crash", {})
+    await asyncio.sleep(0.1)
+    assert await client.call_tool("echo", {}) is None
+    assert client.reconnect_count == 0
+    assert client.get_pipeline_stats()["pending_responses"] == 0
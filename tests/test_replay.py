@@ -0,0 +1,61 @@
+"""Session recording and offline replay"""
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+from autonomous_mcp.replay import Recording, SessionRecorder, replay_command
+
+from helpers import call_text
+
+
+async def record_session(connect, path):
+    recorder = SessionRecorder(path, "stub")
+    client = await connect(recorder=recorder)
+    await client.list_tools()
+    await call_text(client, "echo", {"n": 1})
+    await call_text(client, "echo", {"n": 2})
+    await client.close()
+    recorder.close()
+    return recorder
+
+
+async def test_recording_holds_every_answered_exchange(connect, tmp_path):
+    recorder = await record_session(connect, tmp_path / "session.jsonl.gz")
+
+    recording = Recording.load(tmp_path / "session.jsonl.gz")
+    assert recording.header["server"] == "stub"
+    assert [exchange["method"] for exchange in recording.exchanges] == [
+        "initialize", "tools/list", "tools/call", "tools/call"
+    ]
+    assert recorder.exchanges == 4
+    assert recording.duration > 0
+
+
+async def test_unanswered_requests_are_not_kept(connect, tmp_path):
+    recorder = SessionRecorder(tmp_path / "session.jsonl", "stub")
+    client = await connect(recorder=recorder)
+
+    assert await client.call_tool("sleep", {"seconds": 1}, timeout=0.1) is None
+    assert recorder._pending == {}
+
+    await call_text(client, "echo")
+    assert recorder._pending == {}
+    recorder.close()
+    assert [exchange["method"] for exchange in Recording.load(recorder.path).exchanges] == [
+        "initialize", "tools/call"
+    ]
+
+
+async def test_replay_serves_recorded_responses(connect, tmp_path):
+    path = tmp_path / "session.jsonl"
+    await record_session(connect, path)
+
+    client = RealMCPClient("replay")
+    try:
+        assert await client.connect_stdio(replay_command(path, speed=None))
+        assert await client.send_initialize()
+        assert [tool["name"] for tool in await client.list_tools()][:2] == ["echo", "sleep"]
+        assert await call_text(client, "echo", {"n": 2}) == '{"n": 2}'
+        # Arguments that were never recorded get an error
+        assert await client.call_tool("echo", {"n": 3}) is None
+        assert await client.health_check()
+    finally:
+        await client.close()
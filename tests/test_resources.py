@@ -0,0 +1,86 @@
+"""Resources, prompts and the resource content cache"""
+
+import asyncio
+import json
+
+from autonomous_mcp.resource_cache import ResourceCache
+
+from helpers import call_text
+
+
+async def server_reads(client) -> int:
+    return json.loads(await call_text(client, "stats"))["reads"]
+
+
+async def test_lists_follow_every_page(client):
+    resources = await client.list_resources()
+    assert [resource["uri"] for resource in resources] == [f"doc://{index}" for index in range(6)]
+    assert len(await client.list_resource_templates()) == 1
+    assert [prompt["name"] for prompt in await client.list_prompts()] == ["greet"]
+
+
+async def test_get_prompt(client):
+    prompt = await client.get_prompt("greet", {"who": "bob"})
+    assert prompt["messages"][0]["content"]["text"] == "hello bob"
+
+
+async def test_repeated_reads_are_served_from_cache(connect):
+    cache = ResourceCache()
+    client = await connect(resource_cache=cache)
+
+    for _ in range(20):
+        result = await client.read_resource("doc://1")
+    assert result["contents"][0]["text"] == "doc://1 v0"
+    assert await server_reads(client) == 1
+    assert "doc://1" in client._subscriptions
+
+
+async def test_update_notification_invalidates(connect):
+    cache = ResourceCache()
+    client = await connect(resource_cache=cache)
+
+    await client.read_resource("doc://1")
+    await call_text(client, "touch", {"uri": "doc://1"})
+    result = await client.read_resource("doc://1")
+    assert result["contents"][0]["text"] == "doc://1 v1"
+    assert await server_reads(client) == 2
+
+
+async def test_update_right_behind_read_is_not_lost(connect):
+    # The notification is handled before read_resource resumes; the stale
+    # contents must not be cached with nothing left to invalidate them
+    cache = ResourceCache()
+    client = await connect("--update-after-read", resource_cache=cache)
+
+    first = await client.read_resource("doc://1")
+    assert first["contents"][0]["text"] == "doc://1 v0"
+    await asyncio.sleep(0.05)
+    second = await client.read_resource("doc://1")
+    assert second["contents"][0]["text"] == "doc://1 v1"
+    assert cache.get_stats()['stores'] == 0
+
+
+async def test_without_subscriptions_only_ttl_caches(connect):
+    client = await connect("--no-subscribe", resource_cache=ResourceCache())
+    await client.read_resource("doc://1")
+    await client.read_resource("doc://1")
+    assert await server_reads(client) == 2
+
+    ttl_client = await connect("--no-subscribe", resource_cache=ResourceCache(ttl=0.2))
+    await ttl_client.read_resource("doc://1")
+    await ttl_client.read_resource("doc://1")
+    assert await server_reads(ttl_client) == 1
+    await asyncio.sleep(0.25)
+    await ttl_client.read_resource("doc://1")
+    assert await server_reads(ttl_client) == 2
+
+
+def test_cache_bounds():
+    cache = ResourceCache(max_entries=2)
+    for index in range(3):
+        cache.put("s", f"doc://{index}", {"contents": [{"text": str(index)}]})
+    assert cache.get("s", "doc://0") is None
+    assert cache.get("s", "doc://2") is not None
+
+    small = ResourceCache(max_bytes=10)
+    assert not small.put("s", "doc://big", {"contents": [{"text": "x" * 100}]})
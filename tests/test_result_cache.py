@@ -0,0 +1,126 @@
+"""Tool result cache: TTL, LRU bounds, invalidation and persistence"""
+
+import json
+import os
+import time
+
+from autonomous_mcp.result_cache import ToolResultCache
+
+from helpers import call_text
+
+
+def text_result(text):
+    return {"content": [{"type": "text", "text": text}]}
+
+
+def test_only_tools_with_a_ttl_are_cached():
+    cache = ToolResultCache(ttls={"search": 60, "docs.read": 60}, default_ttl=None)
+    assert cache.put("web", "search", {"q": "a"}, text_result("a"))
+    assert cache.put("docs", "read", {}, text_result("r"))
+    assert not cache.put("web", "read", {}, text_result("r"))
+    assert not cache.put("web", "search", {"q": "b"}, {"isError": True, "content": []})
+    assert cache.get("web", "search", {"q": "a"}) == text_result("a")
+    assert cache.get("web", "search", {"q": "b"}) is None
+
+
+def test_entries_expire():
+    cache = ToolResultCache(default_ttl=0.05)
+    cache.put("web", "search", {}, text_result("a"))
+    time.sleep(0.1)
+    assert cache.get("web", "search", {}) is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ToolResultCache(default_ttl=60, max_entries=2)
+    cache.put("web", "search", {"q": 1}, text_result("1"))
+    cache.put("web", "search", {"q": 2}, text_result("2"))
+    cache.get("web", "search", {"q": 1})
+    cache.put("web", "search", {"q": 3}, text_result("3"))
+
+    assert cache.get("web", "search", {"q": 2}) is None
+    assert cache.get("web", "search", {"q": 1}) is not None
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_invalidate_by_server_keeps_other_servers(tmp_path):
+    cache = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    cache.put("web", "search", {"q": 1}, text_result("w1"))
+    cache.put("web", "fetch", {}, text_result("w2"))
+    cache.put("docs", "search", {"q": 1}, text_result("d"))
+
+    cache.invalidate(server="web")
+    assert cache.get("web", "search", {"q": 1}) is None
+    assert cache.get("web", "fetch", {}) is None
+    assert cache.get("docs", "search", {"q": 1}) == text_result("d")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # Nothing of "web" comes back from disk either
+    reopened = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    assert reopened.get("web", "search", {"q": 1}) is None
+    assert reopened.get("docs", "search", {"q": 1}) == text_result("d")
+
+
+def test_invalidate_by_tool(tmp_path):
+    cache = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    cache.put("web", "search", {"q": 1}, text_result("1"))
+    cache.put("web", "search", {"q": 2}, text_result("2"))
+    cache.put("web", "fetch", {}, text_result("f"))
+
+    cache.invalidate(server="web", tool="search")
+    assert cache.get("web", "search", {"q": 2}) is None
+    assert cache.get("web", "fetch", {}) == text_result("f")
+
+
+def test_entries_survive_a_restart(tmp_path):
+    ToolResultCache(default_ttl=60, persist_dir=tmp_path).put("web", "search", {"q": 1}, text_result("1"))
+
+    reopened = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    assert reopened.get("web", "search", {"q": 1}) == text_result("1")
+    assert reopened.get_stats()["disk_hits"] == 1
+
+
+def test_unreadable_file_is_a_miss_and_removed(tmp_path):
+    cache = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    cache.put("web", "search", {"q": 1}, text_result("1"))
+    path = next(tmp_path.glob("*.json"))
+
+    # Old format: valid JSON without the expected fields
+    path.write_text(json.dumps({"result": text_result("1")}))
+    reopened = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    assert reopened.get("web", "search", {"q": 1}) is None
+    assert not path.exists()
+
+    # Truncated write
+    cache.put("web", "search", {"q": 2}, text_result("2"))
+    path = next(tmp_path.glob("*.json"))
+    path.write_bytes(path.read_bytes()[:20])
+    assert ToolResultCache(default_ttl=60, persist_dir=tmp_path).get("web", "search", {"q": 2}) is None
+    assert not path.exists()
+
+
+def test_startup_sweeps_expired_and_surplus_files(tmp_path):
+    cache = ToolResultCache(default_ttl=60, persist_dir=tmp_path)
+    for index in range(4):
+        cache.put("web", "search", {"q": index}, text_result(str(index)))
+        path = tmp_path / f"{cache.make_key('web', 'search', {'q': index})}.json"
+        os.utime(path, (index, index))
+    ToolResultCache(default_ttl=0.01, persist_dir=tmp_path).put("web", "old", {}, text_result("old"))
+    (tmp_path / "0123456789abcdef.json").write_text("{}")
+    time.sleep(0.05)
+
+    ToolResultCache(default_ttl=60, max_entries=2, persist_dir=tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{cache.make_key('web', 'search', {'q': index})}.json" for index in (2, 3)
+    )
+
+
+async def test_client_answers_repeated_calls_from_cache(connect):
+    client = await connect(result_cache=ToolResultCache(ttls={"echo": 60}))
+
+    for _ in range(5):
+        assert await call_text(client, "echo", {"q": "x"}) == '{"q": "x"}'
+    await call_text(client, "echo", {"q": "y"})
+
+    stats = json.loads(await call_text(client, "stats"))
+    assert stats["calls"]["echo"] == 2
@@ -0,0 +1,90 @@
+"""Multi-process server pool"""
+
+import asyncio
+import time
+
+import pytest
+
+from autonomous_mcp.rate_limit import AdmissionController, RateLimit
+from autonomous_mcp.server_pool import MCPServerPool
+
+from helpers import call_text, stub_command
+
+
+@pytest.fixture
+async def make_pool():
+    pools = []
+
+    async def _make_pool(**options):
+        pool = MCPServerPool("search", stub_command(), **options)
+        pools.append(pool)
+        assert await pool.start()
+        return pool
+
+    yield _make_pool
+    for pool in pools:
+        await pool.close()
+
+
+async def test_starts_min_workers_and_shares_tool_list(make_pool):
+    pool = await make_pool(min_workers=2, max_workers=2)
+    assert len(pool.workers) == 2
+    assert "echo" in [tool["name"] for tool in await pool.list_tools()]
+    assert all(worker._tools_cache is pool._tools_cache for worker in pool.workers)
+
+
+async def test_calls_spread_over_workers(make_pool):
+    pool = await make_pool(min_workers=2, max_workers=2)
+    started = time.monotonic()
+    await asyncio.gather(*[pool.call_tool("sleep", {"seconds": 0.3, "n": n}) for n in range(4)])
+    # Two workers answer concurrently anyway; routing must not pile onto one
+    assert time.monotonic() - started < 1.2
+    assert sorted(pool.get_pool_stats()['outstanding_requests']) == ["search#1", "search#2"]
+
+
+async def test_workers_carry_the_pool_server_name(make_pool):
+    admission = AdmissionController(server_limits={"search": RateLimit(max_concurrency=1)})
+    pool = await make_pool(min_workers=3, max_workers=3, admission=admission)
+    assert {worker.server_name for worker in pool.workers} == {"search"}
+
+    started = time.monotonic()
+    await asyncio.gather(*[pool.call_tool("sleep", {"seconds": 0.3, "n": n}) for n in range(3)])
+    # One concurrency slot for the whole pool serialises the calls
+    assert time.monotonic() - started >= 0.85
+    assert admission.get_stats()["search"]["admitted"] >= 3
+
+
+async def test_dead_worker_is_skipped_and_replaced(make_pool):
+    pool = await make_pool(min_workers=2, max_workers=2)
+    pool.workers[0].process.kill()
+    await asyncio.sleep(0.3)
+
+    results = await asyncio.gather(*[pool.call_tool("echo", {"n": n}) for n in range(10)])
+    assert all(result is not None for result in results)
+    for _ in range(5):
+        assert await call_text(pool, "echo", {"n": 1}) == '{"n": 1}'
+
+    for _ in range(50):
+        if len(pool.workers) == 2 and all(worker.is_connected for worker in pool.workers):
+            break
+        await asyncio.sleep(0.1)
+    assert len(pool.workers) == 2
+    assert all(worker.is_connected for worker in pool.workers)
+
+
+async def test_scale_to_clamps_to_bounds(make_pool):
+    pool = await make_pool(min_workers=1, max_workers=3)
+    await pool.scale_to(5)
+    assert len(pool.workers) == 3
+    await pool.scale_to(0)
+    assert len(pool.workers) == 1
+
+
+async def test_idle_surplus_workers_are_reaped(make_pool):
+    pool = await make_pool(min_workers=1, max_workers=2, idle_timeout=0.5)
+    await pool.scale_to(2)
+    for _ in range(40):
+        if len(pool.workers) == 1:
+            break
+        await asyncio.sleep(0.1)
+    assert len(pool.workers) == 1
@@ -0,0 +1,61 @@
+"""Process shutdown: SIGTERM, the kill deadline and bulk close"""
+
+import asyncio
+import signal
+import time
+
+from autonomous_mcp.circuit_breaker import CircuitBreaker
+from autonomous_mcp.real_mcp_client import close_clients
+
+from helpers import start_client
+
+
+async def test_close_terminates_the_server(client):
+    process = client.process
+    started = time.monotonic()
+    await client.close()
+
+    assert time.monotonic() - started < 1.0
+    assert process.returncode == -signal.SIGTERM
+    assert client.process is None and not client.is_connected
+
+
+async def test_server_ignoring_sigterm_is_killed_at_the_deadline(connect):
+    client = await connect("--ignore-term")
+    process = client.process
+    started = time.monotonic()
+    await client.close(timeout=0.3)
+
+    assert 0.3 <= time.monotonic() - started < 1.5
+    assert process.returncode == -signal.SIGKILL
+
+
+async def test_close_completes_callers_in_flight(connect):
+    breaker = CircuitBreaker("stub")
+    client = await connect(circuit_breaker=breaker)
+    call = asyncio.create_task(client.call_tool("sleep", {"seconds": 5}))
+    await asyncio.sleep(0.05)
+    await client.close()
+
+    assert await call is None
+    # Closing is not a server failure
+    assert breaker.get_state()["calls_in_window"] == 0
+
+
+async def test_close_twice(client):
+    await client.close()
+    await client.close()
+    assert not client.is_connected
+
+
+async def test_bulk_close_shares_one_deadline():
+    clients = await asyncio.gather(*[start_client("--ignore-term", server_name=f"stub-{i}") for i in range(4)])
+    clients.append(await start_client())
+    processes = [client.process for client in clients]
+
+    started = time.monotonic()
+    await close_clients(clients, timeout=0.4)
+
+    # Four stubborn servers cost one deadline, not four
+    assert time.monotonic() - started < 1.2
+    assert [process.returncode for process in processes] == [-signal.SIGKILL] * 4 + [-signal.SIGTERM]
@@ -0,0 +1,85 @@
+"""Coalescing of concurrent identical tool calls"""
+
+import asyncio
+import json
+
+from autonomous_mcp.single_flight import SingleFlight, canonical_arguments
+
+from helpers import call_text
+
+
+async def server_stats(client):
+    return json.loads(await call_text(client, "stats"))
+
+
+def test_canonical_arguments_ignore_key_order():
+    assert canonical_arguments({"b": 1, "a": [1, 2]}) == canonical_arguments({"a": [1, 2], "b": 1})
+    assert canonical_arguments(None) == canonical_arguments({})
+
+
+def test_applies_to():
+    flight = SingleFlight(tools=["sleep", "other.echo"], disabled=["stub.fail"], default_enabled=False)
+    assert flight.applies_to("stub", "sleep")
+    assert not flight.applies_to("stub", "echo")
+    assert flight.applies_to("other", "echo")
+
+    everything = SingleFlight(disabled=["stub.fail"], default_enabled=True)
+    assert everything.applies_to("stub", "echo")
+    assert not everything.applies_to("stub", "fail")
+    everything.disable("echo")
+    assert not everything.applies_to("any", "echo")
+
+
+async def test_identical_calls_share_one_request(connect):
+    client = await connect(single_flight=SingleFlight(tools=["sleep"]))
+    results = await asyncio.gather(*[client.call_tool("sleep", {"seconds": 0.2}) for _ in range(5)])
+
+    assert all(result is results[0] for result in results)
+    assert (await server_stats(client))["calls"]["sleep"] == 1
+    stats = client.single_flight.get_stats()
+    assert stats["executed"] == 1 and stats["coalesced"] == 4 and stats["in_flight"] == 0
+
+
+async def test_different_arguments_and_other_tools_are_not_coalesced(connect):
+    client = await connect(single_flight=SingleFlight(tools=["sleep"]))
+    await asyncio.gather(
+        client.call_tool("sleep", {"seconds": 0.1}),
+        client.call_tool("sleep", {"seconds": 0.15}),
+        client.call_tool("echo", {"x": 1}),
+        client.call_tool("echo", {"x": 1}),
+    )
+    calls = (await server_stats(client))["calls"]
+    assert calls["sleep"] == 2 and calls["echo"] == 2
+
+
+async def test_cancelled_leader_does_not_cancel_the_shared_request(connect):
+    client = await connect(single_flight=SingleFlight(tools=["sleep"]))
+    leader = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.3}))
+    await asyncio.sleep(0.05)
+    follower = asyncio.create_task(call_text(client, "sleep", {"seconds": 0.3}))
+    await asyncio.sleep(0.05)
+
+    leader.cancel()
+    assert json.loads(await follower) == {"seconds": 0.3}
+    stats = await server_stats(client)
+    assert stats["calls"]["sleep"] == 1 and stats["cancelled"] == []
+
+
+async def test_request_is_cancelled_with_its_last_caller(connect):
+    client = await connect(single_flight=SingleFlight(tools=["sleep"]))
+    callers = [asyncio.create_task(client.call_tool("sleep", {"seconds": 1})) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    for _ in range(100):
+        stats = await server_stats(client)
+        if stats["cancelled"]:
+            break
+        await asyncio.sleep(0.01)
+    assert len(stats["cancelled"]) == 1
+    assert client.single_flight.in_flight == 0
+
+    # A later identical call starts a fresh request
+    assert json.loads(await call_text(client, "sleep", {"seconds": 0.01})) == {"seconds": 0.01}
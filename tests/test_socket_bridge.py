@@ -0,0 +1,101 @@
+"""Unix socket and TCP transports through the shared server bridge"""
+
+import asyncio
+import json
+
+import pytest
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+from autonomous_mcp.socket_bridge import SocketBridge
+
+from helpers import call_text, stub_command
+
+
+@pytest.fixture
+async def bridge(tmp_path):
+    bridge = SocketBridge(stub_command())
+    assert await bridge.start()
+    bridge.path = str(tmp_path / "mcp.sock")
+    await bridge.listen_unix(bridge.path)
+    await bridge.listen_tcp("127.0.0.1", 0)
+    yield bridge
+    await bridge.close()
+
+
+@pytest.fixture
+async def attach(bridge):
+    """Factory for initialized clients to the bridge, closed after the test"""
+    clients = []
+
+    async def _attach(transport="unix", **options):
+        client = RealMCPClient(f"worker-{len(clients)}", **options)
+        clients.append(client)
+        if transport == "unix":
+            assert await client.connect_unix(bridge.path)
+        else:
+            assert await client.connect_tcp("127.0.0.1", bridge.ports[0])
+        assert await client.send_initialize()
+        return client
+
+    yield _attach
+    for client in clients:
+        await client.close()
+
+
+@pytest.mark.parametrize("transport", ["unix", "tcp"])
+async def test_tool_calls_over_a_socket(attach, transport):
+    client = await attach(transport)
+    assert client.transport == transport
+    assert client.server_info["serverInfo"]["name"] == "stub"
+    assert await call_text(client, "echo", {"via": transport}) == json.dumps({"via": transport})
+    assert len(await client.list_tools()) == 9
+
+
+async def test_workers_share_one_server(bridge, attach):
+    first, second = await attach(), await attach("tcp")
+    results = await asyncio.gather(
+        call_text(first, "sleep", {"seconds": 0.2}),
+        call_text(second, "sleep", {"seconds": 0.2, "worker": 2}),
+    )
+    assert json.loads(results[1]) == {"seconds": 0.2, "worker": 2}
+
+    stats = json.loads(await call_text(first, "stats"))
+    assert stats["calls"]["sleep"] == 2
+    assert bridge.get_stats()["connections"] == 2
+
+
+async def test_notifications_reach_every_worker(attach):
+    first, second = await attach(), await attach()
+    received = []
+    second.add_notification_listener(received.append)
+
+    await call_text(first, "notify_change")
+    for _ in range(100):
+        if received:
+            break
+        await asyncio.sleep(0.01)
+    assert received[0]["method"] == "notifications/tools/list_changed"
+
+
+async def test_timeouts_cancel_the_server_request(attach):
+    client = await attach()
+    assert await client.call_tool("sleep", {"seconds": 1}, timeout=0.1) is None
+    await asyncio.sleep(0.1)
+    assert len(json.loads(await call_text(client, "stats"))["cancelled"]) == 1
+
+
+async def test_closed_bridge_is_noticed(bridge, attach):
+    client = await attach()
+    await bridge.close()
+    for _ in range(100):
+        if not client.is_connected:
+            break
+        await asyncio.sleep(0.01)
+    assert not client.is_connected
+    assert await client.call_tool("echo", {}) is None
+
+
+async def test_connect_to_missing_socket_fails(tmp_path):
+    client = RealMCPClient("worker")
+    assert not await client.connect_unix(str(tmp_path / "missing.sock"))
+    assert not client.is_connected
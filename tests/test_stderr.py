@@ -0,0 +1,63 @@
+"""Server stderr capture"""
+
+import asyncio
+import logging
+
+from autonomous_mcp.real_mcp_client import OutputRingBuffer
+
+from helpers import call_text
+
+
+async def wait_for_stderr(client, lines):
+    for _ in range(100):
+        if len(client.stderr_buffer.get_lines()) >= lines:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_ring_buffer_keeps_the_latest_lines():
+    buffer = OutputRingBuffer(max_bytes=10)
+    for line in (b"aaaa\n", b"bbbb\n", b"cccc\n"):
+        buffer.append(line)
+    assert buffer.get_lines() == ["bbbb", "cccc"]
+    assert buffer.dropped_bytes == 5
+
+    buffer.append(b"x" * 20 + b"\n")
+    assert buffer.get_lines() == ["x" * 9]
+
+
+async def test_stderr_is_captured_and_logged(connect, caplog):
+    client = await connect(stderr_log_level=logging.WARNING)
+    with caplog.at_level(logging.WARNING):
+        assert await call_text(client, "stderr", {"lines": 3}) == "logged"
+        await wait_for_stderr(client, 3)
+
+    assert client.get_stderr_tail(2) == "line 1 \nline 2 "
+    assert "[stub] line 0" in caplog.text
+
+
+async def test_flood_does_not_block_the_server(connect):
+    client = await connect(stderr_capture=4096)
+    assert await call_text(client, "stderr", {"lines": 2000, "size": 100}) == "logged"
+    assert await call_text(client, "echo") == "{}"
+    await wait_for_stderr(client, 30)
+    assert client.stderr_buffer._size <= 4096
+
+
+async def test_lines_over_the_read_limit_are_kept(connect):
+    client = await connect(read_limit=1024)
+    assert await call_text(client, "stderr", {"lines": 2, "size": 10000}) == "logged"
+    await wait_for_stderr(client, 2)
+    assert client.stderr_buffer.get_lines() == [f"line {index} " + "e" * 10000 for index in range(2)]
+
+    # The stream stays in step with the lines that follow
+    await call_text(client, "stderr", {"lines": 1})
+    await wait_for_stderr(client, 3)
+    assert client.get_stderr_tail(1) == "line 0 "
+
+
+async def test_overlong_line_keeps_its_end(connect):
+    client = await connect(read_limit=1024, stderr_capture=2048)
+    assert await call_text(client, "stderr", {"lines": 1, "size": 100000}) == "logged"
+    await wait_for_stderr(client, 1)
+    assert client.stderr_buffer.get_lines() == ["e" * 2047]
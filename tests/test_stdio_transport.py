@@ -0,0 +1,55 @@
+"""Stdio transport: handshake, large frames, read limit and shutdown"""
+
+import asyncio
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+
+from helpers import call_text, stub_command
+
+
+async def test_handshake_and_tool_list(client):
+    assert client.is_initialized
+    assert client.server_info["serverInfo"] == {"name": "stub", "version": "1.0"}
+    tools = await client.list_tools()
+    assert "echo" in [tool["name"] for tool in tools]
+
+
+async def test_frames_larger_than_the_asyncio_default_limit(client):
+    payload = "x" * (1024 * 1024)
+    assert await call_text(client, "echo", {"payload": payload}) == f'{{"payload": "{payload}"}}'
+
+
+async def test_frame_over_read_limit_drops_the_connection(connect):
+    client = await connect(read_limit=1024)
+    assert await client.call_tool("echo", {"payload": "x" * 4096}) is None
+    assert not client.is_connected
+
+
+async def test_failed_command_does_not_connect():
+    client = RealMCPClient("missing")
+    try:
+        assert not await client.connect_stdio(["/nonexistent/mcp-server"])
+        assert not client.is_connected
+    finally:
+        await client.close()
+
+
+async def test_close_terminates_the_server():
+    client = RealMCPClient("stub")
+    assert await client.connect_stdio(stub_command())
+    assert await client.send_initialize()
+    process = client.process
+
+    await client.close()
+    assert process.returncode is not None
+    assert not client.is_connected
+
+
+async def test_server_exit_is_noticed(client):
+    assert await client.call_tool("crash", {}) is None
+    for _ in range(100):
+        if not client.is_connected:
+            break
+        await asyncio.sleep(0.01)
+    assert not client.is_connected
+    assert await client.call_tool("echo", {}) is None
@@ -0,0 +1,87 @@
+"""Incremental response parsing and streamed tool results"""
+
+import json
+import time
+
+import pytest
+
+from autonomous_mcp.streaming import EVENT_ID, EVENT_INVALID, EVENT_ITEM, EVENT_MESSAGE, StreamingResponseParser
+
+
+ITEMS = [{"type": "text", "text": "a ] } [ { \" \\ ,"}, {"type": "text", "text": "b", "meta": {"x": [1, 2]}}]
+
+
+def frame(message):
+    return (json.dumps(message) + "\n").encode()
+
+
+def feed_bytewise(parser, data):
+    events = []
+    for index in range(len(data)):
+        events.extend(parser.feed(data[index:index + 1]))
+    return events
+
+
+@pytest.mark.parametrize("bytewise", [False, True])
+def test_content_items_are_emitted_before_the_frame_ends(bytewise):
+    data = frame({"jsonrpc": "2.0", "id": 3, "result": {"content": ITEMS, "isError": False}})
+    parser = StreamingResponseParser()
+    events = feed_bytewise(parser, data) if bytewise else parser.feed(data)
+
+    assert events[0] == (EVENT_ID, 3)
+    assert events[1:3] == [(EVENT_ITEM, ITEMS[0]), (EVENT_ITEM, ITEMS[1])]
+    kind, message = events[3]
+    assert kind == EVENT_MESSAGE and message["result"] == {"content": [], "isError": False}
+
+
+def test_items_arrive_with_the_bytes():
+    data = frame({"jsonrpc": "2.0", "id": "x", "result": {"content": ITEMS}})
+    split = data.index(b'{"type": "text", "text": "b"')
+    parser = StreamingResponseParser()
+
+    assert parser.feed(data[:split]) == [(EVENT_ID, "x"), (EVENT_ITEM, ITEMS[0])]
+    assert [kind for kind, _ in parser.feed(data[split:])] == [EVENT_ITEM, EVENT_MESSAGE]
+
+
+def test_id_after_result_and_other_messages():
+    parser = StreamingResponseParser()
+    late_id = b'{"jsonrpc":"2.0","result":{"content":[{"type":"text","text":"t"}]},"id":5}\n'
+    notification = frame({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+    error = frame({"jsonrpc": "2.0", "id": 6, "error": {"code": -32603, "message": "boom"}})
+
+    events = parser.feed(late_id + notification + error)
+    assert events[0] == (EVENT_ITEM, {"type": "text", "text": "t"})
+    assert (EVENT_ID, 5) in events
+    messages = [value for kind, value in events if kind == EVENT_MESSAGE]
+    assert messages[1]["method"] == "notifications/tools/list_changed"
+    assert messages[2]["error"]["message"] == "boom"
+
+
+def test_invalid_frame_does_not_stop_the_parser():
+    parser = StreamingResponseParser()
+    events = parser.feed(b'{"id": 1, oops}\n' + frame({"jsonrpc": "2.0", "id": 2, "result": {}}))
+    assert [kind for kind, _ in events].count(EVENT_INVALID) == 1
+    assert events[-1] == (EVENT_MESSAGE, {"jsonrpc": "2.0", "id": 2, "result": {}})
+
+
+async def test_stream_yields_items_as_they_arrive(connect):
+    client = await connect(streaming=True)
+    started = time.monotonic()
+    arrivals = []
+    async for item in client.call_tool_stream("chunky", {"n": 4, "size": 1000, "gap": 0.15}):
+        arrivals.append((time.monotonic() - started, item["text"][:2]))
+
+    assert [label for _, label in arrivals] == ["0:", "1:", "2:", "3:"]
+    assert arrivals[0][0] < arrivals[-1][0] - 0.3
+
+
+async def test_ordinary_calls_get_the_whole_content_back(connect):
+    client = await connect(streaming=True)
+    result = await client.call_tool("chunky", {"n": 3, "size": 200000, "gap": 0.01})
+    assert [item["text"][:2] for item in result["content"]] == ["0:", "1:", "2:"]
+    assert len(result["content"][2]["text"]) == 200002
+
+
+async def test_stream_without_streaming_yields_after_the_response(client):
+    items = [item async for item in client.call_tool_stream("chunky", {"n": 2, "gap": 0.01})]
+    assert [item["text"][:2] for item in items] == ["0:", "1:"]
@@ -0,0 +1,74 @@
+"""Synthetic benchmark server: latency specs and tool behaviour over stdio"""
+
+import json
+import random
+import time
+
+import pytest
+
+from autonomous_mcp.real_mcp_client import RealMCPClient
+
+from helpers import call_text, synthetic_command
+
+from benchmarks.synthetic_mcp_server import parse_latency
+
+
+@pytest.fixture
+async def synthetic():
+    """Factory for initialized clients to synthetic servers, closed after the test"""
+    pytest.importorskip("mcp")
+    clients = []
+
+    async def _start(*flags, **options):
+        client = RealMCPClient("synthetic", **options)
+        clients.append(client)
+        assert await client.connect_stdio(synthetic_command(*flags))
+        assert await client.send_initialize()
+        return client
+
+    yield _start
+    for client in clients:
+        await client.close()
+
+
+def test_latency_specs():
+    rng = random.Random(1)
+    assert parse_latency("fixed:0.5", rng)() == 0.5
+    assert parse_latency("lognormal:0.1,0.5", rng)() > 0
+    assert all(parse_latency("pareto:0.01,1.5", rng)() >= 0.01 for _ in range(100))
+
+    for spec in ["fixed", "fixed:a", "lognormal:0,1", "pareto:1", "uniform:1,2"]:
+        with pytest.raises(ValueError):
+            parse_latency(spec, rng)
+
+
+async def test_tools_and_latency(synthetic):
+    client = await synthetic("--tools", "3", "--latency", "fixed:0.2", "--payload-bytes", "10")
+    assert [tool["name"] for tool in await client.list_tools()] == [
+        "synthetic_0", "synthetic_1", "synthetic_2", "server_stats"
+    ]
+
+    started = time.monotonic()
+    result = json.loads(await call_text(client, "synthetic_1", {"query": "q"}))
+    assert time.monotonic() - started >= 0.2
+    assert result["tool"] == "synthetic_1" and result["query"] == "q"
+    assert len(result["payload"]) == 10
+
+
+async def test_per_call_overrides(synthetic):
+    client = await synthetic("--tools", "1", "--latency", "fixed:5")
+    started = time.monotonic()
+    result = json.loads(await call_text(client, "synthetic_0",
+                                        {"latency_ms": 0, "payload_bytes": 3, "cpu_iterations": 2}))
+    assert time.monotonic() - started < 2.0
+    assert len(result["payload"]) == 3 and len(result["digest"]) == 64
+
+    failed = await client.call_tool("synthetic_0", {"latency_ms": 0, "fail": True})
+    assert failed["isError"]
+    assert json.loads(await call_text(client, "server_stats")) == {"calls": 2, "errors": 1, "hangs": 0}
+
+
+async def test_hanging_calls_time_out(synthetic):
+    client = await synthetic("--tools", "1", "--timeout-rate", "1")
+    assert await client.call_tool("synthetic_0", {}, timeout=0.2) is None
+    assert json.loads(await call_text(client, "server_stats"))["hangs"] == 1
@@ -0,0 +1,85 @@
+"""Tool catalogue: paging, the persistent cache and list_changed"""
+
+import asyncio
+
+from autonomous_mcp.tool_catalog_cache import ToolCatalogCache, server_version
+
+from helpers import call_text, stub_command
+
+
+STUB_VERSION = "stub@1.0/2024-11-05"
+
+
+async def wait_for(predicate):
+    for _ in range(200):
+        if predicate():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+def test_cache_round_trip(tmp_path):
+    cache = ToolCatalogCache(cache_dir=tmp_path)
+    cache.put(["server"], "s@1/p", [{"name": "a"}])
+
+    reopened = ToolCatalogCache(cache_dir=tmp_path)
+    assert reopened.get(["server"])["tools"] == [{"name": "a"}]
+    assert reopened.get(["server"], "s@1/p") is not None
+    assert reopened.get(["server"], "s@2/p") is None
+    assert reopened.get(["other"]) is None
+
+    reopened.invalidate(["server"])
+    assert ToolCatalogCache(cache_dir=tmp_path).get(["server"]) is None
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ToolCatalogCache(cache_dir=tmp_path)
+    (tmp_path / f"{cache.make_key(['server'])}.json").write_text("{not json")
+    assert cache.get(["server"]) is None
+
+
+def test_server_version_tag():
+    info = {"protocolVersion": "2024-11-05", "serverInfo": {"name": "stub", "version": "1.0"}}
+    assert server_version(info) == STUB_VERSION
+    assert server_version(None) == "@/"
+
+
+async def test_every_page_is_listed(connect):
+    client = await connect("--tool-pages", "3")
+    names = [tool["name"] for tool in await client.list_tools()]
+    assert names[0] == "echo" and names[-1] == "stats" and len(names) == 9
+
+
+async def test_failed_page_lists_nothing(connect):
+    client = await connect("--tool-pages", "3", "--fail-page", "1")
+    assert await client.list_tools() == []
+    assert client._tools_cache is None
+
+
+async def test_cached_catalogue_is_served_then_refreshed(connect, tmp_path):
+    cache = ToolCatalogCache(cache_dir=tmp_path)
+    cache.put(stub_command(), STUB_VERSION, [{"name": "stale"}])
+    client = await connect(catalog_cache=cache)
+
+    assert await client.list_tools() == [{"name": "stale"}]
+    assert await wait_for(lambda: client._tools_cache != [{"name": "stale"}])
+    assert "echo" in [tool["name"] for tool in cache.get(stub_command())["tools"]]
+
+
+async def test_other_server_version_is_not_served(connect, tmp_path):
+    cache = ToolCatalogCache(cache_dir=tmp_path)
+    cache.put(stub_command("--version", "2.0"), "stub@1.0/2024-11-05", [{"name": "stale"}])
+    client = await connect("--version", "2.0", catalog_cache=cache)
+
+    assert "echo" in [tool["name"] for tool in await client.list_tools()]
+
+
+async def test_list_changed_invalidates_and_refetches(connect, tmp_path):
+    cache = ToolCatalogCache(cache_dir=tmp_path)
+    client = await connect(catalog_cache=cache)
+    await client.list_tools()
+    client._tools_cache = [{"name": "outdated"}]
+
+    await call_text(client, "notify_change")
+    assert await wait_for(lambda: client._tools_cache not in (None, [{"name": "outdated"}]))
+    assert "echo" in [tool["name"] for tool in await client.list_tools()]
@@ -0,0 +1,95 @@
+"""Warm pool of pre-initialized server processes"""
+
+import asyncio
+import time
+
+import pytest
+
+from autonomous_mcp.warm_pool import WarmProcessPool
+
+from helpers import call_text, stub_command
+
+
+SLOW_START = stub_command("--startup-delay", "0.5")
+
+
+@pytest.fixture
+async def pool():
+    pool = WarmProcessPool(spares=1)
+    acquired = []
+    pool.acquired = acquired
+    yield pool
+    for client in acquired:
+        await client.close()
+    await pool.close()
+
+
+async def acquire(pool, name="tenant", command=SLOW_START):
+    client = await pool.acquire(name, command)
+    if client is not None:
+        pool.acquired.append(client)
+    return client
+
+
+async def wait_idle(pool, count=1):
+    for _ in range(300):
+        if pool.get_stats()["commands"].get(" ".join(SLOW_START), {}).get("idle") == count:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_prewarmed_spare_is_handed_out_at_once(pool):
+    await pool.prewarm(SLOW_START)
+    assert pool.get_stats()["commands"][" ".join(SLOW_START)] == {"idle": 1, "starting": 0}
+
+    started = time.monotonic()
+    client = await acquire(pool, "tenant-a")
+    assert time.monotonic() - started < 0.3
+    assert client.server_name == "tenant-a" and client.is_initialized
+    assert await call_text(client, "echo") == "{}"
+    assert pool.get_stats()["warm_hits"] == 1
+
+
+async def test_spares_are_replenished_after_acquire(pool):
+    await pool.prewarm(SLOW_START)
+    first = await acquire(pool)
+    await wait_idle(pool)
+
+    second = await acquire(pool)
+    assert second is not first
+    assert pool.get_stats()["warm_hits"] == 2
+    assert pool.get_stats()["spawned"] >= 2
+
+
+async def test_cold_start_without_a_spare(pool):
+    client = await acquire(pool, command=stub_command())
+    assert client is not None and client.is_initialized
+    assert pool.get_stats()["cold_starts"] == 1
+
+
+async def test_dead_spare_is_discarded(pool):
+    await pool.prewarm(SLOW_START)
+    spare = pool._idle[pool.make_key(SLOW_START)][0]
+    await spare.call_tool("crash", {})
+    await spare.process.wait()
+
+    client = await acquire(pool)
+    assert client is not spare and client.is_initialized
+    assert pool.get_stats()["discarded"] == 1
+
+
+async def test_failed_cold_start(pool):
+    assert await acquire(pool, command=["/nonexistent/mcp-server"]) is None
+    assert pool.get_stats()["spawn_failures"] >= 1
+
+
+async def test_close_stops_spares():
+    pool = WarmProcessPool(spares=2)
+    await pool.prewarm(SLOW_START)
+    processes = [spare.process for spare in pool._idle[pool.make_key(SLOW_START)]]
+    assert len(processes) == 2
+
+    await pool.close()
+    assert all(process.returncode is not None for process in processes)
+    with pytest.raises(RuntimeError):
+        await pool.acquire("late", SLOW_START)